@@ -15,6 +15,7 @@ Usage:
 """
 
 import argparse
+import heapq
 import json
 import sys
 from datetime import datetime, timezone
@@ -31,6 +32,18 @@ def get_store() -> CombStore:
     return CombStore(str(COMB_STORE))
 
 
+def search_many(store: CombStore, queries: list[str], k: int = 3) -> list[list]:
+    """BM25-search several queries at once, one result list per query.
+
+    Uses COMB's batched scorer when available (one pass over the index for
+    the whole query batch), otherwise falls back to per-query searches.
+    """
+    search_batch = getattr(store, "search_batch", None)
+    if search_batch is not None:
+        return search_batch(queries, k=k)
+    return [store.search(query, mode="bm25", k=k) for query in queries]
+
+
 def stage_text(text: str, metadata: dict = None):
     store = get_store()
     meta = metadata or {}
@@ -49,6 +62,18 @@ def rollup(date: str = None):
         print("ℹ️  Nothing to roll up")
 
 
+def _preview(doc, n: int) -> str:
+    """First n characters of a document's content.
+
+    Uses the store's prefix read when available so large rollups are not
+    loaded whole just to print a preview.
+    """
+    content_preview = getattr(doc, "content_preview", None)
+    if content_preview is not None:
+        return content_preview(n)
+    return doc.to_dict()["content"][:n]
+
+
 def search(query: str, k: int = 5):
     store = get_store()
     results = store.search(query, mode="bm25", k=k)
@@ -56,7 +81,7 @@ def search(query: str, k: int = 5):
         print("No results found.")
         return
     for i, doc in enumerate(results):
-        content = doc.to_dict()["content"]
+        content = _preview(doc, 501)
         preview = content[:500] + ("..." if len(content) > 500 else "")
         print(f"\n--- Result {i+1} ({doc.date}) ---")
         print(preview)
@@ -73,26 +98,20 @@ def recall():
         "important context remember",
     ]
 
-    seen = set()
-    all_results = []
-
-    for query in queries:
-        results = store.search(query, mode="bm25", k=3)
+    # Dates are unique per COMB entry, so they double as the dedup key
+    by_date = {}
+    for results in search_many(store, queries, k=3):
         for doc in results:
-            if doc.date not in seen:
-                seen.add(doc.date)
-                all_results.append(doc)
+            by_date.setdefault(doc.date, doc)
 
-    if not all_results:
+    if not by_date:
         print("Aria's COMB is empty — no memories yet.")
         return
 
-    all_results.sort(key=lambda d: d.date, reverse=True)
-
     print("=== ARIA OPERATIONAL RECALL ===\n")
-    for doc in all_results[:10]:
+    for doc in heapq.nlargest(10, by_date.values(), key=lambda d: d.date):
         print(f"--- {doc.date} ---")
-        print(doc.to_dict()["content"][:1000])
+        print(_preview(doc, 1000))
         print()
 
 
@@ -19,6 +19,30 @@ from pathlib import Path
 import httpx
 from aiohttp import web
 
+try:
+    import orjson
+except ImportError:  # optional speedup — stdlib json works everywhere
+    orjson = None
+
+if orjson is not None:
+    _loads = orjson.loads
+    _dumps = orjson.dumps
+else:
+    _loads = json.loads
+
+    def _dumps(obj) -> bytes:
+        return json.dumps(obj).encode()
+
+try:
+    import h2  # noqa: F401 — httpx only speaks HTTP/2 when h2 is installed
+    HTTP2 = True
+except ImportError:
+    HTTP2 = False
+
+# Pre-encoded SSE framing for proxy-generated events
+_SSE_DATA_PREFIX = b"data: "
+_SSE_SUFFIX = b"\n\n"
+
 COPILOT_API = "https://api.githubcopilot.com"
 GITHUB_API = "https://api.github.com"
 TOKEN_FILE = Path.home() / ".copilot-proxy" / "token.json"
@@ -31,7 +55,8 @@ COPILOT_CLIENT_ID = "Iv1.b507a08c87ecfe98"
 class CopilotAuth:
     """Handle GitHub → Copilot token exchange."""
 
-    def __init__(self):
+    def __init__(self, http: httpx.AsyncClient | None = None):
+        self.http = http
         self._github_token: str | None = None
         self._copilot_token: str | None = None
         self._copilot_token_expires: float = 0
@@ -39,22 +64,22 @@ class CopilotAuth:
 
     def _load_tokens(self):
         if TOKEN_FILE.exists():
-            data = json.loads(TOKEN_FILE.read_text())
+            data = _loads(TOKEN_FILE.read_bytes())
             self._github_token = data.get("github_token")
         if COPILOT_TOKEN_FILE.exists():
-            data = json.loads(COPILOT_TOKEN_FILE.read_text())
+            data = _loads(COPILOT_TOKEN_FILE.read_bytes())
             self._copilot_token = data.get("token")
             self._copilot_token_expires = data.get("expires_at", 0)
 
     def _save_github_token(self, token: str):
         TOKEN_FILE.parent.mkdir(parents=True, exist_ok=True)
-        TOKEN_FILE.write_text(json.dumps({"github_token": token}))
+        TOKEN_FILE.write_bytes(_dumps({"github_token": token}))
         TOKEN_FILE.chmod(0o600)
         self._github_token = token
 
     def _save_copilot_token(self, token: str, expires_at: int):
         COPILOT_TOKEN_FILE.parent.mkdir(parents=True, exist_ok=True)
-        COPILOT_TOKEN_FILE.write_text(json.dumps({
+        COPILOT_TOKEN_FILE.write_bytes(_dumps({
             "token": token,
             "expires_at": expires_at,
         }))
@@ -133,29 +158,34 @@ class CopilotAuth:
             return None
 
         # Exchange GitHub token for Copilot token
+        if self.http is not None:
+            return await self._exchange_token(self.http)
         async with httpx.AsyncClient() as client:
-            resp = await client.get(
-                f"{GITHUB_API}/copilot_internal/v2/token",
-                headers={
-                    "Authorization": f"token {self._github_token}",
-                    "Accept": "application/json",
-                    "Editor-Version": "vscode/1.100.0",
-                    "Editor-Plugin-Version": "copilot-chat/0.25.0",
-                    "User-Agent": "GitHubCopilotChat/0.25.0",
-                },
-            )
+            return await self._exchange_token(client)
+
+    async def _exchange_token(self, client: httpx.AsyncClient) -> str | None:
+        resp = await client.get(
+            f"{GITHUB_API}/copilot_internal/v2/token",
+            headers={
+                "Authorization": f"token {self._github_token}",
+                "Accept": "application/json",
+                "Editor-Version": "vscode/1.100.0",
+                "Editor-Plugin-Version": "copilot-chat/0.25.0",
+                "User-Agent": "GitHubCopilotChat/0.25.0",
+            },
+        )
 
-            if resp.status_code != 200:
-                print(f"Failed to get Copilot token: {resp.status_code} {resp.text}")
-                return None
+        if resp.status_code != 200:
+            print(f"Failed to get Copilot token: {resp.status_code} {resp.text}")
+            return None
 
-            data = resp.json()
-            token = data.get("token")
-            expires_at = data.get("expires_at", int(time.time()) + 1800)
+        data = resp.json()
+        token = data.get("token")
+        expires_at = data.get("expires_at", int(time.time()) + 1800)
 
-            if token:
-                self._save_copilot_token(token, expires_at)
-                return token
+        if token:
+            self._save_copilot_token(token, expires_at)
+            return token
 
         return None
 
@@ -165,13 +195,50 @@ class CopilotProxy:
 
     def __init__(self, port: int = 3000):
         self.port = port
-        self.auth = CopilotAuth()
+        # One pooled client for the life of the proxy — keeps TLS sessions
+        # to api.githubcopilot.com warm instead of reconnecting per request
+        self.http = httpx.AsyncClient(
+            timeout=120.0,
+            http2=HTTP2,
+            limits=httpx.Limits(max_keepalive_connections=64, max_connections=128),
+        )
+        self.auth = CopilotAuth(self.http)
         self.app = web.Application()
+        self.app.on_cleanup.append(self._close_http)
+        self._base_headers = {
+            "Content-Type": "application/json",
+            "Copilot-Integration-Id": "vscode-chat",
+            "Editor-Version": "vscode/1.100.0",
+            "Editor-Plugin-Version": "copilot-chat/0.25.0",
+            "Openai-Organization": "github-copilot",
+            "Openai-Intent": "conversation-panel",
+        }
+        # Header sets for the current Copilot token — the full chat set and
+        # the bare auth pair models/embeddings take; rebuilt only when the
+        # token rotates (roughly every 30 minutes)
+        self._headers_token: str | None = None
+        self._headers: dict[str, str] = {}
+        self._api_headers: dict[str, str] = {}
         self._setup_routes()
 
+    async def _close_http(self, app: web.Application):
+        await self.http.aclose()
+
+    def _headers_for(self, token: str, chat: bool = True) -> dict[str, str]:
+        if token != self._headers_token:
+            self._headers = {**self._base_headers, "Authorization": f"Bearer {token}"}
+            self._api_headers = {
+                "Authorization": f"Bearer {token}",
+                "Copilot-Integration-Id": "vscode-chat",
+            }
+            self._headers_token = token
+        return self._headers if chat else self._api_headers
+
     def _setup_routes(self):
         self.app.router.add_post("/v1/chat/completions", self.chat_completions)
         self.app.router.add_post("/chat/completions", self.chat_completions)
+        self.app.router.add_post("/v1/embeddings", self.embeddings)
+        self.app.router.add_post("/embeddings", self.embeddings)
         self.app.router.add_get("/v1/models", self.list_models)
         self.app.router.add_get("/models", self.list_models)
         self.app.router.add_get("/health", self.health)
@@ -186,7 +253,7 @@ class CopilotProxy:
                 status=401,
             )
 
-        body = await request.json()
+        body = _loads(await request.read())
         stream = body.get("stream", False)
 
         # Safeguard: Copilot API rejects conversations ending with assistant messages
@@ -196,67 +263,82 @@ class CopilotProxy:
             msgs.pop()
             print(f"[PROXY:{self.port}] Dropped trailing assistant message (prefill guard)", file=sys.stderr)
         body["messages"] = msgs
+        # Prefix-cache hint from PLUG — Copilot doesn't take it upstream
+        body.pop("prompt_cache_key", None)
 
-        headers = {
-            "Authorization": f"Bearer {token}",
-            "Content-Type": "application/json",
-            "Copilot-Integration-Id": "vscode-chat",
-            "Editor-Version": "vscode/1.100.0",
-            "Editor-Plugin-Version": "copilot-chat/0.25.0",
-            "Openai-Organization": "github-copilot",
-            "Openai-Intent": "conversation-panel",
-        }
+        headers = self._headers_for(token)
 
-        async with httpx.AsyncClient(timeout=120.0) as client:
-            if stream:
-                # Streaming response
-                response = web.StreamResponse(
-                    status=200,
-                    headers={
-                        "Content-Type": "text/event-stream",
-                        "Cache-Control": "no-cache",
-                        "Connection": "keep-alive",
-                    },
-                )
-                await response.prepare(request)
-
-                async with client.stream(
-                    "POST",
-                    f"{COPILOT_API}/chat/completions",
-                    json=body,
-                    headers=headers,
-                ) as resp:
-                    if resp.status_code != 200:
-                        error_body = await resp.aread()
-                        await response.write(
-                            f"data: {json.dumps({'error': error_body.decode()})}\n\n".encode()
-                        )
-                        return response
-
-                    async for line in resp.aiter_lines():
-                        await response.write(f"{line}\n".encode())
-
-                return response
-            else:
-                # Non-streaming
-                resp = await client.post(
-                    f"{COPILOT_API}/chat/completions",
-                    json=body,
-                    headers=headers,
-                )
+        if stream:
+            # Streaming response
+            response = web.StreamResponse(
+                status=200,
+                headers={
+                    "Content-Type": "text/event-stream",
+                    "Cache-Control": "no-cache",
+                    "Connection": "keep-alive",
+                },
+            )
+            await response.prepare(request)
+
+            async with self.http.stream(
+                "POST",
+                f"{COPILOT_API}/chat/completions",
+                content=_dumps(body),
+                headers=headers,
+            ) as resp:
+                if resp.status_code != 200:
+                    error_body = await resp.aread()
+                    await response.write(
+                        _SSE_DATA_PREFIX + _dumps({"error": error_body.decode()}) + _SSE_SUFFIX
+                    )
+                    return response
+
+                # Upstream already sends SSE framing — forward whole
+                # chunks instead of re-splitting and re-encoding lines
+                async for chunk in resp.aiter_bytes():
+                    await response.write(chunk)
+
+            return response
+        else:
+            # Non-streaming
+            resp = await self.http.post(
+                f"{COPILOT_API}/chat/completions",
+                content=_dumps(body),
+                headers=headers,
+            )
 
-                if resp.status_code >= 400:
-                    model = body.get("model", "unknown")
-                    msg_count = len(body.get("messages", []))
-                    has_tools = bool(body.get("tools"))
-                    print(f"[PROXY:{self.port}] ERROR {resp.status_code} model={model} msgs={msg_count} tools={has_tools}", file=sys.stderr)
-                    print(f"[PROXY:{self.port}] Response: {resp.text[:500]}", file=sys.stderr)
-
-                return web.Response(
-                    body=resp.content,
-                    status=resp.status_code,
-                    content_type="application/json",
-                )
+            if resp.status_code >= 400:
+                model = body.get("model", "unknown")
+                msg_count = len(body.get("messages", []))
+                has_tools = bool(body.get("tools"))
+                print(f"[PROXY:{self.port}] ERROR {resp.status_code} model={model} msgs={msg_count} tools={has_tools}", file=sys.stderr)
+                print(f"[PROXY:{self.port}] Response: {resp.text[:500]}", file=sys.stderr)
+
+            return web.Response(
+                body=resp.content,
+                status=resp.status_code,
+                content_type="application/json",
+            )
+
+    async def embeddings(self, request: web.Request) -> web.Response:
+        """Proxy embeddings to Copilot API."""
+        token = await self.auth.get_copilot_token()
+        if not token:
+            return web.json_response(
+                {"error": {"message": "No valid Copilot token. Run auth first.", "type": "auth_error"}},
+                status=401,
+            )
+
+        resp = await self.http.post(
+            f"{COPILOT_API}/embeddings",
+            content=await request.read(),
+            headers={**self._headers_for(token, chat=False), "Content-Type": "application/json"},
+        )
+        return web.Response(
+            body=resp.content,
+            status=resp.status_code,
+            content_type="application/json",
+        )
 
     async def list_models(self, request: web.Request) -> web.Response:
         """Return available models."""
@@ -267,19 +349,15 @@ class CopilotProxy:
                 status=401,
             )
 
-        async with httpx.AsyncClient() as client:
-            resp = await client.get(
-                f"{COPILOT_API}/models",
-                headers={
-                    "Authorization": f"Bearer {token}",
-                    "Copilot-Integration-Id": "vscode-chat",
-                },
-            )
-            return web.Response(
-                body=resp.content,
-                status=resp.status_code,
-                content_type="application/json",
-            )
+        resp = await self.http.get(
+            f"{COPILOT_API}/models",
+            headers=self._headers_for(token, chat=False),
+        )
+        return web.Response(
+            body=resp.content,
+            status=resp.status_code,
+            content_type="application/json",
+        )
 
     async def health(self, request: web.Request) -> web.Response:
         has_github = self.auth._github_token is not None
@@ -311,6 +389,11 @@ def main():
     if len(sys.argv) > 1 and sys.argv[1] == "auth":
         asyncio.run(do_auth())
     else:
+        try:
+            import uvloop  # optional — libuv loop, noticeably cheaper per request
+            uvloop.install()
+        except ImportError:
+            pass
         port = int(os.environ.get("PORT", "3000"))
         proxy = CopilotProxy(port=port)
         proxy.run()
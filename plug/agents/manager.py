@@ -14,9 +14,12 @@ the originating Discord channel when complete.
 """
 
 import asyncio
+import heapq
+import itertools
 import logging
+import secrets
 import time
-import uuid
+from collections import deque
 from dataclasses import dataclass, field
 from enum import Enum
 from typing import Optional, Callable, Awaitable
@@ -33,7 +36,11 @@ class AgentStatus(Enum):
     CANCELLED = "cancelled"
 
 
-@dataclass
+# Plain dict lookup for the hot summary/log path
+_STATUS_STR = {s: s.value for s in AgentStatus}
+
+
+@dataclass(slots=True)
 class SubAgent:
     id: str
     task: str
@@ -57,9 +64,9 @@ class SubAgent:
     
     @property
     def summary(self) -> str:
-        status = self.status.value
+        status = _STATUS_STR[self.status]
         elapsed = f" ({self.elapsed:.1f}s)" if self.elapsed else ""
-        name = self.label or self.id[:8]
+        name = self.label or self.id
         return f"[{name}] {status}{elapsed}"
 
 
@@ -87,7 +94,21 @@ class AgentManager:
         self.max_concurrent = max_concurrent
         self._agents: dict[str, SubAgent] = {}
         self._tasks: dict[str, asyncio.Task] = {}
+        self._by_channel: dict[str, list[str]] = {}  # channel_id → agent ids, spawn order
+        # Live per-status tallies, updated on every transition
+        self._by_status: dict[AgentStatus, int] = dict.fromkeys(AgentStatus, 0)
+        # (finished_at, agent_id) in finish order — oldest on the left
+        self._finished: deque[tuple[float, str]] = deque()
+        # One loop timer covers every running agent's timeout: a heap of
+        # (loop deadline, agent_id) drained by _expire_due
+        self._deadlines: list[tuple[float, str]] = []
+        self._timer: asyncio.TimerHandle | None = None
+        self._expired: set[str] = set()
         self._semaphore = asyncio.Semaphore(max_concurrent)
+        # Agent ids: random per-process prefix + hex counter — unique within
+        # this manager and distinguishable across restarts in logs
+        self._id_prefix = secrets.token_hex(3)
+        self._id_counter = itertools.count(1)
     
     async def spawn(
         self,
@@ -99,7 +120,7 @@ class AgentManager:
     ) -> SubAgent:
         """Spawn a new sub-agent. Returns immediately with the agent handle."""
         agent = SubAgent(
-            id=str(uuid.uuid4()),
+            id=f"{self._id_prefix}{next(self._id_counter):x}",
             task=task,
             channel_id=channel_id,
             model=model,
@@ -107,62 +128,107 @@ class AgentManager:
             label=label,
         )
         self._agents[agent.id] = agent
+        self._by_status[agent.status] += 1
+        self._by_channel.setdefault(channel_id, []).append(agent.id)
         self._tasks[agent.id] = asyncio.create_task(self._run(agent))
         log.info(f"Sub-agent spawned: {agent.summary} — {task[:80]}")
         return agent
     
     async def _run(self, agent: SubAgent):
         """Execute the sub-agent with concurrency control."""
-        async with self._semaphore:
-            agent.status = AgentStatus.RUNNING
+        try:
+            await self._semaphore.acquire()
+        except asyncio.CancelledError:
+            # Cancelled while queued behind max_concurrent: it never ran
+            self._set_status(agent, AgentStatus.CANCELLED)
+            agent.finished_at = time.time()
+            self._finished.append((agent.finished_at, agent.id))
+            log.info(f"Sub-agent cancelled before starting: {agent.summary}")
+            return
+        try:
+            self._set_status(agent, AgentStatus.RUNNING)
             agent.started_at = time.time()
             
+            self._arm_deadline(agent)
             try:
-                result = await asyncio.wait_for(
-                    self.run_fn(agent.task, agent.model, agent.timeout),
-                    timeout=agent.timeout,
-                )
-                agent.status = AgentStatus.COMPLETED
+                result = await self.run_fn(agent.task, agent.model, agent.timeout)
+                self._set_status(agent, AgentStatus.COMPLETED)
                 agent.result = result
                 log.info(f"Sub-agent completed: {agent.summary}")
                 
                 # Deliver result to channel
-                header = f"**Sub-agent** `{agent.label or agent.id[:8]}` **completed** ({agent.elapsed:.1f}s):\n\n"
+                header = f"**Sub-agent** `{agent.label or agent.id}` **completed** ({agent.elapsed:.1f}s):\n\n"
                 await self.deliver_fn(agent.channel_id, header + (result or "(no output)"))
                 
-            except asyncio.TimeoutError:
-                agent.status = AgentStatus.TIMEOUT
-                agent.error = f"Timed out after {agent.timeout}s"
-                log.warning(f"Sub-agent timed out: {agent.summary}")
-                await self.deliver_fn(
-                    agent.channel_id,
-                    f"**Sub-agent** `{agent.label or agent.id[:8]}` **timed out** after {agent.timeout:.0f}s."
-                )
             except asyncio.CancelledError:
-                agent.status = AgentStatus.CANCELLED
-                log.info(f"Sub-agent cancelled: {agent.summary}")
+                if agent.id not in self._expired:
+                    self._set_status(agent, AgentStatus.CANCELLED)
+                    log.info(f"Sub-agent cancelled: {agent.summary}")
+                else:
+                    self._set_status(agent, AgentStatus.TIMEOUT)
+                    agent.error = f"Timed out after {agent.timeout}s"
+                    log.warning(f"Sub-agent timed out: {agent.summary}")
+                    await self.deliver_fn(
+                        agent.channel_id,
+                        f"**Sub-agent** `{agent.label or agent.id}` **timed out** after {agent.timeout:.0f}s."
+                    )
             except Exception as e:
-                agent.status = AgentStatus.FAILED
+                self._set_status(agent, AgentStatus.FAILED)
                 agent.error = str(e)
                 log.error(f"Sub-agent failed: {agent.summary}: {e}")
                 await self.deliver_fn(
                     agent.channel_id,
-                    f"**Sub-agent** `{agent.label or agent.id[:8]}` **failed**: {e}"
+                    f"**Sub-agent** `{agent.label or agent.id}` **failed**: {e}"
                 )
             finally:
                 agent.finished_at = time.time()
+                self._finished.append((agent.finished_at, agent.id))
+                self._expired.discard(agent.id)
+        finally:
+            self._semaphore.release()
+
+    def _arm_deadline(self, agent: SubAgent):
+        loop = asyncio.get_running_loop()
+        when = loop.time() + agent.timeout
+        heapq.heappush(self._deadlines, (when, agent.id))
+        if self._timer is None or when < self._timer.when():
+            if self._timer is not None:
+                self._timer.cancel()
+            self._timer = loop.call_at(when, self._expire_due)
+
+    def _expire_due(self):
+        """Cancel every running agent whose deadline has passed, then re-arm."""
+        loop = asyncio.get_running_loop()
+        self._timer = None
+        now = loop.time()
+        while self._deadlines and self._deadlines[0][0] <= now:
+            _, aid = heapq.heappop(self._deadlines)
+            agent = self._agents.get(aid)
+            task = self._tasks.get(aid)
+            # Entries for agents that already finished are simply dropped
+            if agent and agent.status is AgentStatus.RUNNING and task and not task.done():
+                self._expired.add(aid)
+                task.cancel()
+        if self._deadlines:
+            self._timer = loop.call_at(self._deadlines[0][0], self._expire_due)
     
+    def _set_status(self, agent: SubAgent, status: AgentStatus):
+        self._by_status[agent.status] -= 1
+        self._by_status[status] += 1
+        agent.status = status
+
     def get(self, agent_id: str) -> Optional[SubAgent]:
         return self._agents.get(agent_id)
     
     def list_agents(self, channel_id: Optional[str] = None) -> list[SubAgent]:
-        agents = list(self._agents.values())
+        # Agents are stored in spawn order, so newest-first is just a reversal
         if channel_id:
-            agents = [a for a in agents if a.channel_id == channel_id]
-        return sorted(agents, key=lambda a: a.created_at, reverse=True)
+            ids = self._by_channel.get(channel_id, ())
+            return [self._agents[aid] for aid in reversed(ids)]
+        return list(reversed(self._agents.values()))
     
     def active_count(self) -> int:
-        return sum(1 for a in self._agents.values() if a.status == AgentStatus.RUNNING)
+        return self._by_status[AgentStatus.RUNNING]
     
     async def cancel(self, agent_id: str) -> bool:
         task = self._tasks.get(agent_id)
@@ -172,19 +238,32 @@ class AgentManager:
         return False
     
     async def cancel_all(self):
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
         for task in self._tasks.values():
             if not task.done():
                 task.cancel()
     
     def cleanup(self, max_age: float = 3600.0):
         """Remove finished agents older than max_age seconds."""
-        now = time.time()
-        to_remove = [
-            aid for aid, a in self._agents.items()
-            if a.finished_at and (now - a.finished_at) > max_age
-        ]
-        for aid in to_remove:
-            del self._agents[aid]
+        cutoff = time.time() - max_age
+        removed = 0
+        while self._finished and self._finished[0][0] < cutoff:
+            _, aid = self._finished.popleft()
+            agent = self._agents.pop(aid, None)
             self._tasks.pop(aid, None)
-        if to_remove:
-            log.debug(f"Cleaned up {len(to_remove)} finished sub-agents")
+            if agent is None:
+                continue
+            self._by_status[agent.status] -= 1
+            self._forget_channel(agent)
+            removed += 1
+        if removed:
+            log.debug(f"Cleaned up {removed} finished sub-agents")
+
+    def _forget_channel(self, agent: SubAgent):
+        ids = self._by_channel.get(agent.channel_id)
+        if ids:
+            ids.remove(agent.id)
+            if not ids:
+                del self._by_channel[agent.channel_id]
@@ -8,7 +8,7 @@ preserving code blocks and avoiding mid-word splits.
 
 from __future__ import annotations
 
-import re
+from bisect import bisect_left
 
 
 def chunk_message(text: str, max_length: int = 2000) -> list[str]:
@@ -24,26 +24,39 @@ def chunk_message(text: str, max_length: int = 2000) -> list[str]:
         return [text]
 
     chunks: list[str] = []
-    remaining = text
-
-    while remaining:
-        if len(remaining) <= max_length:
-            chunks.append(remaining)
+    start = 0
+    end = len(text)
+    in_code = False  # whether `start` sits inside an unclosed ``` block
+
+    # Walk the text by index rather than re-slicing the tail each round,
+    # which copied the remainder on every chunk
+    while start < end:
+        if end - start <= max_length:
+            tail = text[start:]
+            if not tail.isspace():
+                chunks.append(tail)
             break
 
         # Find the best split point within max_length
-        split_at = _find_split_point(remaining, max_length)
-        chunk = remaining[:split_at].rstrip()
-        remaining = remaining[split_at:].lstrip("\n")
-
-        if chunk:
+        split_at, in_code = _find_split_point(text, start, max_length, in_code)
+        chunk = text[start:split_at].rstrip()
+        if chunk and not chunk.isspace():
             chunks.append(chunk)
 
-    return [c for c in chunks if c.strip()]
+        start = split_at
+        while start < end and text[start] == "\n":
+            start += 1
+
+    return chunks
 
 
-def _find_split_point(text: str, max_length: int) -> int:
-    """Find the best split point within max_length characters.
+def _find_split_point(
+    text: str, start: int, max_length: int, in_code: bool = False,
+) -> tuple[int, bool]:
+    """Find the best split point within max_length characters of start.
+
+    ``in_code`` is the fence state carried over from the previous chunk.
+    Returns the absolute split offset and the fence state at that offset.
 
     Priority:
     1. After a complete code block
@@ -52,48 +65,65 @@ def _find_split_point(text: str, max_length: int) -> int:
     4. At a word boundary
     5. Hard cut at max_length
     """
-    window = text[:max_length]
-
-    # Check if we're inside a code block
-    code_blocks = list(re.finditer(r"```", window))
-
-    if code_blocks:
-        # If odd number of ``` markers, we'd split inside a code block
-        if len(code_blocks) % 2 != 0:
-            # Find the last complete code block end
-            last_complete = None
-            for i in range(0, len(code_blocks) - 1, 2):
-                last_complete = code_blocks[i + 1].end()
-
-            if last_complete and last_complete > max_length // 4:
-                # Split after the last complete code block
+    end = start + max_length
+
+    # Plain find() beats the regex engine for a fixed three-character literal;
+    # all searches are bounded on text itself so no window copy is made
+    fences: list[int] = []
+    i = text.find("```", start, end)
+    while i != -1:
+        fences.append(i)
+        i = text.find("```", i + 3, end)
+
+    split = _best_split(text, start, end, fences, in_code, max_length)
+
+    # Fences before the split flip the state handed to the next chunk
+    crossed = bisect_left(fences, split)
+    return split, in_code ^ (crossed % 2 == 1)
+
+
+def _best_split(
+    text: str, start: int, end: int, fences: list[int], in_code: bool, max_length: int,
+) -> int:
+    # Fences alternate open/close; if the window starts inside a block the
+    # first one closes it
+    if in_code ^ (len(fences) % 2 == 1):
+        # The window ends inside a code block — split after the last
+        # block that closed, if there is one far enough in
+        closes = fences[0 if in_code else 1::2]
+        if closes:
+            last_complete = closes[-1] + 3
+            if last_complete - start > max_length // 4:
                 # Look for a newline after it
-                nl = window.find("\n", last_complete)
+                nl = text.find("\n", last_complete, end)
                 if nl != -1:
                     return nl + 1
                 return last_complete
 
-            # Can't split cleanly around code blocks — try before the first one
-            first_block = code_blocks[0].start()
-            if first_block > max_length // 4:
-                # Split before the code block
-                before = window[:first_block].rstrip()
-                return len(before)
-
-    # Try paragraph break (double newline)
-    para_break = window.rfind("\n\n")
-    if para_break > max_length // 3:
-        return para_break + 1
-
-    # Try line break
-    line_break = window.rfind("\n")
-    if line_break > max_length // 3:
+        # Otherwise try just before the block that is still open
+        if fences and fences[-1] - start > max_length // 4:
+            before = len(text[start:fences[-1]].rstrip())
+            if before:
+                return start + before
+
+    # Only breaks past these floors are acceptable, so the reverse scans
+    # stop there instead of walking the whole window
+    line_floor = start + max_length // 3 + 1
+
+    # Try paragraph break (double newline) — impossible without a line break
+    line_break = text.rfind("\n", line_floor, end)
+    if line_break != -1:
+        para_break = text.rfind("\n\n", line_floor, end)
+        if para_break != -1:
+            return para_break + 1
+
+        # Try line break
         return line_break + 1
 
     # Try word boundary (space)
-    space = window.rfind(" ")
-    if space > max_length // 2:
+    space = text.rfind(" ", start + max_length // 2 + 1, end)
+    if space != -1:
         return space + 1
 
     # Hard cut
-    return max_length
+    return end
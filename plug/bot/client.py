@@ -14,36 +14,83 @@ discord.py bot with:
 from __future__ import annotations
 
 import asyncio
+import contextlib
+import hashlib
 import json
 import logging
+import re
 import signal
 import time
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any
 
+import aiohttp
 import discord
 from discord import Intents, Message as DiscordMessage
 
 from plug.bot.chunker import chunk_message
+from plug.bot.ratelimit import ChannelRateLimiter
+from plug.bot.streamer import ReplyStreamer
+from plug.cache import ExactCache, SemanticCache
 from plug.config import PlugConfig, DB_FILE
-from plug.models.base import ChatProvider, Message, ProviderChain
+from plug.models.base import ChatProvider, Message, ProviderChain, ToolCall
 from plug.models.proxy import ProxyChatProvider
 from plug.models.copilot import CopilotChatProvider
 from plug.models.ollama import OllamaChatProvider
 from plug.prompt import load_system_prompt
-from plug.sessions.compactor import Compactor, count_message_tokens
+from plug.sessions.compactor import (
+    Compactor,
+    count_message_tokens_approx,
+    count_message_tokens_async,
+)
 from plug.sessions.store import SessionStore
-from plug.tools.definitions import TOOL_DEFINITIONS
-from plug.tools.executor import ToolExecutor
+from plug.tools.definitions import TOOL_DEFINITIONS, TOOL_DEFINITIONS_JSON
+from plug.tools.executor import ToolExecutor, parallel_safe
 from plug.cron.scheduler import CronStore, CronScheduler, CronJob
+from plug.daemon import notify_ready
 from plug.agents.manager import AgentManager
 from plug.health import HealthChecker
 from plug.router import AgentRouter, AgentPersona
 
+try:
+    import orjson
+except ImportError:  # optional speedup — stdlib json works everywhere
+    orjson = None
+
+if orjson is not None:
+    _loads = orjson.loads
+    _dumps = orjson.dumps
+else:
+    _loads = json.loads
+
+    def _dumps(obj) -> bytes:
+        return json.dumps(obj, separators=(",", ":")).encode()
+
 logger = logging.getLogger(__name__)
 
 MAX_TOOL_ROUNDS = 200  # Safety limit for tool-call loops
+DELIVERY_QUEUE_SIZE = 256  # pending cron deliveries before producers wait
+SYSTEM_PROMPT_TTL = 300.0  # Seconds a resolved persona system prompt is reused
+# Tool catalog hash, folded into prefix-cache keys
+_TOOLS_DIGEST = hashlib.blake2b(TOOL_DEFINITIONS_JSON.encode(), digest_size=8).digest()
+
+_NEVER_MATCHES = re.compile(r"(?!)")  # mention pattern until the bot user is known
+
+# Agent-loop results that are failures, not answers — never cached
+_UNCACHEABLE_PREFIXES = ("LLM error:", "[Stopped", "[Agent reached")
+
+# Text-only replies that announce work instead of doing it — one
+# case-insensitive pass over the reply instead of a scan per phrase
+_CONTINUATION_RE = re.compile(
+    "|".join(re.escape(sig) for sig in (
+        "let me ", "now i'll ", "now i will", "i'll create",
+        "i'll write", "i'll run", "let me create", "let me write",
+        "let me run", "simultaneously", "i need to", "i'll start",
+        "now let me", "i have enough", "i have all the",
+    )),
+    re.IGNORECASE,
+)
 
 # ── Interrupt bus: stop keywords that immediately halt the agent loop ────
 INTERRUPT_KEYWORDS = frozenset({
@@ -67,6 +114,8 @@ EXEC_CHANNELS = {
     "1473617119986843741": "CISO",
 }
 
+_REPORT_TEMPLATE = AVA_BOT_MENTION + " **{exec_name} Task Report**\n\n{summary}"
+
 # ── Report persistence: write exec reports to disk for AVA to read ────────
 REPORT_BASE_DIR = Path("/home/adam/workspace/enterprise/executives")
 EXEC_WORKSPACES = {
@@ -83,6 +132,9 @@ class PlugBot:
     def __init__(self, config: PlugConfig):
         self.config = config
         self._system_prompt: str | None = None
+        self._system_message: Message | None = None  # default prompt as a Message (set in start())
+        # persona name → (expires_at, system Message or None)
+        self._system_messages: dict[str, tuple[float, Message | None]] = {}
 
         # Discord client
         intents = Intents.default()
@@ -98,21 +150,42 @@ class PlugBot:
         self.chain: ProviderChain | None = None
         self.executor: ToolExecutor | None = None
         self.compactor: Compactor | None = None
+        self.exact_cache: ExactCache | None = None
+        self.semantic_cache: SemanticCache | None = None
         self.cron_store: CronStore | None = None
         self.cron_scheduler: CronScheduler | None = None
         self.agent_manager: AgentManager | None = None
         self.health: HealthChecker | None = None
         self.router: AgentRouter | None = None
+        self._send_limiter = ChannelRateLimiter()
+        self._channel_cache: dict[int, discord.abc.Messageable] = {}  # delivery targets resolved by ID
+        # Cron output is queued and drained by one worker (set up in start())
+        self._delivery_queue: asyncio.Queue[tuple[str, str]] | None = None
+        self._delivery_worker: asyncio.Task | None = None
+        self._background: set[asyncio.Task] = set()  # strong refs for fire-and-forget tasks
+        self._routed_channel_ids: frozenset[str] | None = None  # set when only routed channels are served
         self._persona_chains: dict[str, ProviderChain] = {}  # persona_name → chain
+        self._subagent_chains: dict[str, ProviderChain] = {}  # model override → chain
+        self._prompt_tokens_seen = 0  # prefix-cache hit-rate accounting
+        self._prompt_tokens_cached = 0
+        self._prefix_keys: dict[str, tuple[str, str]] = {}  # channel_id → (system prompt, cache key)
+        self._http: aiohttp.ClientSession | None = None  # report-back webhooks (created in start())
+        self._shutdown_task: asyncio.Task | None = None  # set by the first SIGTERM/SIGINT
 
         # State
-        self._processing: set[str] = set()  # channel IDs currently being processed
+        # Per-channel FIFO: messages arriving mid-turn wait instead of being dropped.
+        # A lock lives only while someone holds or waits on it (_channel_waiters).
+        self._channel_locks: dict[str, asyncio.Lock] = {}
+        self._channel_waiters: dict[str, int] = {}
         self._sister_cooldown: dict[str, float] = {}  # channel_id → last response timestamp
         self._interrupt: dict[str, str] = {}  # channel_id → interrupt message (interrupt bus)
+        self._bot_user_id: int | None = None  # set in on_ready
+        self._mention_re: re.Pattern[str] = _NEVER_MATCHES  # <@id> / <@!id> — set in on_ready
 
         # Wire up events
         self.client.event(self.on_ready)
         self.client.event(self.on_message)
+        self.client.event(self.on_guild_channel_delete)
 
     # ── Lifecycle ────────────────────────────────────────────────────────
 
@@ -126,7 +199,7 @@ class PlugBot:
         proxy_cfg = self.config.models.proxy
         self.provider = ProxyChatProvider(
             base_url=proxy_cfg.base_url,
-            api_key=proxy_cfg.api_key,
+            api_key=proxy_cfg.api_key.get_secret_value(),
             timeout=proxy_cfg.timeout,
             default_model=self.config.models.primary,
         )
@@ -161,8 +234,30 @@ class PlugBot:
             retry_delay=2.0,
         )
 
+        # Response cache (off by default — replies can depend on tool state)
+        cache_cfg = self.config.cache
+        if cache_cfg.exact_enabled:
+            self.exact_cache = ExactCache(maxsize=cache_cfg.exact_maxsize, ttl=cache_cfg.ttl)
+            logger.info("Exact-match response cache enabled (%d entries)", cache_cfg.exact_maxsize)
+        if cache_cfg.semantic_enabled:
+            provider = self.provider
+
+            async def embed(texts: list[str]) -> list[list[float]]:
+                return await provider.embed(texts, model=cache_cfg.embedding_model)
+
+            self.semantic_cache = SemanticCache(
+                embed,
+                threshold=cache_cfg.threshold,
+                ttl=cache_cfg.ttl,
+                max_entries=cache_cfg.max_entries,
+            )
+            logger.info("Semantic response cache enabled (threshold %.2f)", cache_cfg.threshold)
+
         # Tool executor
-        self.executor = ToolExecutor(workspace=self.config.agent.workspace)
+        self.executor = ToolExecutor(
+            workspace=self.config.agent.workspace,
+            max_parallel=self.config.agent.max_parallel_tools,
+        )
 
         # Compactor
         self.compactor = Compactor(
@@ -173,20 +268,30 @@ class PlugBot:
             summary_model=self.config.compaction.summary_model or None,
         )
 
-        # System prompt
+        # System prompt — the default system Message is built once and
+        # shared by identity across every conversation that uses it
         self._system_prompt = load_system_prompt(
             self.config.agent.workspace,
             self.config.agent.system_prompt_files,
         )
+        self._system_message = (
+            Message(role="system", content=self._system_prompt) if self._system_prompt else None
+        )
 
         # Multi-agent router (channel → persona mapping)
-        router_cfg = getattr(self.config, '_raw', {}).get('router')
-        if not router_cfg and hasattr(self.config, 'model_extra'):
-            router_cfg = self.config.model_extra.get('router')
+        router_cfg = self.config.router
         if router_cfg:
             self.router = AgentRouter.from_config(router_cfg)
+            self._system_messages.clear()
+            if self.router.default is None:
+                self._routed_channel_ids = frozenset(self.router.channel_ids())
             logger.info("Router loaded: %d personas", len(self.router.list_personas()))
 
+        # Cron deliveries — a burst of jobs firing together is drained by
+        # one worker instead of every job racing for the Discord send path
+        self._delivery_queue = asyncio.Queue(maxsize=DELIVERY_QUEUE_SIZE)
+        self._delivery_worker = asyncio.create_task(self._drain_deliveries())
+
         # Cron scheduler
         cron_db = DB_FILE.parent / "cron.db"
         self.cron_store = CronStore(cron_db)
@@ -203,24 +308,45 @@ class PlugBot:
             max_concurrent=self.config.agent.max_subagents if hasattr(self.config.agent, 'max_subagents') else 5,
         )
 
+        # Shared HTTP session for report-back webhooks — keeps the connection
+        # to discord.com warm instead of a fresh TCP+TLS handshake per report
+        self._http = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit=32, ttl_dns_cache=300, keepalive_timeout=75),
+            timeout=aiohttp.ClientTimeout(total=10),
+        )
+
         # Health checker
         self.health = HealthChecker(
             proxy_url=self.config.models.proxy.base_url.replace("/v1", ""),
             check_interval=30.0,
         )
 
-        # Handle graceful shutdown
-        loop = asyncio.get_event_loop()
+        # Handle graceful shutdown. The loop's signal handlers run as ordinary
+        # callbacks (woken through its self-pipe), never mid-bytecode.
+        loop = asyncio.get_running_loop()
         for sig in (signal.SIGTERM, signal.SIGINT):
-            loop.add_signal_handler(sig, lambda: asyncio.create_task(self.shutdown()))
+            loop.add_signal_handler(sig, self._on_signal, sig)
 
         # Start Discord client
-        token = self.config.discord.token
+        token = self.config.discord.token.get_secret_value()
         if not token:
             raise RuntimeError("Discord bot token not configured. Run `plug setup`.")
 
         logger.info("Starting PLUG bot...")
-        await self.client.start(token)
+        # client.start() split in two so `plug start` hears back only once
+        # the token has been accepted; a bad token or no network raises here
+        # and run_bot reports it as ERR
+        await self.client.login(token)
+        notify_ready()
+        await self.client.connect()
+
+    def _on_signal(self, sig: signal.Signals) -> None:
+        """Start one graceful shutdown; a second signal gets the default action."""
+        logger.info("Received %s", sig.name)
+        loop = asyncio.get_running_loop()
+        for s in (signal.SIGTERM, signal.SIGINT):
+            loop.remove_signal_handler(s)
+        self._shutdown_task = asyncio.create_task(self.shutdown())
 
     async def shutdown(self) -> None:
         """Graceful shutdown."""
@@ -228,6 +354,8 @@ class PlugBot:
 
         if self.cron_scheduler:
             self.cron_scheduler.stop()
+        if self._delivery_worker:
+            self._delivery_worker.cancel()
         if self.health:
             self.health.stop()
         if self.ollama_provider:
@@ -242,6 +370,8 @@ class PlugBot:
             await self.provider.close()
         if self.store:
             await self.store.close()
+        if self._http:
+            await self._http.close()
 
         if not self.client.is_closed():
             await self.client.close()
@@ -253,6 +383,8 @@ class PlugBot:
     async def on_ready(self) -> None:
         """Called when the bot connects to Discord."""
         logger.info("Aria connected as %s (ID: %s)", self.client.user, self.client.user.id)
+        self._bot_user_id = self.client.user.id
+        self._mention_re = re.compile(rf"<@!?{self._bot_user_id}>")
 
         # Set status
         status_text = self.config.discord.status_message
@@ -273,12 +405,36 @@ class PlugBot:
             self.health.start()
             logger.info("Health checker started")
 
+    async def on_guild_channel_delete(self, channel: discord.abc.GuildChannel) -> None:
+        """Forget a deleted channel so deliveries don't target a stale object."""
+        self._channel_cache.pop(channel.id, None)
+
     async def on_message(self, message: DiscordMessage) -> None:
         """Handle incoming Discord messages."""
+        # Cheapest rejections first — most traffic is not for us.
+        # Text-less messages are dropped later anyway (_handle_message)
+        if not message.content:
+            return
+        # System messages (joins, pins, boosts, ...)
+        if message.type is not discord.MessageType.default and message.type is not discord.MessageType.reply:
+            return
         # Ignore own messages
         if message.author == self.client.user:
             return
 
+        # With a router and no default persona, guild channels outside the
+        # routing table are never answered — skip them before any routing
+        channel_id = str(message.channel.id)
+        if (
+            self._routed_channel_ids is not None
+            and channel_id not in self._routed_channel_ids
+            and message.guild is not None
+        ):
+            return
+
+        # Resolve the channel's persona once; everything downstream reuses it
+        persona = self.router.route(channel_id) if self.router else None
+
         # Track whether this is a webhook dispatch (used to bypass mention checks)
         is_webhook_dispatch = False
 
@@ -287,13 +443,8 @@ class PlugBot:
         sister_bot_ids = set(self.config.discord.sister_bot_ids)  # Config-driven, not hardcoded
         if message.author.bot:
             webhook_id = getattr(message, 'webhook_id', None)
-            channel_id = str(message.channel.id)
             is_sister_bot = str(message.author.id) in sister_bot_ids
-            is_webhook_dispatch = (
-                webhook_id is not None
-                and self.router
-                and self.router.route(channel_id) is not None
-            )
+            is_webhook_dispatch = webhook_id is not None and persona is not None
             if is_sister_bot:
                 # Sister cooldown — prevent echo loops (matches Mach6's 10s cooldown)
                 last_response = self._sister_cooldown.get(channel_id, 0)
@@ -316,35 +467,29 @@ class PlugBot:
         # C-Suite channels: if someone @mentions a sister bot (AVA) in a channel
         # where this persona doesn't require mentions, skip — they're talking to the
         # sister, not to this persona. But if they @mention US, that's direct address.
-        if self.router and self.client.user and not is_webhook_dispatch:
-            channel_id = str(message.channel.id)
-            persona = self.router.route(channel_id)
+        if self.client.user and not is_webhook_dispatch:
             if persona and not persona.require_mention:
                 sister_ids = set(self.config.discord.sister_bot_ids)
                 mentions_sister = any(
                     str(user.id) in sister_ids
                     for user in message.mentions
                 )
-                mentions_me = any(
-                    user.id == self.client.user.id
-                    for user in message.mentions
-                )
-                if mentions_sister and not mentions_me:
+                if mentions_sister and not self._mentions_me(message):
                     return  # @sister in a no-mention channel = talking to sister, not us
 
         # Check if we should respond (webhook dispatches bypass mention requirement)
-        if not self._should_respond(message, is_webhook=is_webhook_dispatch):
-            logger.debug("_should_respond returned False for %s", str(message.channel.id))
+        if not self._should_respond(message, channel_id, persona, is_webhook=is_webhook_dispatch):
+            logger.debug("_should_respond returned False for %s", channel_id)
             return
 
-        # Prevent concurrent processing of same channel
-        channel_id = str(message.channel.id)
-        if channel_id in self._processing:
+        # Serialize processing per channel
+        lock = self._channel_locks.get(channel_id)
+        if lock is None:
+            lock = self._channel_locks[channel_id] = asyncio.Lock()
+        if lock.locked():
             # ── Interrupt bus: check for stop keywords while processing ──
-            msg_text = (message.content or "").lower().strip()
             # Strip bot mentions from the text before checking keywords
-            for mention_pattern in [f"<@{self.client.user.id}>", f"<@!{self.client.user.id}>"] if self.client.user else []:
-                msg_text = msg_text.replace(mention_pattern, "").strip()
+            msg_text = self._mention_re.sub("", (message.content or "").lower()).strip()
             if msg_text in INTERRUPT_KEYWORDS:
                 self._interrupt[channel_id] = msg_text
                 logger.warning("INTERRUPT BUS: '%s' received for %s — flagging for immediate stop", msg_text, channel_id)
@@ -353,38 +498,64 @@ class PlugBot:
                 except Exception:
                     pass
                 return
-            logger.info("Already processing %s, skipping", channel_id)
-            return
+            logger.info("Already processing %s, queueing message", channel_id)
 
-        logger.info("Processing message in %s from %s", channel_id, message.author)
-        self._interrupt.pop(channel_id, None)  # Clear stale interrupt flags
-        self._processing.add(channel_id)
+        self._channel_waiters[channel_id] = self._channel_waiters.get(channel_id, 0) + 1
         try:
-            await self._handle_message(message, is_dispatch=is_webhook_dispatch)
-        except Exception as e:
-            logger.error("Error handling message in %s: %s", channel_id, e, exc_info=True)
-            # Suppress error messages for sister conversations (prevents error loops)
-            is_sister_convo = str(message.author.id) in set(self.config.discord.sister_bot_ids)
-            if not is_sister_convo:
+            async with lock:
+                logger.info("Processing message in %s from %s", channel_id, message.author)
+                self._interrupt.pop(channel_id, None)  # Clear stale interrupt flags
                 try:
-                    await message.reply(f"Something went wrong: {type(e).__name__}", mention_author=False)
-                except Exception:
-                    pass
-            else:
-                logger.info("Suppressed error message for sister conversation in %s", channel_id)
+                    await self._handle_message(message, channel_id, persona, is_dispatch=is_webhook_dispatch)
+                except Exception as e:
+                    logger.error("Error handling message in %s: %s", channel_id, e, exc_info=True)
+                    # Suppress error messages for sister conversations (prevents error loops)
+                    is_sister_convo = str(message.author.id) in set(self.config.discord.sister_bot_ids)
+                    if not is_sister_convo:
+                        # Detached so a slow or failing reply never holds the channel lock
+                        self._spawn(self._safe_reply(message, f"Something went wrong: {type(e).__name__}"))
+                    else:
+                        logger.info("Suppressed error message for sister conversation in %s", channel_id)
         finally:
-            self._processing.discard(channel_id)
+            waiters = self._channel_waiters[channel_id] - 1
+            if waiters:
+                self._channel_waiters[channel_id] = waiters
+            else:
+                del self._channel_waiters[channel_id]
+                del self._channel_locks[channel_id]
+
+    def _spawn(self, coro) -> asyncio.Task:
+        """Run a coroutine in the background, keeping it referenced until done."""
+        task = asyncio.create_task(coro)
+        self._background.add(task)
+        task.add_done_callback(self._background.discard)
+        return task
+
+    @staticmethod
+    async def _safe_reply(message: DiscordMessage, text: str) -> None:
+        """Reply to a message, swallowing any failure."""
+        try:
+            await message.reply(text, mention_author=False)
+        except Exception:
+            pass
 
     # ── Message routing ──────────────────────────────────────────────────
 
-    def _should_respond(self, message: DiscordMessage, *, is_webhook: bool = False) -> bool:
+    def _should_respond(
+        self,
+        message: DiscordMessage,
+        channel_id: str,
+        persona: AgentPersona | None,
+        *,
+        is_webhook: bool = False,
+    ) -> bool:
         """Determine if the bot should respond to this message."""
         is_dm = isinstance(message.channel, discord.DMChannel)
 
         if is_dm:
             return self._check_dm_policy(message)
         else:
-            return self._check_guild_policy(message, is_webhook=is_webhook)
+            return self._check_guild_policy(message, channel_id, persona, is_webhook=is_webhook)
 
     def _check_dm_policy(self, message: DiscordMessage) -> bool:
         """Check DM policy."""
@@ -396,7 +567,14 @@ class PlugBot:
         user_id = str(message.author.id)
         return user_id in self.config.discord.dm_allowlist
 
-    def _check_guild_policy(self, message: DiscordMessage, *, is_webhook: bool = False) -> bool:
+    def _check_guild_policy(
+        self,
+        message: DiscordMessage,
+        channel_id: str,
+        persona: AgentPersona | None,
+        *,
+        is_webhook: bool = False,
+    ) -> bool:
         """Check guild/mention policy. Webhook dispatches bypass mention requirement."""
         # Check guild whitelist
         if self.config.discord.guild_ids:
@@ -405,12 +583,8 @@ class PlugBot:
                 return False
 
         # If router is active, only respond in mapped channels
-        channel_id = str(message.channel.id)
-        persona = None
-        if self.router:
-            persona = self.router.route(channel_id)
-            if not persona:
-                return False  # Not a routed channel, ignore
+        if self.router and not persona:
+            return False  # Not a routed channel, ignore
 
         # Webhook dispatches always pass — they were already validated in on_message
         if is_webhook:
@@ -465,26 +639,27 @@ class PlugBot:
             # This ensures @AVA → only Mach6, @Aria → only Aria
             sister_ids = set(self.config.discord.sister_bot_ids)
             if sister_ids and message.mentions:
-                mentions_me = any(u.id == self.client.user.id for u in message.mentions)
                 mentions_sister = any(str(u.id) in sister_ids for u in message.mentions)
-                if mentions_sister and not mentions_me:
+                if mentions_sister and not self._mentions_me(message):
                     return False  # They're talking to sister, not us
 
             # Check if bot is mentioned
-            mentioned = any(
-                user.id == self.client.user.id
-                for user in message.mentions
-            )
-            if not mentioned:
+            if not self._mentions_me(message):
                 return False
 
         return True
 
     # ── Agent loop ───────────────────────────────────────────────────────
 
-    async def _handle_message(self, message: DiscordMessage, *, is_dispatch: bool = False) -> None:
+    async def _handle_message(
+        self,
+        message: DiscordMessage,
+        channel_id: str,
+        persona: AgentPersona | None,
+        *,
+        is_dispatch: bool = False,
+    ) -> None:
         """Main agent loop: process a message through the LLM."""
-        channel_id = str(message.channel.id)
 
         # Extract the user's text (strip the mention)
         user_text = self._extract_text(message)
@@ -495,9 +670,15 @@ class PlugBot:
         # starts with a clean conversation (prevents context bloat + 400 errors)
         if is_dispatch:
             cleared = await self.store.clear_messages(channel_id)
+            if self.exact_cache:
+                self.exact_cache.clear(channel_id)
+            if self.semantic_cache:
+                self.semantic_cache.clear(channel_id)
             if cleared:
                 logger.info("Cleared %d old messages for dispatch in %s", cleared, channel_id)
 
+        prompt_text = user_text.strip()
+
         # Inject message metadata so the LLM can reference message IDs
         # (needed for discord_react tool and reply threading)
         msg_header = f"<<message_id={message.id} channel_id={channel_id}>>"
@@ -512,37 +693,124 @@ class PlugBot:
             )
         else:
             user_text = f"{msg_header}\n{user_text}"
-        user_msg = Message(role="user", content=user_text)
-        user_tokens = count_message_tokens(user_msg)
-        await self.store.add_message(channel_id, user_msg, token_count=user_tokens)
+
+        # Response caches key on the bare prompt (no per-message header).
+        # Exact match first — a hash lookup that avoids even the embedding —
+        # keyed together with the channel's last reply, so "yes" or
+        # "continue" never replays an answer given to another context.
+        # The prompt is only embedded up front if the channel has semantic
+        # entries to compare against (overlapping the user-message write);
+        # otherwise that waits until the reply is out
+        cacheable = not is_sister and not is_dispatch
+        exact_key = cached_reply = embed_task = None
+        if self.exact_cache and cacheable:
+            history = await self.store.get_messages(channel_id)
+            last_reply = next((m.content or "" for m in reversed(history) if m.role == "assistant"), "")
+            exact_key = ExactCache.key(channel_id, prompt_text, last_reply)
+            cached_reply = self.exact_cache.get(exact_key)
+        embed_later = False
+        if self.semantic_cache and cacheable and cached_reply is None:
+            if self.semantic_cache.has_entries(channel_id):
+                embed_task = asyncio.create_task(self.semantic_cache.embed(prompt_text))
+            else:
+                embed_later = True
+
+        try:
+            user_msg = Message(role="user", content=user_text)
+            user_tokens = await count_message_tokens_async(user_msg)
+            if cached_reply is not None:
+                # Exact hit: the prompt and its reply go in as one write
+                await self._reply_from_cache(message, channel_id, cached_reply, (user_msg, user_tokens))
+                await self._after_reply(channel_id, cached_reply, is_sister=is_sister)
+                return
+            await self.store.add_message(channel_id, user_msg, token_count=user_tokens)
+
+            cache_vector = await embed_task if embed_task is not None else None
+        finally:
+            # Don't leave the embedding running if the write failed first
+            if embed_task is not None and not embed_task.done():
+                embed_task.cancel()
+        if cache_vector is not None:
+            cached_reply = self.semantic_cache.get(channel_id, cache_vector)
+            if cached_reply is not None:
+                await self._reply_from_cache(message, channel_id, cached_reply)
+                await self._after_reply(channel_id, cached_reply, is_sister=is_sister)
+                return
 
         # Check compaction before building context
         if self.config.compaction.enabled:
             await self.compactor.check_and_compact(channel_id)
 
         # Build conversation for the API
-        conversation = await self._build_conversation(channel_id)
+        conversation = await self._build_conversation(channel_id, persona)
+
+        streamer = None
+        if self.config.discord.stream_replies:
+            streamer = ReplyStreamer(
+                message,
+                max_length=self.config.discord.max_message_length,
+                interval=self.config.discord.stream_edit_interval,
+                min_chars=self.config.discord.stream_edit_chars,
+            )
 
         # Agent loop: call LLM, execute tools, repeat until text response
-        final_text = await self._run_agent_loop(channel_id, conversation, message)
+        final_text = await self._run_agent_loop(
+            channel_id, conversation, message, persona, streamer=streamer,
+        )
 
         # Send the response — honor choice: NO_REPLY means the agent chose silence
         if final_text and final_text.strip() not in ('NO_REPLY', 'HEARTBEAT_OK'):
-            await self._send_response(message, final_text)
-            # Record sister cooldown if we just responded to a sister
-            if is_sister:
-                self._sister_cooldown[channel_id] = time.time()
-        elif final_text and final_text.strip() == 'NO_REPLY':
-            logger.info("Agent chose NO_REPLY for %s — honoring silence", channel_id)
-
+            if streamer is None or not await streamer.finish(final_text):
+                await self._send_response(message, final_text)
+        else:
+            if streamer is not None:
+                await streamer.finish(None)
+            if final_text and final_text.strip() == 'NO_REPLY':
+                logger.info("Agent chose NO_REPLY for %s — honoring silence", channel_id)
+
+        if (
+            final_text
+            and final_text.strip() not in ('NO_REPLY', 'HEARTBEAT_OK')
+            and not final_text.startswith(_UNCACHEABLE_PREFIXES)
+        ):
+            if exact_key is not None:
+                self.exact_cache.put(exact_key, final_text)
+            if cache_vector is not None:
+                self.semantic_cache.put(channel_id, cache_vector, final_text)
+            elif embed_later:
+                self._spawn(self.semantic_cache.remember(channel_id, prompt_text, final_text))
+
+        await self._after_reply(channel_id, final_text, is_sister=is_sister)
+
+    async def _after_reply(self, channel_id: str, final_text: str | None, *, is_sister: bool) -> None:
+        """Bookkeeping every reply gets, whether generated or served from cache."""
+        # Record sister cooldown if we just responded to a sister
+        if is_sister and final_text and final_text.strip() not in ('NO_REPLY', 'HEARTBEAT_OK'):
+            self._sister_cooldown[channel_id] = time.time()
         # Report back to AVA when exec task completes
         await self._report_back_to_ava(channel_id, final_text)
 
+    async def _reply_from_cache(
+        self,
+        message: DiscordMessage,
+        channel_id: str,
+        reply: str,
+        *pending: tuple[Message, int],
+    ) -> None:
+        """Record a cached reply (plus any not-yet-stored turns) and send it."""
+        reply_msg = Message(role="assistant", content=reply)
+        reply_tokens = await count_message_tokens_async(reply_msg)
+        await self.store.add_messages(channel_id, [*pending, (reply_msg, reply_tokens)])
+        await self._send_response(message, reply)
+
     async def _run_agent_loop(
         self,
         channel_id: str,
         conversation: list[Message],
         discord_message: DiscordMessage,
+        persona: AgentPersona | None = None,
+        *,
+        streamer: ReplyStreamer | None = None,
     ) -> str | None:
         """Run the agent loop until the LLM returns a text response.
 
@@ -552,7 +820,14 @@ class PlugBot:
         3. Add tool results to conversation
         4. Repeat from 1
         5. When LLM returns text (no tool_calls), return it
+
+        With a ``streamer``, text deltas are shown in Discord as they
+        arrive; the caller delivers the final text through it.
         """
+        model_override = self._get_model_for_channel(persona)
+        chain = self._get_chain_for_channel(persona)
+        cache_key = self._prefix_key(channel_id, conversation)
+
         for round_num in range(MAX_TOOL_ROUNDS):
             # ── Interrupt bus check: stop immediately if flagged ──
             if channel_id in self._interrupt:
@@ -564,79 +839,120 @@ class PlugBot:
             if round_num > 0:
                 await asyncio.sleep(0.5)
 
-            # Show typing indicator
-            async with discord_message.channel.typing():
+            # Show typing indicator until a streamed reply is visible
+            if streamer is not None and streamer.message is not None:
+                typing = contextlib.nullcontext()
+            else:
+                typing = discord_message.channel.typing()
+            async with typing:
                 try:
-                    model_override = self._get_model_for_channel(channel_id)
-                    chain = self._get_chain_for_channel(channel_id)
                     response = await chain.chat(
                         conversation,
                         model=model_override,
                         tools=TOOL_DEFINITIONS,
                         temperature=self.config.models.temperature,
                         max_tokens=self.config.models.max_tokens,
+                        cache_key=cache_key,
+                        tools_json=TOOL_DEFINITIONS_JSON,
+                        on_delta=streamer.feed if streamer is not None else None,
+                        # Each retry/fallback starts the preview over
+                        on_attempt=streamer.reset if streamer is not None else None,
                     )
                 except Exception as e:
                     logger.error("LLM call failed (round %d): %s", round_num, e)
                     return f"LLM error: {e}"
 
+            self._record_prefix_cache(response.usage)
             assistant_msg = response.message
-            assistant_tokens = count_message_tokens(assistant_msg)
-            await self.store.add_message(channel_id, assistant_msg, token_count=assistant_tokens)
+            assistant_tokens = await count_message_tokens_async(assistant_msg)
             conversation.append(assistant_msg)
 
-            # If no tool calls, check if the model is expressing intent to continue
-            if not response.has_tool_calls:
-                content = (assistant_msg.content or "").lower()
-                continuation_signals = [
-                    "let me ", "now i'll ", "now i will", "i'll create",
-                    "i'll write", "i'll run", "let me create", "let me write",
-                    "let me run", "simultaneously", "i need to", "i'll start",
-                    "now let me", "i have enough", "i have all the",
-                ]
-                is_continuation = any(sig in content for sig in continuation_signals)
-                if is_continuation and round_num < MAX_TOOL_ROUNDS - 2:
-                    logger.info("Round %d: text-only but continuation intent detected, injecting nudge", round_num)
-                    # Nudge the model to actually use tools
-                    nudge = Message(role="user", content="Use your tools now. Do not describe what you'll do — call the tool directly.")
-                    conversation.append(nudge)
-                    await self.store.add_message(channel_id, nudge, token_count=20)
-                    continue
-                return assistant_msg.content or ""
-
-            # Execute tool calls
-            logger.info(
-                "Round %d: %d tool calls",
-                round_num,
-                len(assistant_msg.tool_calls),
-            )
+            # One commit per round: the assistant turn plus every tool result
+            async with self.store.transaction() as tx:
+                tx.add_message(channel_id, assistant_msg, token_count=assistant_tokens)
+
+                # If no tool calls, check if the model is expressing intent to continue
+                if not response.has_tool_calls:
+                    is_continuation = _CONTINUATION_RE.search(assistant_msg.content or "") is not None
+                    if is_continuation and round_num < MAX_TOOL_ROUNDS - 2:
+                        logger.info("Round %d: text-only but continuation intent detected, injecting nudge", round_num)
+                        # Nudge the model to actually use tools
+                        nudge = Message(role="user", content="Use your tools now. Do not describe what you'll do — call the tool directly.")
+                        conversation.append(nudge)
+                        tx.add_message(channel_id, nudge, token_count=20)
+                        continue
+                    return assistant_msg.content or ""
+
+                # Execute tool calls
+                logger.info(
+                    "Round %d: %d tool calls",
+                    round_num,
+                    len(assistant_msg.tool_calls),
+                )
 
-            for tc in assistant_msg.tool_calls:
-                # Check interrupt between tool calls too (don't wait for next round)
+                # Check interrupt before dispatching (don't wait for next round)
                 if channel_id in self._interrupt:
                     keyword = self._interrupt.pop(channel_id)
                     logger.warning("INTERRUPT BUS: stopping mid-tool-execution at round %d (keyword: '%s')", round_num, keyword)
                     return f"[Stopped — received \"{keyword}\"]"
 
-                logger.info("Executing tool: %s(%s)", tc.name, _truncate_args(tc.arguments))
-
-                result = await self.executor.execute(tc.name, tc.arguments)
-
-                # Store tool result
-                tool_msg = Message(
-                    role="tool",
-                    content=result,
-                    tool_call_id=tc.id,
-                    name=tc.name,
-                )
-                tool_tokens = count_message_tokens(tool_msg)
-                await self.store.add_message(channel_id, tool_msg, token_count=tool_tokens)
-                conversation.append(tool_msg)
+                # Tool output is only weighed for compaction, so an estimate
+                # is stored; the compactor recounts exactly near the limit.
+                # An interrupt arriving mid-round stops the remaining calls;
+                # the check at the top of the next round then returns.
+                tool_msgs = await self._execute_tool_calls(assistant_msg.tool_calls, channel_id)
+                for tool_msg in tool_msgs:
+                    tx.add_message(channel_id, tool_msg, token_count=count_message_tokens_approx(tool_msg))
+                    conversation.append(tool_msg)
 
         # Safety: too many rounds
         logger.warning("Agent loop hit max rounds (%d) for %s", MAX_TOOL_ROUNDS, channel_id)
         return "[Agent reached maximum tool-call rounds. Stopping.]"
 
+    async def _execute_tool_calls(
+        self, tool_calls: list[ToolCall], channel_id: str | None = None,
+    ) -> list[Message]:
+        """Run a round's tool calls; results keep call order.
+
+        Calls run concurrently only if every tool in the round is read-only;
+        otherwise they run one at a time in the order the model gave. With a
+        ``channel_id``, the interrupt bus is checked before each sequential
+        call, and calls skipped by a stop get an error result so every
+        tool_call is still answered.
+        """
+        for tc in tool_calls:
+            logger.info("Executing tool: %s(%s)", tc.name, _truncate_args(tc.arguments))
+
+        if all(parallel_safe(tc.name) for tc in tool_calls):
+            results = await asyncio.gather(
+                *(self.executor.execute(tc.name, tc.arguments) for tc in tool_calls),
+                return_exceptions=True,
+            )
+        else:
+            results = []
+            for tc in tool_calls:
+                if channel_id is not None and channel_id in self._interrupt:
+                    logger.warning("INTERRUPT BUS: skipping %s in %s", tc.name, channel_id)
+                    results.append(json.dumps({"error": "stopped"}))
+                    continue
+                try:
+                    results.append(await self.executor.execute(tc.name, tc.arguments))
+                except Exception as e:
+                    results.append(e)
+
+        tool_msgs = []
+        for tc, result in zip(tool_calls, results):
+            if isinstance(result, BaseException):
+                logger.error("Tool %s raised: %s", tc.name, result)
+                result = json.dumps({"error": str(result) or type(result).__name__})
+            tool_msgs.append(Message(
+                role="tool",
+                content=result,
+                tool_call_id=tc.id,
+                name=tc.name,
+            ))
+        return tool_msgs
+
     async def _report_back_to_ava(self, channel_id: str, result_text: str | None):
         """Send completion notification to AVA's channel via webhook AND persist to disk.
 
@@ -644,10 +960,10 @@ class PlugBot:
         Mentions @AVA#5921 so OpenClaw/Mach6 gateway picks it up.
         Also writes report to executives/{role}/reports/ for AVA to read directly.
         """
-        if channel_id not in EXEC_CHANNELS:
+        exec_name = EXEC_CHANNELS.get(channel_id)
+        if exec_name is None:
             return
 
-        exec_name = EXEC_CHANNELS[channel_id]
         summary = (result_text or "[No response text]")[:1500]
 
         # 1) Persist report to disk (AVA can always read these)
@@ -655,18 +971,23 @@ class PlugBot:
 
         # 2) Send webhook notification to AVA's Discord channel
         payload = {
-            "content": f"{AVA_BOT_MENTION} **{exec_name} Task Report**\n\n{summary}",
+            "content": _REPORT_TEMPLATE.format(exec_name=exec_name, summary=summary),
             "username": f"{exec_name} Report",
         }
 
+        if not self._http:
+            return
+
         try:
-            import aiohttp
-            async with aiohttp.ClientSession() as session:
-                async with session.post(AVA_REPORT_WEBHOOK, json=payload) as resp:
-                    if resp.status < 300:
-                        logger.info("Report-back to AVA sent for %s (status %d)", exec_name, resp.status)
-                    else:
-                        logger.warning("Report-back to AVA failed for %s: HTTP %d", exec_name, resp.status)
+            async with self._http.post(
+                AVA_REPORT_WEBHOOK,
+                data=_dumps(payload),
+                headers={"Content-Type": "application/json"},
+            ) as resp:
+                if resp.status < 300:
+                    logger.info("Report-back to AVA sent for %s (status %d)", exec_name, resp.status)
+                else:
+                    logger.warning("Report-back to AVA failed for %s: HTTP %d", exec_name, resp.status)
         except Exception as e:
             logger.error("Report-back to AVA failed: %s", e)
 
@@ -718,7 +1039,9 @@ class PlugBot:
         except Exception as e:
             logger.error("Failed to persist report for %s: %s", exec_name, e)
 
-    async def _build_conversation(self, channel_id: str) -> list[Message]:
+    async def _build_conversation(
+        self, channel_id: str, persona: AgentPersona | None = None,
+    ) -> list[Message]:
         """Build the full conversation for the API call.
 
         Prepends system prompt (from router persona if available), then all active messages.
@@ -727,16 +1050,11 @@ class PlugBot:
         messages: list[Message] = []
 
         # System prompt — use persona-specific if router matches
-        system_prompt = self._system_prompt
-        persona = self.router.route(channel_id) if self.router else None
+        system_msg = self._system_message_for(persona)
+        if system_msg:
+            messages.append(system_msg)
         if persona:
-            persona_prompt = persona.system_prompt
-            if persona_prompt:
-                system_prompt = persona_prompt
-                logger.debug("Using persona %s for channel %s", persona.name, channel_id)
-
-        if system_prompt:
-            messages.append(Message(role="system", content=system_prompt))
+            logger.debug("Using persona %s for channel %s", persona.name, channel_id)
 
         # Session history
         history = await self.store.get_messages(channel_id)
@@ -765,31 +1083,79 @@ class PlugBot:
 
         return messages
 
-    def _get_model_for_channel(self, channel_id: str) -> str | None:
-        """Get the model override for a channel via router persona."""
-        if self.router:
-            persona = self.router.route(channel_id)
-            if persona and persona.model:
-                return persona.model
+    def _system_message_for(self, persona: AgentPersona | None) -> Message | None:
+        """The system Message for a persona (or the default one from start()).
+
+        persona.system_prompt re-reads its workspace files and runs a COMB
+        recall, so the built Message is shared across turns and only
+        rebuilt after SYSTEM_PROMPT_TTL. Callers never mutate it.
+        """
+        if persona is None:
+            return self._system_message
+        now = time.monotonic()
+        cached = self._system_messages.get(persona.name)
+        if cached and cached[0] > now:
+            return cached[1]
+
+        prompt = persona.system_prompt
+        msg = Message(role="system", content=prompt) if prompt else self._system_message
+        self._system_messages[persona.name] = (now + SYSTEM_PROMPT_TTL, msg)
+        return msg
+
+    def _prefix_key(self, channel_id: str, conversation: list[Message]) -> str | None:
+        """Stable prefix-cache key for a channel's conversation.
+
+        Derived from the tool catalog, the system prompt and the channel —
+        the request prefix the provider can reuse — so every turn in a
+        channel lands on the same provider-side cache while that prefix is
+        unchanged. The hash is only recomputed when the prompt changes.
+        """
+        if not self.config.models.prompt_cache:
+            return None
+        system = conversation[0].content if conversation and conversation[0].role == "system" else ""
+        system = system or ""
+        cached = self._prefix_keys.get(channel_id)
+        if cached and cached[0] == system:
+            return cached[1]
+        h = hashlib.blake2b(_TOOLS_DIGEST, digest_size=8)
+        h.update(system.encode())
+        key = f"plug-{h.hexdigest()}-{channel_id}"
+        self._prefix_keys[channel_id] = (system, key)
+        return key
+
+    def _record_prefix_cache(self, usage: dict[str, int]) -> None:
+        """Log how much of each prompt the provider served from its prefix cache."""
+        prompt = usage.get("prompt_tokens", 0)
+        if not prompt:
+            return
+        cached = usage.get("cached_tokens", 0)
+        self._prompt_tokens_seen += prompt
+        self._prompt_tokens_cached += cached
+        logger.debug(
+            "Prefix cache: %d/%d prompt tokens cached (%.0f%% overall)",
+            cached, prompt, 100 * self._prompt_tokens_cached / self._prompt_tokens_seen,
+        )
+
+    def _get_model_for_channel(self, persona: AgentPersona | None) -> str | None:
+        """Get the model override for a channel via its router persona."""
+        if persona and persona.model:
+            return persona.model
         return None
 
-    def _get_chain_for_channel(self, channel_id: str) -> ProviderChain:
+    def _get_chain_for_channel(self, persona: AgentPersona | None) -> ProviderChain:
         """Get a per-persona ProviderChain if persona has a custom base_url."""
-        if self.router:
-            persona = self.router.route(channel_id)
-            if persona and persona.base_url:
-                if persona.name not in self._persona_chains:
-                    from plug.models.proxy import ProxyChatProvider
-                    proxy = ProxyChatProvider(
-                        base_url=persona.base_url,
-                        api_key="n/a",
-                        timeout=120.0,
-                        default_model=persona.model or self.config.models.primary,
-                    )
-                    models = [persona.model or self.config.models.primary] + self.config.models.fallbacks
-                    self._persona_chains[persona.name] = ProviderChain(proxy, models)
-                    logger.info("Created dedicated proxy chain for %s at %s", persona.name, persona.base_url)
-                return self._persona_chains[persona.name]
+        if persona and persona.base_url:
+            if persona.name not in self._persona_chains:
+                proxy = ProxyChatProvider(
+                    base_url=persona.base_url,
+                    api_key="n/a",
+                    timeout=120.0,
+                    default_model=persona.model or self.config.models.primary,
+                )
+                models = [persona.model or self.config.models.primary] + self.config.models.fallbacks
+                self._persona_chains[persona.name] = ProviderChain(proxy, models)
+                logger.info("Created dedicated proxy chain for %s at %s", persona.name, persona.base_url)
+            return self._persona_chains[persona.name]
         return self.chain
 
     # ── Response handling ────────────────────────────────────────────────
@@ -799,24 +1165,28 @@ class PlugBot:
         original: DiscordMessage,
         text: str,
     ) -> None:
-        """Send a response, chunking if necessary. Reply to the original message."""
+        """Send a response, chunking if necessary. Reply to the original message.
+
+        Chunks go out back-to-back; discord.py's HTTP client already waits
+        out per-route rate-limit buckets, and a 429 that still escapes it is
+        retried once after Retry-After by the channel limiter.
+        """
         max_len = self.config.discord.max_message_length
         chunks = chunk_message(text, max_length=max_len)
+        channel_id = str(original.channel.id)
 
         for i, chunk in enumerate(chunks):
             try:
                 if i == 0:
                     # Reply to the original message
-                    await original.reply(chunk, mention_author=False)
+                    await self._send_limiter.send(
+                        channel_id, lambda: original.reply(chunk, mention_author=False),
+                    )
                 else:
                     # Follow-up chunks go to the channel
-                    await original.channel.send(chunk)
-
-                # Small delay between chunks to avoid rate limiting
-                if i < len(chunks) - 1:
-                    await asyncio.sleep(0.5)
+                    await self._send_limiter.send(channel_id, lambda: original.channel.send(chunk))
 
-            except discord.HTTPException as e:
+            except (discord.HTTPException, discord.RateLimited) as e:
                 logger.error("Failed to send chunk %d: %s", i, e)
                 break
 
@@ -824,14 +1194,16 @@ class PlugBot:
 
     def _extract_text(self, message: DiscordMessage) -> str:
         """Extract the user's text, removing the bot mention if present."""
-        text = message.content
-
-        if self.client.user:
-            # Remove <@BOT_ID> and <@!BOT_ID> mentions
-            bot_id = self.client.user.id
-            text = text.replace(f"<@{bot_id}>", "").replace(f"<@!{bot_id}>", "")
-
-        return text.strip()
+        # Remove <@BOT_ID> and <@!BOT_ID> mentions in one pass
+        return self._mention_re.sub("", message.content).strip()
+
+    def _mentions_me(self, message: DiscordMessage) -> bool:
+        """Whether the bot itself is among the message's user mentions."""
+        bot_id = self._bot_user_id
+        for user in message.mentions:
+            if user.id == bot_id:
+                return True
+        return False
 
     # ── Cron & Sub-agent callbacks ───────────────────────────────────────
 
@@ -840,7 +1212,7 @@ class PlugBot:
         if job.payload_kind == "system_event":
             # Inject text as a system message into the channel
             if job.channel_id:
-                await self._deliver_to_channel(job.channel_id, f"⏰ **Cron** `{job.name}`: {job.payload_text}")
+                await self._delivery_queue.put((job.channel_id, f"⏰ **Cron** `{job.name}`: {job.payload_text}"))
             return job.payload_text
 
         elif job.payload_kind == "agent_turn":
@@ -850,7 +1222,7 @@ class PlugBot:
                 channel_id=job.channel_id,
             )
             if job.channel_id:
-                await self._deliver_to_channel(job.channel_id, f"⏰ **Cron** `{job.name}`:\n\n{result}")
+                await self._delivery_queue.put((job.channel_id, f"⏰ **Cron** `{job.name}`:\n\n{result}"))
             return result
 
         return f"Unknown payload kind: {job.payload_kind}"
@@ -862,38 +1234,24 @@ class PlugBot:
         conversation = []
 
         # Use persona-specific system prompt if channel is routed
-        system_prompt = self._system_prompt
-        if channel_id and self.router:
-            persona = self.router.route(channel_id)
-            if persona:
-                persona_prompt = persona.system_prompt
-                if persona_prompt:
-                    system_prompt = persona_prompt
-                    if not model and persona.model:
-                        model = persona.model
-
-        if system_prompt:
-            conversation.append(Message(role="system", content=system_prompt))
+        persona = self.router.route(channel_id) if channel_id and self.router else None
+        if persona and not model and persona.model:
+            model = persona.model
+
+        system_msg = self._system_message_for(persona)
+        if system_msg:
+            conversation.append(system_msg)
         conversation.append(Message(role="user", content=task))
 
+        chain = self._get_subagent_chain(model)
+
         # Run agent loop (reuse the same logic but without Discord message context)
         for round_num in range(MAX_TOOL_ROUNDS):
             try:
-                model_list = [model] if model else [self.config.models.primary] + self.config.models.fallbacks
-                # Build fallback providers for sub-agents too
-                fb = []
-                if self.ollama_provider:
-                    ollama_models = self.config.ollama.models or ["qwen2.5-coder:7b"]
-                    fb.append((self.ollama_provider, ollama_models))
-                chain = ProviderChain(
-                    self.provider, model_list,
-                    fallback_providers=fb,
-                    max_retries=2,
-                    retry_delay=1.0,
-                )
                 response = await chain.chat(
                     conversation,
                     tools=TOOL_DEFINITIONS,
+                    tools_json=TOOL_DEFINITIONS_JSON,
                     temperature=self.config.models.temperature,
                     max_tokens=self.config.models.max_tokens,
                 )
@@ -906,36 +1264,89 @@ class PlugBot:
             if not response.has_tool_calls:
                 return assistant_msg.content or "(no output)"
 
-            for tc in assistant_msg.tool_calls:
-                result = await self.executor.execute(tc.name, tc.arguments)
-                conversation.append(Message(
-                    role="tool", content=result,
-                    tool_call_id=tc.id, name=tc.name,
-                ))
+            conversation.extend(await self._execute_tool_calls(assistant_msg.tool_calls))
 
         return "[Sub-agent reached maximum tool-call rounds]"
 
+    def _get_subagent_chain(self, model: str | None) -> ProviderChain:
+        """Get the (cached) sub-agent ProviderChain for a model override.
+
+        Without an override the main chain already covers the default
+        model list, so it is shared rather than duplicated.
+        """
+        if not model:
+            return self.chain
+        chain = self._subagent_chains.get(model)
+        if chain is None:
+            model_list = [model]
+            # Build fallback providers for sub-agents too
+            fb = []
+            if self.ollama_provider:
+                ollama_models = self.config.ollama.models or ["qwen2.5-coder:7b"]
+                fb.append((self.ollama_provider, ollama_models))
+            chain = ProviderChain(
+                self.provider, model_list,
+                fallback_providers=fb,
+                max_retries=2,
+                retry_delay=1.0,
+            )
+            self._subagent_chains[model] = chain
+        return chain
+
+    async def _drain_deliveries(self) -> None:
+        """Deliver queued cron output, merging runs of same-channel items.
+
+        Everything already waiting is taken at once; consecutive items for
+        one channel go out as a single chunked send.
+        """
+        queue = self._delivery_queue
+        while True:
+            batch = [await queue.get()]
+            while not queue.empty():
+                batch.append(queue.get_nowait())
+
+            i = 0
+            while i < len(batch):
+                channel_id, text = batch[i]
+                parts = [text]
+                i += 1
+                while i < len(batch) and batch[i][0] == channel_id:
+                    parts.append(batch[i][1])
+                    i += 1
+                await self._deliver_to_channel(channel_id, "\n\n".join(parts))
+
+            for _ in batch:
+                queue.task_done()
+
     async def _deliver_to_channel(self, channel_id: str, text: str) -> None:
         """Send a message to a Discord channel by ID."""
         try:
-            channel = self.client.get_channel(int(channel_id))
+            cid = int(channel_id)
+            channel = self._channel_cache.get(cid) or self.client.get_channel(cid)
             if not channel:
-                channel = await self.client.fetch_channel(int(channel_id))
+                # Not in discord.py's cache (e.g. an uncached thread) — one
+                # HTTP fetch, then remembered for later cron fires
+                channel = await self.client.fetch_channel(cid)
             if channel and hasattr(channel, 'send'):
+                self._channel_cache[cid] = channel
                 chunks = chunk_message(text, max_length=self.config.discord.max_message_length)
                 for chunk in chunks:
-                    await channel.send(chunk)
-                    await asyncio.sleep(0.3)
+                    await self._send_limiter.send(channel_id, lambda: channel.send(chunk))
         except Exception as e:
             logger.error("Failed to deliver to channel %s: %s", channel_id, e)
 
 
 def _truncate_args(args: dict[str, Any], max_len: int = 200) -> str:
-    """Truncate tool arguments for logging."""
-    s = json.dumps(args)
-    if len(s) > max_len:
-        return s[:max_len] + "..."
-    return s
+    """Truncate tool arguments for logging.
+
+    Slices the encoded bytes so a large argument (file contents, say) is
+    never decoded past the prefix that is actually logged.
+    """
+    raw = args.encode() if isinstance(args, str) else _dumps(args)
+    if len(raw) > max_len:
+        # "ignore" drops a multi-byte character cut in half by the slice
+        return raw[:max_len].decode("utf-8", "ignore") + "..."
+    return raw.decode()
 
 
 def _sanitize_tool_pairs(messages: list[Message]) -> list[Message]:
@@ -0,0 +1,70 @@
+"""
+Channel Send Pacing
+====================
+
+discord.py already waits out per-route rate-limit buckets inside its HTTP
+client; this only covers what escapes it. When a send to a channel is
+rejected with 429, the channel is held until Discord's Retry-After has
+passed and later sends wait only that long — never a fixed sleep.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from typing import Awaitable, Callable, TypeVar
+
+import discord
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+def _retry_after(exc: discord.HTTPException | discord.RateLimited) -> float | None:
+    """Seconds Discord asked us to wait, or None if this isn't a rate limit."""
+    if isinstance(exc, discord.RateLimited):
+        return exc.retry_after
+    if exc.status != 429:
+        return None
+    headers = getattr(exc.response, "headers", None) or {}
+    try:
+        return float(headers.get("Retry-After", 1.0))
+    except (TypeError, ValueError):
+        return 1.0
+
+
+class ChannelRateLimiter:
+    """Per-channel "next allowed send" times fed by Discord's Retry-After."""
+
+    def __init__(self):
+        self._next_send: dict[str, float] = {}
+
+    async def acquire(self, channel_id: str) -> None:
+        """Wait only if the channel is currently held by a rate limit."""
+        until = self._next_send.get(channel_id)
+        if until is None:
+            return
+        delay = until - time.monotonic()
+        if delay > 0:
+            await asyncio.sleep(delay)
+        else:
+            del self._next_send[channel_id]
+
+    def hold(self, channel_id: str, seconds: float) -> None:
+        self._next_send[channel_id] = time.monotonic() + seconds
+
+    async def send(self, channel_id: str, op: Callable[[], Awaitable[T]]) -> T:
+        """Run a send, retrying once after Retry-After if it was rate limited."""
+        await self.acquire(channel_id)
+        try:
+            return await op()
+        except (discord.HTTPException, discord.RateLimited) as e:
+            retry_after = _retry_after(e)
+            if retry_after is None:
+                raise
+            logger.warning("Rate limited in %s — retrying in %.2fs", channel_id, retry_after)
+            self.hold(channel_id, retry_after)
+        await self.acquire(channel_id)
+        return await op()
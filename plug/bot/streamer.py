@@ -0,0 +1,115 @@
+"""
+Reply Streaming
+================
+
+Show a model's reply in Discord while it is still being generated:
+post a placeholder reply on the first visible text, then edit it in
+place once per interval (or sooner, once enough new text has arrived)
+until the final text is delivered.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+
+import discord
+from discord import Message as DiscordMessage
+
+from plug.bot.chunker import chunk_message
+
+logger = logging.getLogger(__name__)
+
+# Replies the agent uses to stay silent — never flash these in the channel
+_SILENT_REPLIES = ("NO_REPLY", "HEARTBEAT_OK")
+
+
+class ReplyStreamer:
+    """Live-edit a single reply with streamed text deltas.
+
+    ``feed`` is a plain callback for the provider; an edit is due after
+    ``interval`` seconds or ``min_chars`` new characters, whichever comes
+    first. Edits run as background tasks, one at a time, so the stream
+    itself never waits on Discord.
+    """
+
+    def __init__(
+        self,
+        original: DiscordMessage,
+        *,
+        max_length: int = 2000,
+        interval: float = 0.5,
+        min_chars: int = 100,
+    ):
+        self.original = original
+        self.max_length = max_length
+        self.interval = interval
+        self.min_chars = min_chars
+        self.message: DiscordMessage | None = None
+        self._parts: list[str] = []
+        self._last_edit = 0.0
+        self._unshown = 0  # chars received since the last edit was scheduled
+        self._pending: asyncio.Task | None = None
+
+    def reset(self) -> None:
+        """Start a new model turn or attempt; the placeholder (if any) is reused."""
+        self._parts.clear()
+        self._unshown = 0
+
+    def feed(self, delta: str) -> None:
+        """Provider callback: record a text delta and maybe schedule an edit."""
+        self._parts.append(delta)
+        self._unshown += len(delta)
+        if self._pending is not None and not self._pending.done():
+            return
+        now = time.monotonic()
+        if now - self._last_edit < self.interval and self._unshown < self.min_chars:
+            return
+        self._last_edit = now
+        self._unshown = 0
+        self._pending = asyncio.create_task(self._flush())
+
+    async def _flush(self) -> None:
+        text = "".join(self._parts).strip()
+        if not text or any(s.startswith(text) for s in _SILENT_REPLIES):
+            return
+        # Show the tail so the newest tokens stay visible
+        preview = text if len(text) < self.max_length else "…" + text[-(self.max_length - 50):]
+        try:
+            if self.message is None:
+                self.message = await self.original.reply(preview, mention_author=False)
+            else:
+                await self.message.edit(content=preview)
+        except discord.HTTPException as e:
+            logger.debug("Stream edit failed: %s", e)
+
+    async def finish(self, text: str | None) -> bool:
+        """Deliver the final text through the placeholder.
+
+        ``None`` means the agent chose silence, so any placeholder is removed.
+        Returns False if nothing was ever posted — the caller sends normally.
+        """
+        if self._pending is not None:
+            await self._pending
+        if self.message is None:
+            return False
+
+        if text is None:
+            try:
+                await self.message.delete()
+            except discord.HTTPException as e:
+                logger.debug("Failed to delete stream placeholder: %s", e)
+            return True
+
+        chunks = chunk_message(text, max_length=self.max_length)
+        for i, chunk in enumerate(chunks):
+            try:
+                if i == 0:
+                    await self.message.edit(content=chunk)
+                else:
+                    await self.original.channel.send(chunk)
+            except discord.HTTPException as e:
+                logger.error("Failed to send chunk %d: %s", i, e)
+                break
+        return True
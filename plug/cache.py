@@ -0,0 +1,181 @@
+"""
+Response Cache
+===============
+
+Skip the LLM entirely for prompts the bot has already answered.
+
+ExactCache is checked first: a hash lookup for prompts repeated verbatim
+(after case/whitespace normalization). SemanticCache embeds the user's text
+and returns a stored reply when a previous prompt in the same namespace
+(channel) is close enough by cosine similarity. Entries in both expire
+after a TTL so answers don't go stale.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import math
+import time
+from array import array
+from collections import OrderedDict, deque
+from operator import mul
+from typing import Awaitable, Callable
+
+logger = logging.getLogger(__name__)
+
+Embedder = Callable[[list[str]], Awaitable[list[list[float]]]]
+
+# A unit vector quantized to int8 plus the scale that maps it back:
+# component i ≈ codes[i] * scale
+Quantized = tuple[array, float]
+
+
+def _quantize(vector: list[float]) -> Quantized | None:
+    """Unit-normalize a vector and quantize it to symmetric int8.
+
+    One byte per dimension instead of a boxed Python float (~4x smaller
+    than float32, ~30x smaller than a tuple of floats); the rounding
+    error is far below the similarity thresholds the cache works at.
+    """
+    norm = math.sqrt(sum(map(mul, vector, vector)))
+    if not norm:
+        return None
+    peak = max(map(abs, vector)) / norm
+    scale = peak / 127
+    factor = 1.0 / (norm * scale)
+    return array("b", [round(x * factor) for x in vector]), scale
+
+
+class ExactCache:
+    """LRU of replies keyed by namespace plus a hash of the normalized prompt, with TTL."""
+
+    def __init__(self, maxsize: int = 1024, ttl: float = 3600.0):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: OrderedDict[tuple[str, bytes], tuple[float, str]] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def key(namespace: str, text: str, context: str = "") -> tuple[str, bytes]:
+        """The namespace and a truncated SHA-256 of the normalized prompt.
+
+        ``context`` (e.g. the last reply in the channel) is hashed in too, so
+        prompts whose answer depends on the conversation — "yes", "continue"
+        — only hit when the conversation is where it was.
+        """
+        normalized = " ".join(text.lower().split())
+        return namespace, hashlib.sha256(f"{context}\0{normalized}".encode()).digest()[:16]
+
+    def get(self, key: tuple[str, bytes]) -> str | None:
+        entry = self._entries.get(key)
+        if entry is None or entry[0] <= time.time():
+            if entry is not None:
+                del self._entries[key]
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry[1]
+
+    def put(self, key: tuple[str, bytes], reply: str) -> None:
+        self._entries[key] = (time.time() + self.ttl, reply)
+        self._entries.move_to_end(key)
+        if len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def clear(self, namespace: str | None = None) -> None:
+        """Drop one namespace, or everything."""
+        if namespace is None:
+            self._entries.clear()
+            return
+        for key in [k for k in self._entries if k[0] == namespace]:
+            del self._entries[key]
+
+
+class SemanticCache:
+    """Per-namespace nearest-neighbour cache of final replies.
+
+    Vectors are stored unit-normalized and int8-quantized, so similarity
+    is an integer dot product rescaled by the two vectors' scales. Each
+    namespace keeps at most ``max_entries`` (oldest dropped).
+    """
+
+    def __init__(
+        self,
+        embed: Embedder,
+        *,
+        threshold: float = 0.95,
+        ttl: float = 3600.0,
+        max_entries: int = 128,
+    ):
+        self._embed = embed
+        self.threshold = threshold
+        self.ttl = ttl
+        self.max_entries = max_entries
+        # namespace → deque of (expires_at, quantized unit vector, reply)
+        self._entries: dict[str, deque[tuple[float, Quantized, str]]] = {}
+        self.hits = 0
+        self.misses = 0
+
+    async def embed(self, text: str) -> Quantized | None:
+        """Embed text; None if the embedding endpoint is unavailable."""
+        try:
+            vectors = await self._embed([text])
+        except Exception as e:
+            logger.debug("Semantic cache embedding failed: %s", e)
+            return None
+        return _quantize(vectors[0]) if vectors else None
+
+    def _live(self, namespace: str) -> deque | None:
+        entries = self._entries.get(namespace)
+        if entries:
+            now = time.time()
+            while entries and entries[0][0] <= now:
+                entries.popleft()  # oldest first, so expired entries sit at the front
+        return entries
+
+    def has_entries(self, namespace: str) -> bool:
+        """Whether a lookup in this namespace could hit at all."""
+        return bool(self._live(namespace))
+
+    def get(self, namespace: str, vector: Quantized) -> str | None:
+        """Best cached reply at or above the threshold, or None."""
+        entries = self._live(namespace)
+        if not entries:
+            self.misses += 1
+            return None
+
+        codes, scale = vector
+        best_score, best_reply = self.threshold, None
+        for _, (cached, cached_scale), reply in entries:
+            score = sum(map(mul, codes, cached)) * scale * cached_scale
+            if score >= best_score:
+                best_score, best_reply = score, reply
+
+        if best_reply is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+            logger.info("Semantic cache hit in %s (similarity %.3f)", namespace, best_score)
+        return best_reply
+
+    async def remember(self, namespace: str, text: str, reply: str) -> None:
+        """Embed a prompt and store its reply (for use off the hot path)."""
+        vector = await self.embed(text)
+        if vector is not None:
+            self.put(namespace, vector, reply)
+
+    def put(self, namespace: str, vector: Quantized, reply: str) -> None:
+        entries = self._entries.get(namespace)
+        if entries is None:
+            entries = self._entries[namespace] = deque(maxlen=self.max_entries)
+        entries.append((time.time() + self.ttl, vector, reply))
+
+    def clear(self, namespace: str | None = None) -> None:
+        """Drop one namespace, or everything."""
+        if namespace is None:
+            self._entries.clear()
+        else:
+            self._entries.pop(namespace, None)
@@ -7,28 +7,29 @@ Command-line interface for the PLUG Discord AI Gateway.
 
 from __future__ import annotations
 
-import asyncio
-import json
+import functools
+import itertools
 import os
+import re
 import signal
 import sys
 import time
-from datetime import datetime
 from pathlib import Path
+from string import Template
+from typing import TYPE_CHECKING
 
 import click
 
-from plug.config import (
-    CONFIG_DIR,
-    CONFIG_FILE,
-    DB_FILE,
-    LOG_FILE,
-    PID_FILE,
-    PlugConfig,
-    ensure_config_dir,
-    load_config,
+# Only the path constants up front: pydantic (plug.config), plug.daemon
+# (and with it logging), asyncio, sqlite3 and datetime are imported
+# inside the commands that need them, so `--help`, `logs`, `install` etc.
+# start without paying for them.
+from plug.paths import (
+    CONFIG_DIR, CONFIG_FILE, DB_FILE, LOG_FILE, PID_FILE, atomic_write_text, ensure_config_dir,
 )
-from plug.daemon import is_running, read_pidfile, remove_pidfile, run_bot, setup_logging
+
+if TYPE_CHECKING:
+    import sqlite3
 
 
 # ── Branding ─────────────────────────────────────────────────────────────
@@ -84,6 +85,10 @@ def box_bot() -> str:
     return f"{BOX_B}{BOX_H * (W - 2)}{BOX_BR}"
 
 
+_STATUS_TOP = box_top("PLUG Status")
+_HEALTH_TOP = box_top("Health Check")
+
+
 def success(msg: str) -> None:
     click.echo(click.style(f"  ✓ {msg}", fg="green"))
 
@@ -140,6 +145,10 @@ def cli(ctx: click.Context) -> None:
 @click.option("--yes", "-y", is_flag=True, help="Accept defaults, skip prompts.")
 def init(token: str | None, guild: str | None, model: str, proxy: str, workspace: str | None, yes: bool) -> None:
     """First-time setup. Creates ~/.plug/ and config.json."""
+    from pydantic import SecretStr
+
+    from plug.config import load_config
+
     click.echo()
     click.echo(LOGO)
     click.echo(click.style("  First-time setup", fg="cyan", bold=True))
@@ -151,7 +160,7 @@ def init(token: str | None, guild: str | None, model: str, proxy: str, workspace
     # Step 1: Discord token
     click.echo(click.style("  1/5 ", fg="yellow", bold=True) + "Discord Bot Token")
     if token:
-        config.discord.token = token
+        config.discord.token = SecretStr(token)
         success("Token provided via flag")
     elif yes and config.discord.token:
         success("Using existing token")
@@ -160,7 +169,7 @@ def init(token: str | None, guild: str | None, model: str, proxy: str, workspace
         dim("Bot → Token → Copy")
         t = click.prompt("  Token", default="", show_default=False, hide_input=True)
         if t:
-            config.discord.token = t
+            config.discord.token = SecretStr(t)
             success("Token saved")
         elif config.discord.token:
             info("Keeping existing token")
@@ -245,12 +254,14 @@ def _is_termux() -> bool:
     return os.path.isdir("/data/data/com.termux") or "TERMUX_VERSION" in os.environ
 
 
-def _daemonize_fork() -> bool:
+def _daemonize_fork(ready_fd: int) -> bool:
     """Unix double-fork daemon. Returns True in parent, False in child."""
     pid = os.fork()
     if pid > 0:
         return True  # parent
 
+    from plug.daemon import READY_FD_ENV
+    os.environ[READY_FD_ENV] = str(ready_fd)
     os.setsid()
     pid2 = os.fork()
     if pid2 > 0:
@@ -263,9 +274,37 @@ def _daemonize_fork() -> bool:
     return False  # child
 
 
-def _daemonize_subprocess() -> None:
-    """Termux-compatible daemon using subprocess (no fork)."""
+def _daemonize_spawn(debug: bool, ready_fd: int) -> int:
+    """Start `plug start --foreground` detached via posix_spawn. Returns its PID.
+
+    Unlike the double fork, the interpreter heap is never duplicated: the
+    child execs straight into a fresh Python, in its own session, with
+    stdin on /dev/null and stdout/stderr appended to the log.
+    """
+    from plug.daemon import READY_FD_ENV
+    LOG_FILE.parent.mkdir(parents=True, exist_ok=True)
+    argv = [sys.executable, "-m", "plug.cli", "start", "--foreground"]
+    if debug:
+        argv.append("--debug")
+    os.set_inheritable(ready_fd, True)
+    return os.posix_spawn(
+        sys.executable,
+        argv,
+        {**os.environ, READY_FD_ENV: str(ready_fd)},
+        file_actions=[
+            (os.POSIX_SPAWN_OPEN, 0, os.devnull, os.O_RDONLY, 0),
+            (os.POSIX_SPAWN_OPEN, 1, str(LOG_FILE), os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o644),
+            (os.POSIX_SPAWN_DUP2, 1, 2),
+        ],
+        setsid=True,
+    )
+
+
+def _daemonize_subprocess(ready_fd: int) -> int:
+    """Termux-compatible daemon using subprocess (no fork). Returns its PID."""
     import subprocess
+
+    from plug.daemon import READY_FD_ENV
     venv_python = sys.executable
     cmd = [venv_python, "-m", "plug.cli", "start", "--foreground"]
     log_fd = open(LOG_FILE, "a")
@@ -275,19 +314,27 @@ def _daemonize_subprocess() -> None:
         stderr=log_fd,
         stdin=subprocess.DEVNULL,
         start_new_session=True,
+        pass_fds=(ready_fd,),
+        env={**os.environ, READY_FD_ENV: str(ready_fd)},
     )
     # Write PID immediately so status/stop work
     PID_FILE.parent.mkdir(parents=True, exist_ok=True)
-    PID_FILE.write_text(str(proc.pid))
+    atomic_write_text(PID_FILE, str(proc.pid))
+    return proc.pid
 
 
 @cli.command()
 @click.option("--foreground", "-f", is_flag=True, help="Run in foreground (no daemon).")
 @click.option("--debug", is_flag=True, help="Enable debug logging.")
-def start(foreground: bool, debug: bool) -> None:
+@click.option("--no-systemd", is_flag=True, help="Daemonize directly even if plug.service is installed.")
+def start(foreground: bool, debug: bool, no_systemd: bool) -> None:
     """Start the PLUG bot."""
+    from plug.daemon import install_event_loop, is_running, read_pidfile, remove_pidfile, run_bot
+
     if foreground:
+        import asyncio
         click.echo(f"{LOGO_MINI} Starting in foreground...")
+        install_event_loop()
         try:
             asyncio.run(run_bot(debug=debug))
         except KeyboardInterrupt:
@@ -299,32 +346,57 @@ def start(foreground: bool, debug: bool) -> None:
         info(f"Already running (PID {pid})")
         return
 
+    if not no_systemd and _systemd_installed("plug"):
+        # Let systemd own the process: no fork, and it supervises restarts
+        click.echo(f"{LOGO_MINI} Starting plug.service...")
+        if debug:
+            dim("--debug is ignored under systemd (use --no-systemd)")
+        if _systemctl("start", "plug"):
+            success("plug.service started")
+            dim("Logs: journalctl --user -u plug -f")
+        else:
+            fail("plug.service failed to start:")
+            dim("systemctl --user status plug")
+        return
+
     click.echo(f"{LOGO_MINI} Starting daemon...")
 
+    # The daemon writes its startup result to this pipe (notify_ready), so
+    # we return as soon as it's up or has failed instead of sleeping
+    ready_r, ready_w = os.pipe()
+
+    # Termux: no os.fork(), use subprocess detach. Elsewhere posix_spawn
+    # starts a fresh interpreter without copying this one's heap.
+    spawned = True
     if _is_termux():
-        # Termux: no os.fork(), use subprocess detach
-        _daemonize_subprocess()
-        time.sleep(1.5)
-        if is_running():
-            success(f"Running (PID {read_pidfile()})")
-            dim(f"Logs: tail -f {LOG_FILE}")
-        else:
-            fail("Failed to start. Check logs:")
-            dim(f"tail -f {LOG_FILE}")
+        _daemonize_subprocess(ready_w)
+    elif hasattr(os, "posix_spawn"):
+        try:
+            _daemonize_spawn(debug, ready_w)
+        except NotImplementedError:
+            # This libc's posix_spawn can't setsid: fall back to forking
+            # with a fresh pipe
+            spawned = False
+            os.close(ready_r)
+            os.close(ready_w)
+            ready_r, ready_w = os.pipe()
+    else:
+        spawned = False
+    if spawned:
+        os.close(ready_w)
+        _report_start(_await_ready(ready_r))
         return
 
-    # Unix: classic double-fork
-    is_parent = _daemonize_fork()
+    # Other Unix: classic double-fork
+    is_parent = _daemonize_fork(ready_w)
     if is_parent:
-        time.sleep(1.5)
-        if is_running():
-            success(f"Running (PID {read_pidfile()})")
-            dim(f"Logs: tail -f {LOG_FILE}")
-        else:
-            fail("Failed to start. Check logs:")
-            dim(f"tail -f {LOG_FILE}")
+        os.close(ready_w)
+        _report_start(_await_ready(ready_r))
         return
+    os.close(ready_r)
 
+    import asyncio
+    install_event_loop()
     try:
         asyncio.run(run_bot(debug=debug))
     except Exception as e:
@@ -335,9 +407,52 @@ def start(foreground: bool, debug: bool) -> None:
         os._exit(0)
 
 
+def _await_ready(ready_r: int, timeout: float = 15) -> str | None:
+    """Wait for the daemon's startup report on the read end of its pipe.
+
+    Returns what it wrote ("OK" or "ERR:<message>"), "" if it exited
+    without reporting, or None if it is still starting after ``timeout``.
+    """
+    import select
+    try:
+        poller = select.poll()
+        poller.register(ready_r, select.POLLIN)
+        if not poller.poll(timeout * 1000):
+            return None
+        return os.read(ready_r, 512).decode(errors="replace")
+    finally:
+        os.close(ready_r)
+
+
+def _report_start(ready: str | None) -> None:
+    """Print the outcome of a daemonized start from its _await_ready result."""
+    from plug.daemon import is_running, read_pidfile
+
+    if ready == "OK" or (ready is None and is_running()):
+        success(f"Running (PID {read_pidfile()})")
+        dim(f"Logs: tail -f {LOG_FILE}")
+        return
+    fail("Failed to start. Check logs:")
+    if ready and ready.startswith("ERR:"):
+        dim(ready[4:])
+    dim(f"tail -f {LOG_FILE}")
+
+
 @cli.command()
-def stop() -> None:
+@click.option("--no-systemd", is_flag=True, help="Signal the PID directly even if plug.service is active.")
+def stop(no_systemd: bool) -> None:
     """Stop the PLUG bot."""
+    from plug.daemon import read_pidfile, remove_pidfile
+
+    if not no_systemd and _systemd_active("plug"):
+        # Stopping the PID alone would just make systemd restart it
+        click.echo(f"{LOGO_MINI} Stopping plug.service...")
+        if _systemctl("stop", "plug"):
+            success("Stopped.")
+        else:
+            fail("systemctl --user stop plug failed")
+        return
+
     pid = read_pidfile()
     if pid is None:
         info("Not running.")
@@ -346,15 +461,12 @@ def stop() -> None:
     click.echo(f"{LOGO_MINI} Stopping (PID {pid})...")
     try:
         os.kill(pid, signal.SIGTERM)
-        for _ in range(30):
-            time.sleep(0.5)
-            try:
-                os.kill(pid, 0)
-            except ProcessLookupError:
-                remove_pidfile()
-                success("Stopped.")
-                return
+        if _wait_pid(pid, timeout=15):
+            remove_pidfile()
+            success("Stopped.")
+            return
         os.kill(pid, signal.SIGKILL)
+        _wait_pid(pid, timeout=2)
         remove_pidfile()
         success("Killed (SIGKILL).")
     except ProcessLookupError:
@@ -370,6 +482,8 @@ def restart(ctx: click.Context, debug: bool, restart_all: bool) -> None:
     """Restart PLUG. Use --all to restart all services systematically."""
     import subprocess
 
+    from plug.daemon import read_pidfile, remove_pidfile
+
     if not restart_all:
         ctx.invoke(stop)
         time.sleep(1)
@@ -478,68 +592,80 @@ def restart(ctx: click.Context, debug: bool, restart_all: bool) -> None:
 
 # ── plug status ──────────────────────────────────────────────────────────
 
+# Query text lives in constants: the shared connection from _connect_ro
+# keys its prepared-statement cache on the exact SQL string, so repeated
+# calls skip the parse/plan step.
+# Message total from the per-session counters the store's triggers keep,
+# so only the (small) sessions table is read; the COUNT(*) form is for a
+# database not yet migrated by a newer daemon.
+_SQL_COUNTS = "SELECT COUNT(*), COALESCE(SUM(msg_count), 0) FROM sessions"
+_SQL_COUNTS_SCAN = "SELECT (SELECT COUNT(*) FROM sessions), (SELECT COUNT(*) FROM messages)"
+_SQL_CRON_ACTIVE = "SELECT COUNT(*) FROM cron_jobs WHERE enabled = 1"
+
+
 @cli.command()
 def status() -> None:
     """Show PLUG status dashboard."""
+    from plug.config import load_config
+    from plug.daemon import read_pidfile, remove_pidfile
+
     config = load_config()
     pid = read_pidfile()
 
-    click.echo()
-    click.echo(box_top("PLUG Status"))
+    # The whole box is assembled first and written in one go
+    lines = ["", _STATUS_TOP]
 
     # Process
     if pid:
         try:
             os.kill(pid, 0)
-            # Cross-platform uptime: /proc/ on Linux, fallback to psutil or skip
+            # Uptime from /proc on Linux; skipped where there is no /proc
             uptime_str = ""
-            try:
-                create_time = os.path.getctime(f"/proc/{pid}")
-                uptime_s = time.time() - create_time
+            uptime_s = _process_uptime(pid)
+            if uptime_s is not None:
                 h, m = int(uptime_s // 3600), int((uptime_s % 3600) // 60)
                 uptime_str = f", {h}h{m}m"
-            except (FileNotFoundError, OSError):
-                pass  # Termux/macOS: no /proc, skip uptime
-            click.echo(box_row(f"Process:  🟢 Running (PID {pid}{uptime_str})"))
+            lines.append(box_row(f"Process:  🟢 Running (PID {pid}{uptime_str})"))
         except (ProcessLookupError, FileNotFoundError):
-            click.echo(box_row("Process:  🔴 Stale PID (cleaning)"))
+            lines.append(box_row("Process:  🔴 Stale PID (cleaning)"))
             remove_pidfile()
     else:
-        click.echo(box_row("Process:  🔴 Stopped"))
+        lines.append(box_row("Process:  🔴 Stopped"))
 
-    click.echo(box_row(f"Model:    {config.models.primary}"))
-    click.echo(box_row(f"Proxy:    {config.models.proxy.base_url}"))
+    lines.append(box_row(f"Model:    {config.models.primary}"))
+    lines.append(box_row(f"Proxy:    {config.models.proxy.base_url}"))
 
     # Sessions
     if DB_FILE.exists():
         import sqlite3
-        conn = sqlite3.connect(str(DB_FILE))
-        sessions = conn.execute("SELECT COUNT(*) FROM sessions").fetchone()[0]
-        messages = conn.execute("SELECT COUNT(*) FROM messages").fetchone()[0]
-        conn.close()
-        click.echo(box_row(f"Sessions: {sessions} ({messages:,} messages)"))
+        conn = _connect_ro(DB_FILE)
+        try:
+            sessions, messages = conn.execute(_SQL_COUNTS).fetchone()
+        except sqlite3.OperationalError:
+            sessions, messages = conn.execute(_SQL_COUNTS_SCAN).fetchone()
+        lines.append(box_row(f"Sessions: {sessions} ({messages:,} messages)"))
     else:
-        click.echo(box_row("Sessions: 0"))
+        lines.append(box_row("Sessions: 0"))
 
     # Cron
     cron_db = CONFIG_DIR / "cron.db"
     if cron_db.exists():
-        import sqlite3
-        conn = sqlite3.connect(str(cron_db))
         try:
-            jobs = conn.execute("SELECT COUNT(*) FROM cron_jobs WHERE enabled = 1").fetchone()[0]
-            click.echo(box_row(f"Cron:     {jobs} active job(s)"))
+            jobs = _connect_ro(cron_db).execute(_SQL_CRON_ACTIVE).fetchone()[0]
+            lines.append(box_row(f"Cron:     {jobs} active job(s)"))
         except Exception:
-            click.echo(box_row("Cron:     (no table)"))
-        conn.close()
+            lines.append(box_row("Cron:     (no table)"))
     else:
-        click.echo(box_row("Cron:     —"))
-
-    click.echo(box_mid())
-    click.echo(box_row(f"Config:   {CONFIG_FILE}"))
-    click.echo(box_row(f"Logs:     {LOG_FILE}"))
-    click.echo(box_bot())
-    click.echo()
+        lines.append(box_row("Cron:     —"))
+
+    lines += (
+        box_mid(),
+        box_row(f"Config:   {CONFIG_FILE}"),
+        box_row(f"Logs:     {LOG_FILE}"),
+        box_bot(),
+        "",
+    )
+    click.echo("\n".join(lines))
 
 
 # ── plug health ──────────────────────────────────────────────────────────
@@ -547,50 +673,51 @@ def status() -> None:
 @cli.command()
 def health() -> None:
     """Run health checks on all components."""
-    from plug.health import check_once
-
-    click.echo()
-    click.echo(box_top("Health Check"))
-
-    async def _run():
-        config = load_config()
-        proxy_url = config.models.proxy.base_url.replace("/v1", "")
-        statuses = await check_once(proxy_url=proxy_url)
+    import asyncio
 
-        for name, s in sorted(statuses.items()):
-            icon = "🟢" if s.healthy else "🔴"
-            latency = f"  {s.latency_ms:.0f}ms" if s.latency_ms else ""
-            click.echo(box_row(f"{icon} {name:<12} {s.message}{latency}"))
-
-    asyncio.run(_run())
+    from plug.config import load_config
+    from plug.daemon import read_pidfile
+    from plug.health import check_once
 
-    # Bot process
-    pid = read_pidfile()
-    if pid:
+    def bot_row() -> str:
+        pid = read_pidfile()
+        if not pid:
+            return "🔴 bot          not running"
         try:
             os.kill(pid, 0)
-            click.echo(box_row(f"🟢 bot          PID {pid}"))
         except ProcessLookupError:
-            click.echo(box_row("🔴 bot          stale PID"))
-    else:
-        click.echo(box_row("🔴 bot          not running"))
+            return "🔴 bot          stale PID"
+        return f"🟢 bot          PID {pid}"
 
-    # Cron
-    cron_db = CONFIG_DIR / "cron.db"
-    if cron_db.exists():
-        import sqlite3
-        conn = sqlite3.connect(str(cron_db))
+    def cron_row() -> str:
+        cron_db = CONFIG_DIR / "cron.db"
+        if not cron_db.exists():
+            return "⚪ cron         —"
         try:
-            count = conn.execute("SELECT COUNT(*) FROM cron_jobs WHERE enabled = 1").fetchone()[0]
-            click.echo(box_row(f"🟢 cron         {count} job(s)"))
+            count = _connect_ro(cron_db).execute(_SQL_CRON_ACTIVE).fetchone()[0]
+            return f"🟢 cron         {count} job(s)"
         except Exception:
-            click.echo(box_row("⚪ cron         no jobs"))
-        conn.close()
-    else:
-        click.echo(box_row("⚪ cron         —"))
+            return "⚪ cron         no jobs"
 
-    click.echo(box_bot())
-    click.echo()
+    async def _run():
+        # Probes run side by side; the total is the slowest one, not the sum
+        config = load_config()
+        proxy_url = config.models.proxy.base_url.replace("/v1", "")
+        return await asyncio.gather(
+            check_once(proxy_url=proxy_url),
+            asyncio.to_thread(bot_row),
+            asyncio.to_thread(cron_row),
+        )
+
+    statuses, bot_status, cron_status = asyncio.run(_run())
+
+    lines = ["", _HEALTH_TOP]
+    for name, s in sorted(statuses.items()):
+        icon = "🟢" if s.healthy else "🔴"
+        latency = f"  {s.latency_ms:.0f}ms" if s.latency_ms else ""
+        lines.append(box_row(f"{icon} {name:<12} {s.message}{latency}"))
+    lines += (box_row(bot_status), box_row(cron_status), box_bot(), "")
+    click.echo("\n".join(lines))
 
 
 # ── plug logs ────────────────────────────────────────────────────────────
@@ -623,15 +750,11 @@ def config(ctx: click.Context) -> None:
 @config.command("show")
 def config_show() -> None:
     """Show current config (secrets masked)."""
-    cfg = load_config()
-    data = cfg.model_dump()
-
-    if data.get("discord", {}).get("token"):
-        data["discord"]["token"] = _mask(data["discord"]["token"])
-    if data.get("models", {}).get("proxy", {}).get("api_key"):
-        data["models"]["proxy"]["api_key"] = _mask(data["models"]["proxy"]["api_key"])
+    from plug.config import load_config
 
-    click.echo(json.dumps(data, indent=2, default=str))
+    # Serialized in one pass by pydantic-core; secrets are SecretStr, which
+    # serializes masked
+    click.echo(load_config().model_dump_json(indent=2))
 
 
 @config.command("set")
@@ -639,6 +762,8 @@ def config_show() -> None:
 @click.argument("value")
 def config_set(key: str, value: str) -> None:
     """Set a config value. Use dot notation: discord.token, models.primary, etc."""
+    from plug.config import PlugConfig, load_config
+
     cfg = load_config()
     data = cfg.model_dump()
 
@@ -680,6 +805,31 @@ def config_path() -> None:
 
 # ── plug sessions ────────────────────────────────────────────────────────
 
+# Counters kept on the sessions row by the store's triggers
+_SQL_SESSIONS = (
+    "SELECT channel_id, updated_at, msg_count, token_sum AS tokens"
+    " FROM sessions ORDER BY updated_at DESC"
+)
+# Same, for a database not yet migrated by a newer daemon: one correlated
+# lookup per session on idx_messages_channel instead of joining and
+# grouping the whole messages table
+_SQL_SESSIONS_SCAN = (
+    "SELECT channel_id, updated_at,"
+    " (SELECT COUNT(*) FROM messages m WHERE m.channel_id = s.channel_id) AS msg_count,"
+    " (SELECT COALESCE(SUM(token_count), 0) FROM messages m"
+    " WHERE m.channel_id = s.channel_id) AS tokens"
+    " FROM sessions s ORDER BY updated_at DESC"
+)
+# The newest `limit` rows off the (channel_id, id) index, handed back
+# oldest-first by SQLite rather than reversed here
+_SQL_SESSION_TAIL = (
+    "SELECT role, name, content, timestamp FROM ("
+    "SELECT id, role, name, content, timestamp FROM messages"
+    " WHERE channel_id = ? ORDER BY id DESC LIMIT ?"
+    ") ORDER BY id ASC"
+)
+
+
 @cli.group()
 def sessions() -> None:
     """Manage conversation sessions."""
@@ -694,31 +844,26 @@ def sessions_list_cmd() -> None:
         return
 
     import sqlite3
-    conn = sqlite3.connect(str(DB_FILE))
-    conn.row_factory = sqlite3.Row
-    rows = conn.execute("""
-        SELECT s.channel_id, s.created_at, s.updated_at,
-               COUNT(m.id) as msg_count,
-               COALESCE(SUM(m.token_count), 0) as tokens
-        FROM sessions s
-        LEFT JOIN messages m ON m.channel_id = s.channel_id
-        GROUP BY s.channel_id
-        ORDER BY s.updated_at DESC
-    """).fetchall()
-    conn.close()
-
-    if not rows:
+    conn = _connect_ro(DB_FILE)
+    try:
+        rows = conn.execute(_SQL_SESSIONS)
+    except sqlite3.OperationalError:
+        rows = conn.execute(_SQL_SESSIONS_SCAN)
+
+    # Rows are formatted straight off the cursor, never materialized, and
+    # the table goes out in one write
+    first = rows.fetchone()
+    if first is None:
         info("No sessions.")
         return
 
-    click.echo()
-    click.echo(box_top("Sessions"))
-    for r in rows:
-        updated = datetime.fromtimestamp(r["updated_at"]).strftime("%m/%d %H:%M") if r["updated_at"] else "—"
+    lines = ["", box_top("Sessions")]
+    for r in itertools.chain((first,), rows):
+        updated = time.strftime("%m/%d %H:%M", time.localtime(r["updated_at"])) if r["updated_at"] else "—"
         tokens = f"{r['tokens']:,}t" if r["tokens"] else "0t"
-        click.echo(box_row(f"{r['channel_id'][:16]}  {r['msg_count']:>4} msgs  {tokens:>8}  {updated}"))
-    click.echo(box_bot())
-    click.echo()
+        lines.append(box_row(f"{r['channel_id'][:16]}  {r['msg_count']:>4} msgs  {tokens:>8}  {updated}"))
+    lines += (box_bot(), "")
+    click.echo("\n".join(lines))
 
 
 @sessions.command("view")
@@ -730,25 +875,22 @@ def sessions_view(channel_id: str, limit: int) -> None:
         info("No sessions database.")
         return
 
-    import sqlite3
-    conn = sqlite3.connect(str(DB_FILE))
-    conn.row_factory = sqlite3.Row
-    rows = conn.execute("""
-        SELECT role, name, content, timestamp FROM messages
-        WHERE channel_id = ? ORDER BY timestamp DESC LIMIT ?
-    """, (channel_id, limit)).fetchall()
-    conn.close()
-
-    if not rows:
+    # Streamed off the cursor as plain tuples: no fetchall() of the whole
+    # tail and no sqlite3.Row per message, only the formatted lines are kept
+    cur = _connect_ro(DB_FILE).cursor()
+    cur.row_factory = None
+    cur.execute(_SQL_SESSION_TAIL, (channel_id, limit))
+    first = cur.fetchone()
+    if first is None:
         info(f"No messages for {channel_id}")
         return
 
-    for r in reversed(rows):
-        ts = datetime.fromtimestamp(r["timestamp"]).strftime("%H:%M:%S")
-        role = r["role"].upper()
-        name = f" ({r['name']})" if r["name"] else ""
-        content = (r["content"] or "")[:200]
-        click.echo(f"  [{ts}] {role}{name}: {content}")
+    lines = []
+    for role, name, content, timestamp in itertools.chain((first,), cur):
+        ts = time.strftime("%H:%M:%S", time.localtime(timestamp))
+        name = f" ({name})" if name else ""
+        lines.append(f"  [{ts}] {role.upper()}{name}: {(content or '')[:200]}")
+    click.echo("\n".join(lines))
 
 
 @sessions.command("clear")
@@ -761,27 +903,38 @@ def sessions_clear(channel_id: str | None, clear_all: bool) -> None:
         info("No sessions database.")
         return
 
+    if not (clear_all or channel_id):
+        fail("Specify a channel ID or use --all.")
+        return
+
     import sqlite3
-    conn = sqlite3.connect(str(DB_FILE))
+    # One explicit write transaction; in WAL, synchronous=NORMAL commits
+    # without an fsync. Sessions go first so the per-message counter
+    # trigger finds no row left to update.
+    conn = sqlite3.connect(str(DB_FILE), isolation_level=None)
+    conn.execute("PRAGMA busy_timeout=5000")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    where, params = ("", ()) if clear_all else (" WHERE channel_id = ?", (channel_id,))
+    try:
+        with conn:
+            conn.execute("BEGIN IMMEDIATE")
+            conn.execute("DELETE FROM sessions" + where, params)
+            conn.execute("DELETE FROM messages" + where, params)
+    finally:
+        conn.close()
 
     if clear_all:
-        conn.execute("DELETE FROM messages")
-        conn.execute("DELETE FROM sessions")
-        conn.commit()
         success("All sessions cleared.")
-    elif channel_id:
-        conn.execute("DELETE FROM messages WHERE channel_id = ?", (channel_id,))
-        conn.execute("DELETE FROM sessions WHERE channel_id = ?", (channel_id,))
-        conn.commit()
-        success(f"Session {channel_id} cleared.")
     else:
-        fail("Specify a channel ID or use --all.")
-
-    conn.close()
+        success(f"Session {channel_id} cleared.")
 
 
 # ── plug cron ────────────────────────────────────────────────────────────
 
+_SQL_CRON_LIST = "SELECT id, name, enabled, schedule_kind, next_run FROM cron_jobs ORDER BY name"
+_SQL_CRON_BY_NAME = "SELECT id FROM cron_jobs WHERE name = ?"
+
+
 @cli.group()
 def cron() -> None:
     """Manage scheduled jobs."""
@@ -796,33 +949,37 @@ def cron_list() -> None:
         info("No cron jobs.")
         return
 
-    import sqlite3
-    conn = sqlite3.connect(str(cron_db))
-    conn.row_factory = sqlite3.Row
+    conn = _connect_ro(cron_db)
     try:
-        rows = conn.execute("SELECT * FROM cron_jobs ORDER BY name").fetchall()
+        rows = conn.execute(_SQL_CRON_LIST)
     except Exception:
         info("No cron table.")
-        conn.close()
         return
-    conn.close()
 
-    if not rows:
+    # Rows are formatted straight off the cursor, never materialized, and
+    # the table goes out in one write
+    first = rows.fetchone()
+    if first is None:
         info("No cron jobs.")
         return
 
-    click.echo()
-    click.echo(box_top("Cron Jobs"))
-    for r in rows:
+    lines = ["", box_top("Cron Jobs")]
+    for r in itertools.chain((first,), rows):
         status_icon = "🟢" if r["enabled"] else "⚪"
         name = r["name"] or r["id"][:8]
         kind = r["schedule_kind"]
         next_run = ""
         if r["next_run"]:
-            next_run = datetime.fromtimestamp(r["next_run"]).strftime("%m/%d %H:%M")
-        click.echo(box_row(f"{status_icon} {name:<16} {kind:<6} next: {next_run}"))
-    click.echo(box_bot())
-    click.echo()
+            next_run = time.strftime("%m/%d %H:%M", time.localtime(r["next_run"]))
+        lines.append(box_row(f"{status_icon} {name:<16} {kind:<6} next: {next_run}"))
+    lines += (box_bot(), "")
+    click.echo("\n".join(lines))
+
+
+# "30m" / "1h" intervals, or anything with a space as a cron expression;
+# everything else is tried as an ISO timestamp
+_SCHEDULE_RE = re.compile(r"(?P<every>\d+)(?P<unit>[mh])|(?P<cron>.* .*)")
+_UNIT_MS = {"m": 60_000, "h": 3_600_000}
 
 
 @cron.command("add")
@@ -834,15 +991,16 @@ def cron_list() -> None:
 @click.option("--model", "-m", help="Model override for agent turns.")
 def cron_add(name: str, schedule: str, text: str, channel: str, agent: bool, model: str) -> None:
     """Add a cron job."""
+    import asyncio
+    from datetime import datetime
+
     from plug.cron.scheduler import CronStore, make_job
 
-    if schedule.endswith("m") and schedule[:-1].isdigit():
-        kind, every_ms = "every", int(schedule[:-1]) * 60_000
-        cron_expr, at_time = None, None
-    elif schedule.endswith("h") and schedule[:-1].isdigit():
-        kind, every_ms = "every", int(schedule[:-1]) * 3_600_000
+    m = _SCHEDULE_RE.fullmatch(schedule)
+    if m and m["every"]:
+        kind, every_ms = "every", int(m["every"]) * _UNIT_MS[m["unit"]]
         cron_expr, at_time = None, None
-    elif " " in schedule:
+    elif m:
         kind, cron_expr = "cron", schedule
         every_ms, at_time = None, None
     else:
@@ -868,7 +1026,7 @@ def cron_add(name: str, schedule: str, text: str, channel: str, agent: bool, mod
         await store.close()
         success(f"Job '{name}' added ({kind})")
         if job.next_run:
-            dim(f"Next run: {datetime.fromtimestamp(job.next_run).strftime('%Y-%m-%d %H:%M:%S')}")
+            dim(f"Next run: {time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(job.next_run))}")
 
     asyncio.run(_add())
 
@@ -877,16 +1035,15 @@ def cron_add(name: str, schedule: str, text: str, channel: str, agent: bool, mod
 @click.argument("job_id")
 def cron_remove(job_id: str) -> None:
     """Remove a cron job by ID or name."""
+    import asyncio
+
     async def _remove():
         from plug.cron.scheduler import CronStore
         store = CronStore(CONFIG_DIR / "cron.db")
         await store.open()
         removed = await store.remove(job_id)
         if not removed:
-            import sqlite3
-            conn = sqlite3.connect(str(CONFIG_DIR / "cron.db"))
-            row = conn.execute("SELECT id FROM cron_jobs WHERE name = ?", (job_id,)).fetchone()
-            conn.close()
+            row = _connect_ro(CONFIG_DIR / "cron.db").execute(_SQL_CRON_BY_NAME, (job_id,)).fetchone()
             if row:
                 removed = await store.remove(row[0])
         await store.close()
@@ -903,6 +1060,8 @@ def cron_remove(job_id: str) -> None:
 @click.option("--limit", "-n", default=10)
 def cron_runs(job_id: str, limit: int) -> None:
     """Show run history for a job."""
+    import asyncio
+
     async def _runs():
         from plug.cron.scheduler import CronStore
         store = CronStore(CONFIG_DIR / "cron.db")
@@ -914,43 +1073,31 @@ def cron_runs(job_id: str, limit: int) -> None:
             info("No runs.")
             return
 
+        lines = []
         for r in runs:
-            ts = datetime.fromtimestamp(r["started_at"]).strftime("%m/%d %H:%M:%S")
+            ts = time.strftime("%m/%d %H:%M:%S", time.localtime(r["started_at"]))
             icon = "✓" if r["status"] == "ok" else "✗"
             err = f"  {r['error']}" if r.get("error") else ""
-            click.echo(f"  {icon} [{ts}] {r['status']}{err}")
+            lines.append(f"  {icon} [{ts}] {r['status']}{err}")
+        click.echo("\n".join(lines))
 
     asyncio.run(_runs())
 
 
 # ── plug install / uninstall ─────────────────────────────────────────────
 
-@cli.command()
-@click.option("--with-proxy", is_flag=True, help="Also install copilot-proxy service.")
-def install(with_proxy: bool) -> None:
-    """Install PLUG as a systemd/Termux service."""
-    if _is_termux():
-        _install_termux(with_proxy)
-        return
-
-    service_dir = Path.home() / ".config" / "systemd" / "user"
-    service_dir.mkdir(parents=True, exist_ok=True)
-
-    python_path = sys.executable
-    plug_path = Path(__file__).resolve().parent.parent
-
-    bot_unit = f"""\
+# systemd user units. $proxy_deps is empty unless --with-proxy, so the bot
+# unit carries no blank placeholder lines without it.
+_BOT_UNIT = Template("""\
 [Unit]
 Description=PLUG Discord AI Gateway
 After=network-online.target
 Wants=network-online.target
-{f"Requires=plug-proxy.service" if with_proxy else ""}
-{f"After=plug-proxy.service" if with_proxy else ""}
-
+${proxy_deps}
 [Service]
 Type=simple
-ExecStart={python_path} -m plug start --foreground
-WorkingDirectory={plug_path}
+ExecStart=${python_path} -m plug start --foreground
+WorkingDirectory=${plug_path}
 Restart=always
 RestartSec=5
 StartLimitIntervalSec=300
@@ -964,21 +1111,19 @@ PrivateTmp=yes
 
 [Install]
 WantedBy=default.target
-"""
-    (service_dir / "plug.service").write_text(bot_unit)
-    success("plug.service installed")
+""")
 
-    if with_proxy:
-        proxy_script = plug_path / "copilot_proxy.py"
-        proxy_unit = f"""\
+_PROXY_DEPS = "Requires=plug-proxy.service\nAfter=plug-proxy.service\n"
+
+_PROXY_UNIT = Template("""\
 [Unit]
 Description=PLUG Copilot Proxy
 After=network-online.target
 
 [Service]
 Type=simple
-ExecStart={python_path} {proxy_script}
-WorkingDirectory={plug_path}
+ExecStart=${python_path} ${proxy_script}
+WorkingDirectory=${plug_path}
 Restart=always
 RestartSec=5
 StartLimitIntervalSec=300
@@ -992,8 +1137,38 @@ PrivateTmp=yes
 
 [Install]
 WantedBy=default.target
-"""
-        (service_dir / "plug-proxy.service").write_text(proxy_unit)
+""")
+
+
+@cli.command()
+@click.option("--with-proxy", is_flag=True, help="Also install copilot-proxy service.")
+def install(with_proxy: bool) -> None:
+    """Install PLUG as a systemd/Termux service."""
+    if _is_termux():
+        _install_termux(with_proxy)
+        return
+
+    service_dir = Path.home() / ".config" / "systemd" / "user"
+    service_dir.mkdir(parents=True, exist_ok=True)
+
+    python_path = sys.executable
+    plug_path = Path(__file__).resolve().parent.parent
+
+    bot_unit = _BOT_UNIT.substitute(
+        python_path=python_path,
+        plug_path=plug_path,
+        proxy_deps=_PROXY_DEPS if with_proxy else "",
+    )
+    atomic_write_text(service_dir / "plug.service", bot_unit)
+    success("plug.service installed")
+
+    if with_proxy:
+        proxy_unit = _PROXY_UNIT.substitute(
+            python_path=python_path,
+            plug_path=plug_path,
+            proxy_script=plug_path / "copilot_proxy.py",
+        )
+        atomic_write_text(service_dir / "plug-proxy.service", proxy_unit)
         success("plug-proxy.service installed")
 
     click.echo()
@@ -1044,7 +1219,7 @@ cd {plug_path}
 {python_path} -m plug start --foreground >> ~/.plug/plug.log 2>&1 &
 """
     bot_file = boot_dir / "plug-bot.sh"
-    bot_file.write_text(bot_script)
+    atomic_write_text(bot_file, bot_script)
     os.chmod(bot_file, 0o755)
     success("plug-bot.sh installed to ~/.termux/boot/")
 
@@ -1056,7 +1231,7 @@ cd {plug_path}
 {python_path} {proxy_script_path} >> ~/.plug/proxy.log 2>&1 &
 """
         proxy_file = boot_dir / "plug-proxy.sh"
-        proxy_file.write_text(proxy_script)
+        atomic_write_text(proxy_file, proxy_script)
         os.chmod(proxy_file, 0o755)
         success("plug-proxy.sh installed to ~/.termux/boot/")
 
@@ -1080,10 +1255,28 @@ def _uninstall_termux() -> None:
         info("No Termux boot scripts installed.")
 
 
-def _mask(secret: str, show: int = 4) -> str:
-    if len(secret) <= show:
-        return "***"
-    return "***" + secret[-show:]
+@functools.lru_cache(maxsize=None)
+def _connect_ro(path: Path) -> sqlite3.Connection:
+    """Read-only connection to a SQLite database, shared per path.
+
+    A ``mode=ro`` connection never takes a write lock, so `plug status` and
+    friends can't stall the running daemon (which keeps its databases in
+    WAL); pages are read through mmap rather than pread. The connection is
+    reused for the rest of the process (schema parsed once, page cache and
+    prepared statements kept warm) and closed at exit. Rows come back as
+    ``sqlite3.Row``.
+    """
+    import atexit
+    import sqlite3
+    # Not thread-bound: `plug health` queries it from a worker thread
+    conn = sqlite3.connect(
+        path.resolve().as_uri() + "?mode=ro", uri=True, check_same_thread=False, cached_statements=32,
+    )
+    conn.row_factory = sqlite3.Row
+    conn.execute("PRAGMA query_only=1")
+    conn.execute("PRAGMA mmap_size=134217728")
+    atexit.register(conn.close)
+    return conn
 
 
 def _systemd_active(unit: str) -> bool:
@@ -1098,6 +1291,50 @@ def _systemd_active(unit: str) -> bool:
     return result.stdout.strip() == "active"
 
 
+def _systemd_installed(unit: str) -> bool:
+    """Check if a systemd user unit file has been installed (see `plug install`)."""
+    if _is_termux():
+        return False
+    return (Path.home() / ".config" / "systemd" / "user" / f"{unit}.service").exists()
+
+
+def _systemctl(action: str, unit: str) -> bool:
+    """Run `systemctl --user <action> <unit>`. Returns True on success."""
+    import subprocess
+    result = subprocess.run(
+        ["systemctl", "--user", action, unit],
+        capture_output=True, text=True,
+    )
+    return result.returncode == 0
+
+
+def _process_uptime(pid: int) -> float | None:
+    """Seconds since a process started, from /proc; None without /proc.
+
+    Uses the start time in /proc/<pid>/stat (field 22, clock ticks after
+    boot) against /proc/uptime — the ctime of /proc/<pid> is only when
+    that directory was first looked at, not when the process started.
+    """
+    try:
+        stat = _read_proc(f"/proc/{pid}/stat")
+        since_boot = float(_read_proc("/proc/uptime").split()[0])
+        # Fields after the parenthesised command name start at field 3
+        # (the name itself may contain spaces, so split after it)
+        start_ticks = int(stat[stat.rindex(b")") + 2:].split()[19])
+        return since_boot - start_ticks / os.sysconf("SC_CLK_TCK")
+    except (OSError, ValueError, IndexError):
+        return None  # Termux/macOS: no /proc, skip uptime
+
+
+def _read_proc(path: str) -> bytes:
+    """One unbuffered read of a small /proc file — no BufferedReader/decode."""
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        return os.read(fd, 1024)
+    finally:
+        os.close(fd)
+
+
 def _find_pids(name: str) -> list[int]:
     """Find PIDs matching a process name pattern."""
     import subprocess
@@ -1114,15 +1351,46 @@ def _find_pids(name: str) -> list[int]:
     return pids
 
 
-def _wait_pid(pid: int, timeout: int = 15) -> bool:
-    """Wait for a PID to exit. Returns True if exited, False if timed out."""
-    for _ in range(timeout * 2):
+def _wait_pid(pid: int, timeout: float = 15) -> bool:
+    """Wait for a PID to exit. Returns True if exited, False if timed out.
+
+    Blocks on a pidfd (Linux 5.3+), which becomes readable the moment the
+    process exits; elsewhere falls back to probing with signal 0.
+    """
+    import select
+    try:
+        pidfd = os.pidfd_open(pid)
+    except ProcessLookupError:
+        return True
+    except (AttributeError, OSError):
+        return _probe_pid(pid, timeout)
+    try:
+        poller = select.poll()
+        poller.register(pidfd, select.POLLIN)
+        if not poller.poll(timeout * 1000):
+            return False
+        # Reap it if it was our own child (e.g. a bot that died right after
+        # `plug start` spawned it), so no zombie lingers
+        try:
+            os.waitid(os.P_PIDFD, pidfd, os.WEXITED | os.WNOHANG)
+        except (ChildProcessError, AttributeError, OSError):
+            pass  # not our child — its parent reaps it
+        return True
+    finally:
+        os.close(pidfd)
+
+
+def _probe_pid(pid: int, timeout: float) -> bool:
+    """_wait_pid fallback for platforms without pidfd_open."""
+    deadline = time.monotonic() + timeout
+    while True:
         try:
             os.kill(pid, 0)
-            time.sleep(0.5)
         except ProcessLookupError:
             return True
-    return False
+        if time.monotonic() >= deadline:
+            return False
+        time.sleep(0.5)
 
 
 def main() -> None:
@@ -8,25 +8,44 @@ Reads from ~/.plug/config.json.
 
 from __future__ import annotations
 
+import functools
 import json
 import logging
-import os
 from pathlib import Path
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, SecretStr, ValidationError
+
+from plug.paths import (  # noqa: F401 — re-exported
+    CONFIG_DIR,
+    CONFIG_FILE,
+    DB_FILE,
+    LOG_FILE,
+    PID_FILE,
+    atomic_write_text,
+    ensure_config_dir,
+)
+
+try:
+    import orjson
+except ImportError:  # optional speedup — stdlib json works everywhere
+    orjson = None
+
+# Both accept the raw bytes of the file
+_loads = orjson.loads if orjson is not None else json.loads
 
 logger = logging.getLogger(__name__)
 
-CONFIG_DIR = Path(os.environ.get("PLUG_HOME", str(Path.home() / ".plug")))
-CONFIG_FILE = CONFIG_DIR / "config.json"
-DB_FILE = CONFIG_DIR / "sessions.db"
-PID_FILE = CONFIG_DIR / "plug.pid"
-LOG_FILE = CONFIG_DIR / "plug.log"
+
+def _reveal(value: object) -> str:
+    """json.dumps fallback for save(): secrets go to disk unmasked."""
+    if isinstance(value, SecretStr):
+        return value.get_secret_value()
+    return str(value)
 
 
 class ProxyConfig(BaseModel):
     base_url: str = "http://localhost:3000/v1"
-    api_key: str = "n/a"
+    api_key: SecretStr = SecretStr("n/a")
     timeout: float = 120.0
 
 
@@ -36,10 +55,11 @@ class ModelsConfig(BaseModel):
     proxy: ProxyConfig = Field(default_factory=ProxyConfig)
     temperature: float = 0.7
     max_tokens: int = 4096
+    prompt_cache: bool = True  # send a per-channel prefix-cache key with chat requests
 
 
 class DiscordConfig(BaseModel):
-    token: str = ""
+    token: SecretStr = SecretStr("")  # str() and dumps show "**********"
     guild_ids: list[str] = Field(default_factory=lambda: ["1326925607589642352"])
     bot_user_id: str = "1459121107641569291"
     require_mention: bool = True
@@ -50,6 +70,9 @@ class DiscordConfig(BaseModel):
     strict_mention_channels: list[str] = Field(default_factory=list)  # Channel IDs where even owners/sisters must @mention
     status_message: str = "\U0001f52e PLUG Online"
     max_message_length: int = 2000
+    stream_replies: bool = True  # live-edit replies while the model is still generating
+    stream_edit_interval: float = 0.5  # seconds between streamed edits...
+    stream_edit_chars: int = 100  # ...or sooner once this many new chars arrive
     reconnect_delay: float = 5.0
     max_reconnect_delay: float = 300.0
 
@@ -61,6 +84,7 @@ class AgentConfig(BaseModel):
     ])
     exec_timeout: int = 30
     exec_max_output: int = 50_000
+    max_parallel_tools: int = 8  # tool calls in flight at once (read-only rounds run concurrently)
 
 
 class OllamaConfig(BaseModel):
@@ -83,6 +107,34 @@ class DaemonConfig(BaseModel):
     restart_window: int = 300
 
 
+class CacheConfig(BaseModel):
+    exact_enabled: bool = False  # reuse replies to verbatim-repeated prompts
+    exact_maxsize: int = 1024
+    semantic_enabled: bool = False  # reuse replies to near-duplicate prompts (needs /embeddings)
+    threshold: float = 0.95  # min cosine similarity for a semantic hit
+    ttl: float = 3600.0  # seconds a cached reply stays valid (both caches)
+    max_entries: int = 128  # per channel
+    embedding_model: str = "text-embedding-3-small"
+
+
+class PersonaConfig(BaseModel):
+    name: str
+    channel_ids: list[str] = Field(default_factory=list)
+    workspace: str
+    system_prompt_files: list[str] = Field(default_factory=lambda: ["AGENTS.md"])
+    model: str | None = None  # None = use default
+    base_url: str | None = None  # None = use default proxy
+    temperature: float = 0.5
+    max_tokens: int = 4096
+    require_mention: bool | None = None  # None = use global config default
+    authorized_users: list[str] | None = None  # None = use global config
+
+
+class RouterConfig(BaseModel):
+    personas: list[PersonaConfig] = Field(default_factory=list)
+    default_persona: str | None = None
+
+
 class PlugConfig(BaseModel):
     model_config = {"extra": "allow"}
     models: ModelsConfig = Field(default_factory=ModelsConfig)
@@ -91,26 +143,39 @@ class PlugConfig(BaseModel):
     agent: AgentConfig = Field(default_factory=AgentConfig)
     compaction: CompactionConfig = Field(default_factory=CompactionConfig)
     daemon: DaemonConfig = Field(default_factory=DaemonConfig)
+    cache: CacheConfig = Field(default_factory=CacheConfig)
+    router: RouterConfig | None = None  # channel → persona routing (multi-agent)
 
     def save(self) -> None:
         CONFIG_DIR.mkdir(parents=True, exist_ok=True)
-        CONFIG_FILE.write_text(json.dumps(self.model_dump(), indent=2, default=str))
+        atomic_write_text(CONFIG_FILE, json.dumps(self.model_dump(), indent=2, default=_reveal))
+        load_config.cache_clear()
         logger.info("Config saved to %s", CONFIG_FILE)
 
     @classmethod
     def load(cls) -> PlugConfig:
         if CONFIG_FILE.exists():
             try:
-                return cls(**json.loads(CONFIG_FILE.read_text()))
+                data = _loads(CONFIG_FILE.read_bytes())
+                try:
+                    return cls(**data)
+                except ValidationError as e:
+                    # A bad router section only disables routing; it must not
+                    # throw away the token, proxy and models with it
+                    if not all(err["loc"][:1] == ("router",) for err in e.errors()):
+                        raise
+                    logger.warning("Invalid router config, routing disabled: %s", e)
+                    return cls(**{**data, "router": None})
             except Exception as e:
                 logger.warning("Config parse error, using defaults: %s", e)
         return cls()
 
 
+@functools.lru_cache(maxsize=1)
 def load_config() -> PlugConfig:
-    return PlugConfig.load()
-
+    """The parsed config, read and validated once per process.
 
-def ensure_config_dir() -> Path:
-    CONFIG_DIR.mkdir(parents=True, exist_ok=True)
-    return CONFIG_DIR
+    Callers share the returned instance; ``PlugConfig.save`` clears the
+    cache so the next call sees what was written.
+    """
+    return PlugConfig.load()
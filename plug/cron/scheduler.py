@@ -152,6 +152,9 @@ class CronStore:
         self._db = await aiosqlite.connect(self.db_path)
         await self._db.execute("PRAGMA journal_mode=WAL")
         await self._db.execute("PRAGMA foreign_keys=ON")
+        await self._db.execute("PRAGMA busy_timeout=5000")
+        await self._db.execute("PRAGMA synchronous=NORMAL")
+        await self._db.execute("PRAGMA temp_store=MEMORY")
         await self._db.executescript("""
             CREATE TABLE IF NOT EXISTS cron_jobs (
                 id              TEXT PRIMARY KEY,
@@ -192,6 +195,7 @@ class CronStore:
     
     async def close(self):
         if self._db:
+            await self._db.execute("PRAGMA optimize")
             await self._db.close()
     
     async def add(self, job: CronJob) -> CronJob:
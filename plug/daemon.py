@@ -7,17 +7,18 @@ Runs the bot as a daemon with PID file, logging, and graceful shutdown.
 
 from __future__ import annotations
 
-import asyncio
 import logging
 import os
 import sys
-from pathlib import Path
 
-from plug.config import LOG_FILE, PID_FILE, load_config
+from plug.paths import LOG_FILE, PID_FILE, atomic_write_text
 
 
 logger = logging.getLogger(__name__)
 
+# Write end of the pipe a daemonizing `plug start` waits on (see notify_ready)
+READY_FD_ENV = "PLUG_READY_FD"
+
 
 def setup_logging(*, debug: bool = False, log_file: bool = True) -> None:
     """Configure structured logging to stdout and optionally to file."""
@@ -53,7 +54,7 @@ def setup_logging(*, debug: bool = False, log_file: bool = True) -> None:
 def write_pidfile() -> None:
     """Write the current PID to the PID file."""
     PID_FILE.parent.mkdir(parents=True, exist_ok=True)
-    PID_FILE.write_text(str(os.getpid()))
+    atomic_write_text(PID_FILE, str(os.getpid()))
     logger.debug("PID %d written to %s", os.getpid(), PID_FILE)
 
 
@@ -86,9 +87,42 @@ def is_running() -> bool:
     return read_pidfile() is not None
 
 
+def notify_ready(status: str = "OK") -> None:
+    """Report startup to the `plug start` that launched this process.
+
+    It passes the write end of a pipe in $PLUG_READY_FD and blocks on the
+    read end: "OK" once the bot is up, "ERR:<message>" if startup failed,
+    EOF if we died first. Only the first call writes; without the variable
+    (foreground, systemd) this does nothing.
+    """
+    fd = os.environ.pop(READY_FD_ENV, None)
+    if fd is None:
+        return
+    try:
+        os.write(int(fd), status.encode()[:512])
+        os.close(int(fd))
+    except (OSError, ValueError):
+        pass
+
+
+def install_event_loop() -> None:
+    """Use uvloop for the bot's event loop when it is installed.
+
+    Call before ``asyncio.run``. Without uvloop (e.g. on Termux) the
+    stock asyncio loop is kept.
+    """
+    try:
+        import uvloop  # optional — libuv loop, cheaper per await
+    except ImportError:
+        return
+    uvloop.install()
+    logger.debug("uvloop event loop installed")
+
+
 async def run_bot(*, debug: bool = False) -> None:
     """Run the PLUG bot (blocking)."""
     from plug.bot.client import PlugBot
+    from plug.config import load_config
 
     setup_logging(debug=debug)
     config = load_config()
@@ -107,6 +141,7 @@ async def run_bot(*, debug: bool = False) -> None:
         logger.info("Interrupted.")
     except Exception as e:
         logger.error("Fatal error: %s", e, exc_info=True)
+        notify_ready(f"ERR:{e}")
         raise
     finally:
         remove_pidfile()
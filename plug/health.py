@@ -52,6 +52,7 @@ class HealthChecker:
         self.on_bot_dead = on_bot_dead
 
         self._task: Optional[asyncio.Task] = None
+        self._client: Optional[httpx.AsyncClient] = None  # kept alive between checks
         self._running = False
         self._statuses: dict[str, HealthStatus] = {}
         self._recovery_backoff: dict[str, float] = {}
@@ -78,14 +79,23 @@ class HealthChecker:
         log.info("Health checker stopped")
 
     async def _loop(self):
-        while self._running:
-            try:
-                await self._check_all()
-            except asyncio.CancelledError:
-                break
-            except Exception as e:
-                log.error("Health check error: %s", e)
-            await asyncio.sleep(self.check_interval)
+        try:
+            while self._running:
+                try:
+                    await self._check_all()
+                except asyncio.CancelledError:
+                    break
+                except Exception as e:
+                    log.error("Health check error: %s", e)
+                await asyncio.sleep(self.check_interval)
+        finally:
+            await self.close()
+
+    async def close(self):
+        """Close the proxy probe's HTTP client."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
 
     async def _check_all(self):
         await asyncio.gather(
@@ -99,16 +109,17 @@ class HealthChecker:
         name = "proxy"
         start = time.monotonic()
         try:
-            async with httpx.AsyncClient(timeout=10.0) as client:
-                resp = await client.get(f"{self.proxy_url}/health")
-                latency = (time.monotonic() - start) * 1000
-
-                if resp.status_code == 200:
-                    self._mark_healthy(name, f"OK ({latency:.0f}ms)", latency)
-                else:
-                    await self._mark_unhealthy(
-                        name, f"HTTP {resp.status_code}", latency
-                    )
+            if self._client is None:
+                self._client = httpx.AsyncClient(timeout=10.0)
+            resp = await self._client.get(f"{self.proxy_url}/health")
+            latency = (time.monotonic() - start) * 1000
+
+            if resp.status_code == 200:
+                self._mark_healthy(name, f"OK ({latency:.0f}ms)", latency)
+            else:
+                await self._mark_unhealthy(
+                    name, f"HTTP {resp.status_code}", latency
+                )
         except Exception as e:
             latency = (time.monotonic() - start) * 1000
             await self._mark_unhealthy(name, str(e), latency)
@@ -118,15 +129,13 @@ class HealthChecker:
         name = "database"
         start = time.monotonic()
         try:
-            from plug.config import DB_FILE
+            from plug.paths import DB_FILE
             if not DB_FILE.exists():
                 self._mark_healthy(name, "No DB yet (OK)")
                 return
 
-            import sqlite3
-            conn = sqlite3.connect(str(DB_FILE), timeout=5)
-            result = conn.execute("PRAGMA integrity_check").fetchone()
-            conn.close()
+            # integrity_check reads the whole file — keep it off the event loop
+            result = await asyncio.to_thread(_integrity_check, DB_FILE)
             latency = (time.monotonic() - start) * 1000
 
             if result and result[0] == "ok":
@@ -198,8 +207,20 @@ class HealthChecker:
         return "\n".join(lines)
 
 
+def _integrity_check(db_file) -> Optional[tuple]:
+    import sqlite3
+    conn = sqlite3.connect(str(db_file), timeout=5)
+    try:
+        return conn.execute("PRAGMA integrity_check").fetchone()
+    finally:
+        conn.close()
+
+
 async def check_once(proxy_url: str = "http://localhost:3000") -> dict[str, HealthStatus]:
     """Run a one-shot health check and return statuses."""
     checker = HealthChecker(proxy_url=proxy_url)
-    await checker._check_all()
+    try:
+        await checker._check_all()
+    finally:
+        await checker.close()
     return checker.statuses
@@ -11,7 +11,7 @@ from __future__ import annotations
 import logging
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
-from typing import Any, AsyncIterator, Literal
+from typing import Any, AsyncIterator, Callable, Literal
 
 logger = logging.getLogger(__name__)
 
@@ -42,6 +42,11 @@ class Message:
     tool_calls: list[ToolCall] | None = None
     tool_call_id: str | None = None  # For role="tool" messages
     name: str | None = None          # Tool name for role="tool"
+    # Memoized token estimate (see count_message_tokens); not sent to the API
+    token_count: int | None = field(default=None, repr=False, compare=False)
+    # Memoized wire encoding of to_api_dict(), filled by providers that
+    # serialize history themselves — messages are never mutated once built
+    api_json: bytes | None = field(default=None, repr=False, compare=False)
 
     def to_api_dict(self) -> dict[str, Any]:
         """Convert to OpenAI API message format."""
@@ -103,6 +108,9 @@ class ChatProvider(ABC):
         tools: list[dict] | None = None,
         temperature: float = 0.7,
         max_tokens: int = 4096,
+        cache_key: str | None = None,
+        tools_json: str | None = None,
+        on_delta: Callable[[str], None] | None = None,
     ) -> ChatResponse:
         """Send a chat completion request.
 
@@ -112,6 +120,16 @@ class ChatProvider(ABC):
             tools: Tool definitions in OpenAI function-calling format.
             temperature: Sampling temperature.
             max_tokens: Max tokens to generate.
+            cache_key: Stable prompt-prefix key; providers that support
+                prefix caching use it to route repeat prefixes to the
+                same warm cache. Ignored where unsupported.
+            tools_json: ``tools`` already serialized to a JSON array.
+                Providers that build the request body themselves splice it
+                in verbatim instead of re-encoding ``tools`` every call;
+                others fall back to ``tools``.
+            on_delta: Called with each text delta as it arrives. Providers
+                that can stream tool-enabled requests do so and still
+                return the complete response; others ignore it.
 
         Returns:
             ChatResponse with the model's reply (may contain tool_calls).
@@ -127,6 +145,7 @@ class ChatProvider(ABC):
         tools: list[dict] | None = None,
         temperature: float = 0.7,
         max_tokens: int = 4096,
+        cache_key: str | None = None,
     ) -> AsyncIterator[str]:
         """Stream a chat completion, yielding text chunks.
 
@@ -186,11 +205,17 @@ class ProviderChain:
         tools: list[dict] | None = None,
         temperature: float = 0.7,
         max_tokens: int = 4096,
+        cache_key: str | None = None,
+        tools_json: str | None = None,
+        on_delta: Callable[[str], None] | None = None,
+        on_attempt: Callable[[], None] | None = None,
     ) -> ChatResponse:
         """Try primary provider models with retry, then fallback providers.
 
         Rate-limit aware: detects 429 responses and uses exponential backoff
-        with longer delays before trying the next model.
+        with longer delays before trying the next model. ``on_attempt`` is
+        called before every provider call, so a consumer of ``on_delta``
+        can discard text streamed by an attempt that then failed.
         """
         import asyncio
 
@@ -204,10 +229,14 @@ class ProviderChain:
             m = models_to_try[i]
 
             for attempt in range(self.max_retries):
+                if on_attempt is not None:
+                    on_attempt()
                 try:
                     response = await self.provider.chat(
                         messages, model=m, tools=tools,
                         temperature=temperature, max_tokens=max_tokens,
+                        cache_key=cache_key, tools_json=tools_json,
+                        on_delta=on_delta,
                     )
                     return response
                 except Exception as e:
@@ -243,10 +272,14 @@ class ProviderChain:
         for fb_provider, fb_models in self.fallback_providers:
             for fb_model in fb_models:
                 for attempt in range(self.max_retries):
+                    if on_attempt is not None:
+                        on_attempt()
                     try:
                         response = await fb_provider.chat(
                             messages, model=fb_model, tools=tools,
                             temperature=temperature, max_tokens=max_tokens,
+                            cache_key=cache_key, tools_json=tools_json,
+                            on_delta=on_delta,
                         )
                         logger.info("Fallback succeeded: %s on %s", fb_model, type(fb_provider).__name__)
                         return response
@@ -261,23 +294,13 @@ class ProviderChain:
             f"All providers and models failed. Last error: {last_error}"
         ) from last_error
 
-
-def _is_rate_limit_error(e: Exception) -> bool:
-    """Detect rate limit errors from HTTP status or message."""
-    err_str = str(e).lower()
-    if "429" in err_str or "rate" in err_str or "too many" in err_str:
-        return True
-    # httpx.HTTPStatusError carries response
-    if hasattr(e, "response") and hasattr(e.response, "status_code"):
-        return e.response.status_code == 429
-    return False
-
     async def chat_stream(
         self,
         messages: list[Message],
         *,
         temperature: float = 0.7,
         max_tokens: int = 4096,
+        cache_key: str | None = None,
     ) -> AsyncIterator[str]:
         """Stream with the current model (no fallback mid-stream)."""
         async for chunk in self.provider.chat_stream(
@@ -285,6 +308,7 @@ def _is_rate_limit_error(e: Exception) -> bool:
             model=self.current_model,
             temperature=temperature,
             max_tokens=max_tokens,
+            cache_key=cache_key,
         ):
             yield chunk
 
@@ -292,3 +316,14 @@ def _is_rate_limit_error(e: Exception) -> bool:
         await self.provider.close()
         for fb_provider, _ in self.fallback_providers:
             await fb_provider.close()
+
+
+def _is_rate_limit_error(e: Exception) -> bool:
+    """Detect rate limit errors from HTTP status or message."""
+    err_str = str(e).lower()
+    if "429" in err_str or "rate" in err_str or "too many" in err_str:
+        return True
+    # httpx.HTTPStatusError carries response
+    if hasattr(e, "response") and hasattr(e.response, "status_code"):
+        return e.response.status_code == 429
+    return False
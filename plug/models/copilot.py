@@ -12,7 +12,7 @@ import json
 import logging
 import subprocess
 from pathlib import Path
-from typing import Any, AsyncIterator
+from typing import Any, AsyncIterator, Callable
 
 import httpx
 
@@ -90,11 +90,16 @@ class CopilotChatProvider(ChatProvider):
         tools: list[dict] | None = None,
         temperature: float = 0.7,
         max_tokens: int = 4096,
+        cache_key: str | None = None,
+        tools_json: str | None = None,
+        on_delta: Callable[[str], None] | None = None,
     ) -> ChatResponse:
         if not self._client:
             return await self._do_fallback(
                 messages, model=model, tools=tools,
                 temperature=temperature, max_tokens=max_tokens,
+                cache_key=cache_key, tools_json=tools_json,
+                on_delta=on_delta,
             )
 
         body: dict[str, Any] = {
@@ -118,6 +123,8 @@ class CopilotChatProvider(ChatProvider):
             return await self._do_fallback(
                 messages, model=model, tools=tools,
                 temperature=temperature, max_tokens=max_tokens,
+                cache_key=cache_key, tools_json=tools_json,
+                on_delta=on_delta,
             )
 
     async def chat_stream(
@@ -128,12 +135,14 @@ class CopilotChatProvider(ChatProvider):
         tools: list[dict] | None = None,
         temperature: float = 0.7,
         max_tokens: int = 4096,
+        cache_key: str | None = None,
     ) -> AsyncIterator[str]:
         if not self._client:
             if self.fallback:
                 async for chunk in self.fallback.chat_stream(
                     messages, model=model, tools=tools,
                     temperature=temperature, max_tokens=max_tokens,
+                    cache_key=cache_key,
                 ):
                     yield chunk
                 return
@@ -169,6 +178,7 @@ class CopilotChatProvider(ChatProvider):
             if self.fallback:
                 async for chunk in self.fallback.chat_stream(
                     messages, model=model, temperature=temperature, max_tokens=max_tokens,
+                    cache_key=cache_key,
                 ):
                     yield chunk
             else:
@@ -226,5 +236,7 @@ class CopilotChatProvider(ChatProvider):
                 "prompt_tokens": usage.get("prompt_tokens", 0),
                 "completion_tokens": usage.get("completion_tokens", 0),
                 "total_tokens": usage.get("total_tokens", 0),
+                # Prompt tokens served from the provider's prefix cache
+                "cached_tokens": (usage.get("prompt_tokens_details") or {}).get("cached_tokens", 0),
             },
         )
@@ -10,7 +10,7 @@ from __future__ import annotations
 
 import json
 import logging
-from typing import Any, AsyncIterator
+from typing import Any, AsyncIterator, Callable
 
 import httpx
 
@@ -18,6 +18,8 @@ from plug.models.base import ChatProvider, ChatResponse, Message, ToolCall
 
 logger = logging.getLogger(__name__)
 
+OLLAMA_KEEP_ALIVE = "30m"  # how long a cache-keyed request keeps the model resident
+
 
 class OllamaChatProvider(ChatProvider):
     """Chat provider using local Ollama instance."""
@@ -65,6 +67,9 @@ class OllamaChatProvider(ChatProvider):
         tools: list[dict] | None = None,
         temperature: float = 0.7,
         max_tokens: int = 4096,
+        cache_key: str | None = None,
+        tools_json: str | None = None,
+        on_delta: Callable[[str], None] | None = None,
     ) -> ChatResponse:
         used_model = model or self.default_model
 
@@ -80,6 +85,9 @@ class OllamaChatProvider(ChatProvider):
 
         if tools:
             body["tools"] = tools
+        if cache_key:
+            # No cache key in Ollama — keep the model (and its KV cache) loaded
+            body["keep_alive"] = OLLAMA_KEEP_ALIVE
 
         logger.debug("Ollama chat: model=%s tools=%d", used_model, len(tools or []))
 
@@ -97,6 +105,7 @@ class OllamaChatProvider(ChatProvider):
         tools: list[dict] | None = None,
         temperature: float = 0.7,
         max_tokens: int = 4096,
+        cache_key: str | None = None,
     ) -> AsyncIterator[str]:
         used_model = model or self.default_model
 
@@ -109,6 +118,8 @@ class OllamaChatProvider(ChatProvider):
                 "num_predict": max_tokens,
             },
         }
+        if cache_key:
+            body["keep_alive"] = OLLAMA_KEEP_ALIVE
 
         async with self._client.stream("POST", "/api/chat", json=body) as resp:
             resp.raise_for_status()
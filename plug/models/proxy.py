@@ -10,7 +10,7 @@ from __future__ import annotations
 
 import json
 import logging
-from typing import Any, AsyncIterator
+from typing import Any, AsyncIterator, Callable
 
 import httpx
 
@@ -18,6 +18,50 @@ from plug.models.base import ChatProvider, ChatResponse, Message, ToolCall
 
 logger = logging.getLogger(__name__)
 
+try:
+    import orjson
+except ImportError:  # optional speedup — stdlib json works everywhere
+    orjson = None
+
+if orjson is not None:
+    _loads = orjson.loads
+    _dumps = orjson.dumps
+else:
+    _loads = json.loads
+
+    def _dumps(obj) -> bytes:
+        return json.dumps(obj, separators=(",", ":")).encode()
+
+
+def _message_json(message: Message) -> bytes:
+    """A message's API encoding, computed once per message."""
+    encoded = message.api_json
+    if encoded is None:
+        encoded = message.api_json = _dumps(message.to_api_dict())
+    return encoded
+
+
+def _encode_body(
+    body: dict[str, Any],
+    tools_json: str | None = None,
+    messages: list[Message] | None = None,
+) -> bytes:
+    """Serialize a request body, splicing in pre-serialized parts.
+
+    ``messages`` are joined from their memoized fragments, so each agent
+    round only encodes the messages added since the last call instead of
+    the whole history; ``tools_json`` is inserted verbatim.
+    """
+    encoded = _dumps(body)
+    parts = []
+    if messages is not None:
+        parts.append(b'"messages":[%s]' % b",".join(map(_message_json, messages)))
+    if tools_json:
+        parts.append(b'"tools":%s,"tool_choice":"auto"' % tools_json.encode())
+    if parts:
+        encoded = b"%s,%s}" % (encoded[:-1], b",".join(parts))
+    return encoded
+
 
 class ProxyChatProvider(ChatProvider):
     """Chat provider using an OpenAI-compatible proxy endpoint."""
@@ -53,21 +97,37 @@ class ProxyChatProvider(ChatProvider):
         temperature: float = 0.7,
         max_tokens: int = 4096,
         stream: bool = False,
+        cache_key: str | None = None,
+        tools_json: str | None = None,
+        with_messages: bool = True,
     ) -> dict[str, Any]:
-        """Build the API request body."""
+        """Build the API request body.
+
+        With ``with_messages=False`` the history is left out for
+        _encode_body to splice in from memoized fragments.
+        """
         body: dict[str, Any] = {
             "model": model or self.default_model,
-            "messages": [m.to_api_dict() for m in messages],
             "temperature": temperature,
             "max_tokens": max_tokens,
             "stream": stream,
         }
+        if stream:
+            # Streamed responses only carry usage (incl. cached prompt
+            # tokens) in a final chunk when asked for
+            body["stream_options"] = {"include_usage": True}
+        if with_messages:
+            body["messages"] = [m.to_api_dict() for m in messages]
 
-        if tools and not stream:
-            # Only include tools for non-streaming requests
+        if tools and not tools_json:
+            # Pre-serialized tools are spliced in by _encode_body instead
             body["tools"] = tools
             body["tool_choice"] = "auto"
 
+        if cache_key:
+            # OpenAI-style prefix-cache routing hint
+            body["prompt_cache_key"] = cache_key
+
         return body
 
     # ── Non-streaming chat ───────────────────────────────────────────────
@@ -80,6 +140,9 @@ class ProxyChatProvider(ChatProvider):
         tools: list[dict] | None = None,
         temperature: float = 0.7,
         max_tokens: int = 4096,
+        cache_key: str | None = None,
+        tools_json: str | None = None,
+        on_delta: Callable[[str], None] | None = None,
     ) -> ChatResponse:
         body = self._build_request(
             messages,
@@ -87,13 +150,20 @@ class ProxyChatProvider(ChatProvider):
             tools=tools,
             temperature=temperature,
             max_tokens=max_tokens,
-            stream=False,
+            stream=on_delta is not None,
+            cache_key=cache_key,
+            tools_json=tools_json,
+            with_messages=False,
         )
 
         used_model = body["model"]
         logger.debug("Chat request to %s (tools=%d)", used_model, len(tools or []))
 
-        resp = await self._client.post("/chat/completions", json=body)
+        payload = _encode_body(body, tools_json, messages)
+        if on_delta is not None:
+            return await self._chat_streamed(body, payload, on_delta)
+
+        resp = await self._client.post("/chat/completions", content=payload)
         if resp.status_code >= 400:
             body_text = resp.text[:500] if resp.text else "(empty)"
             logger.error(
@@ -101,8 +171,83 @@ class ProxyChatProvider(ChatProvider):
                 resp.status_code, used_model, body_text,
             )
         resp.raise_for_status()
-        data = resp.json()
+        data = _loads(resp.content)
+
+        return self._parse_response(data)
+
+    async def _chat_streamed(
+        self,
+        body: dict[str, Any],
+        payload: bytes,
+        on_delta: Callable[[str], None],
+    ) -> ChatResponse:
+        """Run a chat request over SSE, reporting text deltas as they arrive.
+
+        Tool-call fragments are accumulated by index and the whole reply is
+        reassembled into the same shape the non-streaming endpoint returns.
+        """
+        content: list[str] = []
+        calls: dict[int, dict[str, Any]] = {}
+        data: dict[str, Any] = {"model": body["model"]}
+        finish_reason = ""
 
+        async with self._client.stream(
+            "POST", "/chat/completions", content=payload,
+        ) as resp:
+            if resp.status_code >= 400:
+                await resp.aread()
+                logger.error(
+                    "API error %d for model %s: %s",
+                    resp.status_code, body["model"], resp.text[:500] or "(empty)",
+                )
+            resp.raise_for_status()
+
+            async for line in resp.aiter_lines():
+                if not line.startswith("data: "):
+                    continue
+                event = line[6:].strip()
+                if event == "[DONE]":
+                    break
+                try:
+                    chunk = _loads(event)
+                except ValueError:
+                    continue
+
+                if chunk.get("model"):
+                    data["model"] = chunk["model"]
+                if chunk.get("usage"):
+                    data["usage"] = chunk["usage"]
+                if not chunk.get("choices"):
+                    continue
+                choice = chunk["choices"][0]
+                finish_reason = choice.get("finish_reason") or finish_reason
+                delta = choice.get("delta") or {}
+
+                text = delta.get("content")
+                if text:
+                    content.append(text)
+                    on_delta(text)
+
+                for tc in delta.get("tool_calls") or ():
+                    call = calls.setdefault(
+                        tc.get("index", len(calls)),
+                        {"id": "", "function": {"name": "", "arguments": ""}},
+                    )
+                    if tc.get("id"):
+                        call["id"] = tc["id"]
+                    fn = tc.get("function") or {}
+                    if fn.get("name"):
+                        call["function"]["name"] += fn["name"]
+                    if fn.get("arguments"):
+                        call["function"]["arguments"] += fn["arguments"]
+
+        message: dict[str, Any] = {"content": "".join(content) or None}
+        if calls:
+            for call in calls.values():
+                # A no-argument call may stream no argument fragments at all
+                call["function"]["arguments"] = call["function"]["arguments"] or "{}"
+            message["tool_calls"] = [calls[i] for i in sorted(calls)]
+        data["choices"] = [{"message": message, "finish_reason": finish_reason}]
         return self._parse_response(data)
 
     def _parse_response(self, data: dict[str, Any]) -> ChatResponse:
@@ -149,9 +294,24 @@ class ProxyChatProvider(ChatProvider):
                 "prompt_tokens": usage.get("prompt_tokens", 0),
                 "completion_tokens": usage.get("completion_tokens", 0),
                 "total_tokens": usage.get("total_tokens", 0),
+                # Prompt tokens served from the provider's prefix cache
+                "cached_tokens": (usage.get("prompt_tokens_details") or {}).get("cached_tokens", 0),
             },
         )
 
+    # ── Embeddings ───────────────────────────────────────────────────────
+
+    async def embed(
+        self, texts: list[str], *, model: str = "text-embedding-3-small",
+    ) -> list[list[float]]:
+        """Embed texts via the proxy's /embeddings endpoint (input order kept)."""
+        resp = await self._client.post(
+            "/embeddings", content=_dumps({"model": model, "input": texts}),
+        )
+        resp.raise_for_status()
+        data = sorted(_loads(resp.content)["data"], key=lambda d: d.get("index", 0))
+        return [d["embedding"] for d in data]
+
     # ── Streaming chat ───────────────────────────────────────────────────
 
     async def chat_stream(
@@ -162,6 +322,7 @@ class ProxyChatProvider(ChatProvider):
         tools: list[dict] | None = None,
         temperature: float = 0.7,
         max_tokens: int = 4096,
+        cache_key: str | None = None,
     ) -> AsyncIterator[str]:
         """Stream text chunks from the model.
 
@@ -176,6 +337,7 @@ class ProxyChatProvider(ChatProvider):
             temperature=temperature,
             max_tokens=max_tokens,
             stream=True,
+            cache_key=cache_key,
         )
 
         async with self._client.stream(
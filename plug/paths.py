@@ -0,0 +1,52 @@
+"""
+PLUG Paths
+==========
+
+Filesystem locations under ~/.plug (or $PLUG_HOME), and the atomic
+write used for the files PLUG owns there.
+
+Kept apart from plug.config so the CLI can find its files without
+importing pydantic.
+"""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+CONFIG_DIR = Path(os.environ.get("PLUG_HOME", str(Path.home() / ".plug")))
+CONFIG_FILE = CONFIG_DIR / "config.json"
+DB_FILE = CONFIG_DIR / "sessions.db"
+PID_FILE = CONFIG_DIR / "plug.pid"
+LOG_FILE = CONFIG_DIR / "plug.log"
+
+
+def ensure_config_dir() -> Path:
+    CONFIG_DIR.mkdir(parents=True, exist_ok=True)
+    return CONFIG_DIR
+
+
+def atomic_write_text(path: Path, text: str) -> None:
+    """Replace a file's contents so a crash leaves the old or new version.
+
+    Writes a sibling temp file, fsyncs it, renames it over ``path`` and
+    fsyncs the directory — never a truncated config or PID file.
+    """
+    tmp = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    try:
+        with open(tmp, "w", encoding="utf-8") as f:
+            f.write(text)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, path)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
+    try:
+        dir_fd = os.open(path.parent, os.O_RDONLY)
+    except OSError:
+        return  # directories can't be opened for fsync on every platform
+    try:
+        os.fsync(dir_fd)
+    finally:
+        os.close(dir_fd)
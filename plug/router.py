@@ -17,6 +17,8 @@ from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Optional
 
+from plug.config import RouterConfig
+
 log = logging.getLogger("plug.router")
 
 
@@ -111,10 +113,15 @@ class AgentRouter:
     def list_personas(self) -> list[AgentPersona]:
         return list(self._personas.values())
 
+    def channel_ids(self) -> list[str]:
+        """All channel IDs that map to a persona."""
+        return list(self._channel_map)
+
     @classmethod
-    def from_config(cls, config: dict) -> AgentRouter:
+    def from_config(cls, config: RouterConfig | dict) -> AgentRouter:
         """
-        Build router from config dict:
+        Build router from the typed ``router`` config section (a raw dict
+        of the same shape is validated first):
         {
             "personas": [
                 {
@@ -129,8 +136,10 @@ class AgentRouter:
             "default_persona": "AVA"
         }
         """
-        personas = [AgentPersona(**p) for p in config.get("personas", [])]
-        default_name = config.get("default_persona")
+        if isinstance(config, dict):
+            config = RouterConfig.model_validate(config)
+        personas = [AgentPersona(**p.model_dump()) for p in config.personas]
+        default_name = config.default_persona
         default = None
         if default_name:
             default = next((p for p in personas if p.name == default_name), None)
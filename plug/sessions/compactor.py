@@ -10,6 +10,8 @@ Uses the same LLM provider to generate summaries.
 
 from __future__ import annotations
 
+import asyncio
+import json
 import logging
 from typing import TYPE_CHECKING
 
@@ -39,20 +41,58 @@ def count_tokens(text: str) -> int:
 
 
 def count_message_tokens(message: Message) -> int:
-    """Estimate token count for a message (content + overhead)."""
+    """Estimate token count for a message (content + overhead).
+
+    The result is memoized on the message, so a message is tokenized once
+    no matter how often it is stored, reloaded or weighed for compaction.
+    """
+    if message.token_count is not None:
+        return message.token_count
     tokens = 4  # message overhead (role, separators)
     if message.content:
         tokens += count_tokens(message.content)
     if message.tool_calls:
         for tc in message.tool_calls:
             tokens += count_tokens(tc.name)
-            import json
             tokens += count_tokens(json.dumps(tc.arguments))
     if message.name:
         tokens += count_tokens(message.name)
+    message.token_count = tokens
     return tokens
 
 
+def count_message_tokens_approx(message: Message) -> int:
+    """Cheap upper-bound estimate (2 UTF-8 bytes per token) for tool results.
+
+    Tool output (file dumps, JSON) is large and only ever weighed against
+    the compaction threshold, so it isn't tokenized on insert. The estimate
+    errs high: CJK text runs ~1 token per 3-byte character and hex/base64
+    ~2-3 bytes per token, so a chars/4 guess could stay below the recount
+    gate while the real context overflows. Not memoized; check_and_compact
+    recounts exactly when it matters.
+    """
+    return len((message.content or "").encode()) // 2 + 8
+
+
+# Below this many characters a BPE pass is cheaper than a thread hop
+OFFLOAD_CHARS = 4096
+
+
+async def count_message_tokens_async(message: Message) -> int:
+    """count_message_tokens, run in a worker thread for large messages.
+
+    tiktoken releases the GIL while encoding, so long assistant replies and
+    tool outputs no longer stall the event loop between LLM rounds.
+    """
+    if message.token_count is not None or len(message.content or "") < OFFLOAD_CHARS:
+        return count_message_tokens(message)
+    return await asyncio.to_thread(count_message_tokens, message)
+
+
+# Stored totals within this fraction of the budget trigger an exact recount
+APPROX_RECOUNT_RATIO = 0.9
+
+
 COMPACTION_PROMPT = """You are summarizing a conversation segment for context continuity.
 
 Summarize the following conversation messages into a concise but comprehensive summary.
@@ -133,8 +173,15 @@ class Compactor:
 
         Returns True if compaction was performed.
         """
+        # The stored total includes approximate tool-result counts; only
+        # tokenize for real once it is close enough to matter
         current_tokens = await self.store.get_token_count(channel_id)
+        if current_tokens < APPROX_RECOUNT_RATIO * self.max_context_tokens:
+            return False
 
+        messages = await self.store.get_messages(channel_id)
+        counts = await asyncio.gather(*(count_message_tokens_async(m) for m in messages))
+        current_tokens = sum(counts)
         if current_tokens <= self.max_context_tokens:
             return False
 
@@ -145,7 +192,6 @@ class Compactor:
             self.max_context_tokens,
         )
 
-        messages = await self.store.get_messages(channel_id)
         if len(messages) < 4:
             # Too few messages to compact
             return False
@@ -156,7 +202,7 @@ class Compactor:
         keep_from = len(messages)
 
         for i in range(len(messages) - 1, -1, -1):
-            msg_tokens = count_message_tokens(messages[i])
+            msg_tokens = counts[i]
             if keep_tokens + msg_tokens > self.target_tokens:
                 break
             keep_tokens += msg_tokens
@@ -9,11 +9,14 @@ Messages are stored individually for efficient compaction.
 
 from __future__ import annotations
 
+import asyncio
 import json
 import logging
+import os
 import time
+from contextlib import asynccontextmanager
 from pathlib import Path
-from typing import Any
+from typing import Any, AsyncIterator, Iterable
 
 import aiosqlite
 
@@ -21,26 +24,113 @@ from plug.models.base import Message, ToolCall
 
 logger = logging.getLogger(__name__)
 
+# Applied to every connection. WAL itself is persistent in the file and is
+# set once by the writer.
+_PRAGMAS = (
+    "PRAGMA busy_timeout=5000",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA cache_size=-20000",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA mmap_size=268435456",  # read pages through mmap instead of pread
+)
+
+READER_POOL_SIZE = min(4, os.cpu_count() or 1)
+ACTIVE_IDLE_TTL = 3600.0  # seconds before an untouched channel's mirror is dropped
+
+_UPSERT_SESSION = """
+    INSERT INTO sessions (channel_id, created_at, updated_at)
+    VALUES (?, ?, ?)
+    ON CONFLICT(channel_id) DO UPDATE SET updated_at = excluded.updated_at
+"""
+
+_INSERT_MESSAGE = """
+    INSERT INTO messages
+    (channel_id, role, content, tool_calls, tool_call_id, name, timestamp, token_count)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+
+def _message_row(channel_id: str, message: Message, token_count: int, now: float) -> tuple:
+    tool_calls_json = None
+    if message.tool_calls:
+        tool_calls_json = json.dumps([
+            {"id": tc.id, "name": tc.name, "arguments": tc.arguments}
+            for tc in message.tool_calls
+        ])
+    return (
+        channel_id,
+        message.role,
+        message.content,
+        tool_calls_json,
+        message.tool_call_id,
+        message.name,
+        now,
+        token_count,
+    )
+
 
 class SessionStore:
-    """Persistent session storage using SQLite."""
+    """Persistent session storage using SQLite.
 
-    def __init__(self, db_path: str | Path):
+    One writer connection (explicit ``BEGIN IMMEDIATE`` transactions behind
+    an asyncio lock) plus a small pool of read-only connections, so reads
+    never queue behind a write under WAL.
+    """
+
+    def __init__(self, db_path: str | Path, readers: int = READER_POOL_SIZE):
         self.db_path = Path(db_path)
         self._db: aiosqlite.Connection | None = None
+        self._reader_count = readers
+        self._readers: asyncio.Queue[aiosqlite.Connection] | None = None
+        self._reader_conns: list[aiosqlite.Connection] = []
+        self._write_lock = asyncio.Lock()
+        # In-memory mirror of each channel's active (non-compacted) history
+        # and its token total. Filled on first read, appended to on write,
+        # dropped whenever history is rewritten (compaction, clears, deletes).
+        self._active: dict[str, list[Message]] = {}
+        self._active_tokens: dict[str, int] = {}
+        self._generation: dict[str, int] = {}  # bumped on every write, guards racing loads
+        # Mirrors only see writes made through this store. The writer's
+        # PRAGMA data_version changes when another connection commits (e.g.
+        # `plug sessions clear`), and then every mirror is dropped.
+        self._data_version: int | None = None
+        self._epoch = 0  # bumped with it, guards loads racing the drop
+        self._last_used: dict[str, float] = {}  # channel → monotonic time of last read
+        self._next_sweep = 0.0
 
     async def open(self) -> None:
         """Open the database and ensure tables exist."""
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
-        self._db = await aiosqlite.connect(str(self.db_path))
+        # Autocommit mode: transactions are opened explicitly in _writing()
+        self._db = await aiosqlite.connect(str(self.db_path), isolation_level=None)
         self._db.row_factory = aiosqlite.Row
         await self._db.execute("PRAGMA journal_mode=WAL")
         await self._db.execute("PRAGMA foreign_keys=ON")
+        for pragma in _PRAGMAS:
+            await self._db.execute(pragma)
         await self._create_tables()
-        logger.info("Session store opened: %s", self.db_path)
+
+        self._readers = asyncio.Queue()
+        for _ in range(self._reader_count):
+            conn = await aiosqlite.connect(
+                # as_uri() percent-encodes ?, # and % in the path
+                self.db_path.resolve().as_uri() + "?mode=ro", uri=True, isolation_level=None,
+            )
+            conn.row_factory = aiosqlite.Row
+            for pragma in _PRAGMAS:
+                await conn.execute(pragma)
+            self._reader_conns.append(conn)
+            self._readers.put_nowait(conn)
+        logger.info("Session store opened: %s (%d readers)", self.db_path, self._reader_count)
 
     async def close(self) -> None:
+        for conn in self._reader_conns:
+            await conn.close()
+        self._reader_conns.clear()
+        self._readers = None
         if self._db:
+            # Refresh planner statistics for what this run actually queried
+            await self._db.execute("PRAGMA optimize")
             await self._db.close()
             self._db = None
 
@@ -73,55 +163,121 @@ class SessionStore:
             CREATE INDEX IF NOT EXISTS idx_messages_compacted
                 ON messages(channel_id, compacted);
         """)
+        await self._add_session_counters()
         await self._db.commit()
 
+    async def _add_session_counters(self) -> None:
+        """Keep per-session message/token totals on the sessions row.
+
+        Maintained by triggers, so listing sessions reads one row per
+        channel instead of aggregating the whole messages table.
+        """
+        cursor = await self._db.execute("PRAGMA table_info(sessions)")
+        columns = {row["name"] for row in await cursor.fetchall()}
+        if "msg_count" not in columns:
+            await self._db.executescript("""
+                BEGIN;
+                ALTER TABLE sessions ADD COLUMN msg_count INTEGER NOT NULL DEFAULT 0;
+                ALTER TABLE sessions ADD COLUMN token_sum INTEGER NOT NULL DEFAULT 0;
+                UPDATE sessions SET
+                    msg_count = (SELECT COUNT(*) FROM messages m
+                                 WHERE m.channel_id = sessions.channel_id),
+                    token_sum = (SELECT COALESCE(SUM(token_count), 0) FROM messages m
+                                 WHERE m.channel_id = sessions.channel_id);
+                COMMIT;
+            """)
+            logger.info("Session store: added msg_count/token_sum counters")
+
+        await self._db.executescript("""
+            CREATE TRIGGER IF NOT EXISTS trg_messages_count_insert
+            AFTER INSERT ON messages BEGIN
+                UPDATE sessions
+                SET msg_count = msg_count + 1,
+                    token_sum = token_sum + COALESCE(NEW.token_count, 0)
+                WHERE channel_id = NEW.channel_id;
+            END;
+
+            CREATE TRIGGER IF NOT EXISTS trg_messages_count_delete
+            AFTER DELETE ON messages BEGIN
+                UPDATE sessions
+                SET msg_count = msg_count - 1,
+                    token_sum = token_sum - COALESCE(OLD.token_count, 0)
+                WHERE channel_id = OLD.channel_id;
+            END;
+        """)
+
     @property
     def db(self) -> aiosqlite.Connection:
         if self._db is None:
             raise RuntimeError("Session store not opened. Call open() first.")
         return self._db
 
+    @asynccontextmanager
+    async def _writing(self) -> AsyncIterator[aiosqlite.Connection]:
+        """Run the body as one ``BEGIN IMMEDIATE`` transaction on the writer."""
+        async with self._write_lock:
+            db = self.db
+            await db.execute("BEGIN IMMEDIATE")
+            try:
+                yield db
+            except BaseException:
+                await db.rollback()
+                raise
+            await db.commit()
+
+    @asynccontextmanager
+    async def _reading(self) -> AsyncIterator[aiosqlite.Connection]:
+        """Borrow a read-only connection (falls back to the writer)."""
+        if not self._readers:
+            yield self.db
+            return
+        conn = await self._readers.get()
+        try:
+            yield conn
+        finally:
+            self._readers.put_nowait(conn)
+
     # ── Session management ───────────────────────────────────────────────
 
     async def ensure_session(self, channel_id: str) -> None:
         """Create session if it doesn't exist."""
         now = time.time()
-        await self.db.execute(
-            """INSERT OR IGNORE INTO sessions (channel_id, created_at, updated_at)
-               VALUES (?, ?, ?)""",
-            (channel_id, now, now),
-        )
-        await self.db.commit()
+        async with self._writing() as db:
+            await db.execute(
+                """INSERT OR IGNORE INTO sessions (channel_id, created_at, updated_at)
+                   VALUES (?, ?, ?)""",
+                (channel_id, now, now),
+            )
 
     async def touch_session(self, channel_id: str) -> None:
         """Update the session's last-modified timestamp."""
-        await self.db.execute(
-            "UPDATE sessions SET updated_at = ? WHERE channel_id = ?",
-            (time.time(), channel_id),
-        )
-        await self.db.commit()
+        async with self._writing() as db:
+            await db.execute(
+                "UPDATE sessions SET updated_at = ? WHERE channel_id = ?",
+                (time.time(), channel_id),
+            )
 
     async def list_sessions(self) -> list[dict[str, Any]]:
         """List all sessions with message counts."""
-        cursor = await self.db.execute("""
-            SELECT s.channel_id, s.created_at, s.updated_at,
-                   COUNT(m.id) as message_count,
-                   SUM(COALESCE(m.token_count, 0)) as total_tokens
-            FROM sessions s
-            LEFT JOIN messages m ON m.channel_id = s.channel_id
-            GROUP BY s.channel_id
-            ORDER BY s.updated_at DESC
-        """)
-        rows = await cursor.fetchall()
+        async with self._reading() as db:
+            cursor = await db.execute("""
+                SELECT channel_id, created_at, updated_at,
+                       msg_count as message_count,
+                       token_sum as total_tokens
+                FROM sessions
+                ORDER BY updated_at DESC
+            """)
+            rows = await cursor.fetchall()
         return [dict(r) for r in rows]
 
     async def delete_session(self, channel_id: str) -> bool:
         """Delete a session and all its messages."""
-        cursor = await self.db.execute(
-            "DELETE FROM sessions WHERE channel_id = ?",
-            (channel_id,),
-        )
-        await self.db.commit()
+        self._invalidate(channel_id)
+        async with self._writing() as db:
+            cursor = await db.execute(
+                "DELETE FROM sessions WHERE channel_id = ?",
+                (channel_id,),
+            )
         return cursor.rowcount > 0
 
     async def clear_messages(self, channel_id: str) -> int:
@@ -130,17 +286,22 @@ class SessionStore:
         Useful for starting a fresh conversation in the same channel.
         Returns the number of messages deleted.
         """
-        cursor = await self.db.execute(
-            "DELETE FROM messages WHERE channel_id = ?",
-            (channel_id,),
-        )
-        await self.db.commit()
+        self._invalidate(channel_id)
+        async with self._writing() as db:
+            cursor = await db.execute(
+                "DELETE FROM messages WHERE channel_id = ?",
+                (channel_id,),
+            )
         return cursor.rowcount
 
     async def clear_all(self) -> int:
         """Delete all sessions. Returns count deleted."""
-        cursor = await self.db.execute("DELETE FROM sessions")
-        await self.db.commit()
+        self._active.clear()
+        self._active_tokens.clear()
+        for channel_id in self._generation:
+            self._generation[channel_id] += 1
+        async with self._writing() as db:
+            cursor = await db.execute("DELETE FROM sessions")
         return cursor.rowcount
 
     # ── Message storage ──────────────────────────────────────────────────
@@ -151,35 +312,58 @@ class SessionStore:
         message: Message,
         token_count: int = 0,
     ) -> int:
-        """Store a message. Returns the message row ID."""
-        await self.ensure_session(channel_id)
-
-        tool_calls_json = None
-        if message.tool_calls:
-            tool_calls_json = json.dumps([
-                {"id": tc.id, "name": tc.name, "arguments": tc.arguments}
-                for tc in message.tool_calls
-            ])
-
-        cursor = await self.db.execute(
-            """INSERT INTO messages
-               (channel_id, role, content, tool_calls, tool_call_id, name, timestamp, token_count)
-               VALUES (?, ?, ?, ?, ?, ?, ?, ?)""",
-            (
-                channel_id,
-                message.role,
-                message.content,
-                tool_calls_json,
-                message.tool_call_id,
-                message.name,
-                time.time(),
-                token_count,
-            ),
-        )
-        await self.db.commit()
-        await self.touch_session(channel_id)
+        """Store a message. Returns the message row ID.
+
+        Session upsert, insert and touch share one transaction.
+        """
+        now = time.time()
+        async with self._writing() as db:
+            await db.execute(_UPSERT_SESSION, (channel_id, now, now))
+            cursor = await db.execute(
+                _INSERT_MESSAGE, _message_row(channel_id, message, token_count, now),
+            )
+        self._mirror_append(channel_id, message, token_count)
         return cursor.lastrowid
 
+    async def add_messages(
+        self,
+        channel_id: str,
+        messages: Iterable[tuple[Message, int]],
+    ) -> None:
+        """Store several (message, token_count) pairs in one transaction."""
+        await self._write_batch([(channel_id, m, n) for m, n in messages])
+
+    def transaction(self) -> MessageBatch:
+        """Collect several add_message() calls into a single commit.
+
+        Usage::
+
+            async with store.transaction() as tx:
+                tx.add_message(channel_id, msg, token_count=n)
+                ...
+
+        Buffered rows are written with one executemany when the block
+        exits — also when it exits via return or an exception, so turns
+        that already happened are never dropped.
+        """
+        return MessageBatch(self)
+
+    async def _write_batch(self, rows: list[tuple[str, Message, int]]) -> None:
+        if not rows:
+            return
+        now = time.time()
+        channels = dict.fromkeys(channel_id for channel_id, _, _ in rows)
+        async with self._writing() as db:
+            await db.executemany(
+                _UPSERT_SESSION, [(channel_id, now, now) for channel_id in channels],
+            )
+            await db.executemany(
+                _INSERT_MESSAGE,
+                [_message_row(channel_id, message, tokens, now) for channel_id, message, tokens in rows],
+            )
+        for channel_id, message, tokens in rows:
+            self._mirror_append(channel_id, message, tokens)
+
     async def get_messages(
         self,
         channel_id: str,
@@ -188,34 +372,45 @@ class SessionStore:
     ) -> list[Message]:
         """Get all messages for a channel, in order.
 
-        By default, excludes compacted (summarized) original messages.
+        By default, excludes compacted (summarized) original messages,
+        served from the in-memory mirror after the first read.
         """
-        if include_compacted:
-            where = "WHERE channel_id = ?"
-            params = (channel_id,)
-        else:
-            where = "WHERE channel_id = ? AND compacted = 0"
-            params = (channel_id,)
-
-        cursor = await self.db.execute(
-            f"""SELECT role, content, tool_calls, tool_call_id, name
-                FROM messages
-                {where}
-                ORDER BY id ASC""",
-            params,
-        )
-        rows = await cursor.fetchall()
+        if not include_compacted:
+            await self._sync_external_writes()
+            now = time.monotonic()
+            self._last_used[channel_id] = now
+            if now >= self._next_sweep:
+                self._evict_idle(now)
+            cached = self._active.get(channel_id)
+            if cached is None:
+                cached = await self._load_active(channel_id)
+            return list(cached)
+
+        async with self._reading() as db:
+            cursor = await db.execute(
+                """SELECT role, content, tool_calls, tool_call_id, name
+                   FROM messages
+                   WHERE channel_id = ?
+                   ORDER BY id ASC""",
+                (channel_id,),
+            )
+            rows = await cursor.fetchall()
         return [self._row_to_message(row) for row in rows]
 
     async def get_token_count(self, channel_id: str) -> int:
         """Get total token count for active (non-compacted) messages."""
-        cursor = await self.db.execute(
-            """SELECT COALESCE(SUM(token_count), 0)
-               FROM messages
-               WHERE channel_id = ? AND compacted = 0""",
-            (channel_id,),
-        )
-        row = await cursor.fetchone()
+        await self._sync_external_writes()
+        total = self._active_tokens.get(channel_id)
+        if total is not None:
+            return total
+        async with self._reading() as db:
+            cursor = await db.execute(
+                """SELECT COALESCE(SUM(token_count), 0)
+                   FROM messages
+                   WHERE channel_id = ? AND compacted = 0""",
+                (channel_id,),
+            )
+            row = await cursor.fetchone()
         return row[0] if row else 0
 
     async def mark_compacted(
@@ -225,25 +420,86 @@ class SessionStore:
 
         Returns count of messages marked.
         """
-        cursor = await self.db.execute(
-            """UPDATE messages
-               SET compacted = 1
-               WHERE channel_id = ? AND id <= ? AND compacted = 0
-                 AND role != 'system'""",
-            (channel_id, up_to_id),
-        )
-        await self.db.commit()
+        self._invalidate(channel_id)
+        async with self._writing() as db:
+            cursor = await db.execute(
+                """UPDATE messages
+                   SET compacted = 1
+                   WHERE channel_id = ? AND id <= ? AND compacted = 0
+                     AND role != 'system'""",
+                (channel_id, up_to_id),
+            )
         return cursor.rowcount
 
     async def get_message_ids(self, channel_id: str) -> list[int]:
         """Get the row IDs of active messages in a channel."""
-        cursor = await self.db.execute(
-            """SELECT id FROM messages
-               WHERE channel_id = ? AND compacted = 0
-               ORDER BY id ASC""",
-            (channel_id,),
-        )
-        return [row[0] for row in await cursor.fetchall()]
+        async with self._reading() as db:
+            cursor = await db.execute(
+                """SELECT id FROM messages
+                   WHERE channel_id = ? AND compacted = 0
+                   ORDER BY id ASC""",
+                (channel_id,),
+            )
+            return [row[0] for row in await cursor.fetchall()]
+
+    # ── Active-history mirror ────────────────────────────────────────────
+
+    async def _sync_external_writes(self) -> None:
+        """Drop every mirror if another connection has committed since."""
+        cursor = await self.db.execute("PRAGMA data_version")
+        (version,) = await cursor.fetchone()
+        if version == self._data_version:
+            return
+        if self._data_version is not None:
+            logger.debug("Session database changed externally; dropping mirrors")
+            self._epoch += 1
+            self._active.clear()
+            self._active_tokens.clear()
+        self._data_version = version
+
+    async def _load_active(self, channel_id: str) -> list[Message]:
+        generation = self._generation.get(channel_id, 0)
+        epoch = self._epoch
+        async with self._reading() as db:
+            cursor = await db.execute(
+                """SELECT role, content, tool_calls, tool_call_id, name, token_count
+                   FROM messages
+                   WHERE channel_id = ? AND compacted = 0
+                   ORDER BY id ASC""",
+                (channel_id,),
+            )
+            rows = await cursor.fetchall()
+        messages = [self._row_to_message(row) for row in rows]
+        # Reuse the stored counts so loaded messages are never re-tokenized.
+        # Tool results are stored with an estimate, so they stay unmemoized.
+        for message, row in zip(messages, rows):
+            if message.role != "tool":
+                message.token_count = row["token_count"] or None
+        # Only mirror the result if nothing was written while we were reading
+        if self._generation.get(channel_id, 0) == generation and self._epoch == epoch:
+            self._active[channel_id] = messages
+            self._active_tokens[channel_id] = sum(row["token_count"] or 0 for row in rows)
+        return messages
+
+    def _mirror_append(self, channel_id: str, message: Message, token_count: int) -> None:
+        self._generation[channel_id] = self._generation.get(channel_id, 0) + 1
+        cached = self._active.get(channel_id)
+        if cached is not None:
+            cached.append(message)
+            self._active_tokens[channel_id] += token_count
+
+    def _evict_idle(self, now: float) -> None:
+        """Drop mirrors of channels nobody has read for ACTIVE_IDLE_TTL."""
+        self._next_sweep = now + 60.0
+        for channel_id, used in list(self._last_used.items()):
+            if now - used > ACTIVE_IDLE_TTL:
+                del self._last_used[channel_id]
+                self._invalidate(channel_id)
+
+    def _invalidate(self, channel_id: str) -> None:
+        self._generation[channel_id] = self._generation.get(channel_id, 0) + 1
+        self._active.pop(channel_id, None)
+        self._active_tokens.pop(channel_id, None)
 
     # ── Helpers ──────────────────────────────────────────────────────────
 
@@ -272,3 +528,21 @@ class SessionStore:
 
     async def __aexit__(self, *exc):
         await self.close()
+
+
+class MessageBatch:
+    """Buffered writes returned by :meth:`SessionStore.transaction`."""
+
+    def __init__(self, store: SessionStore):
+        self._store = store
+        self._rows: list[tuple[str, Message, int]] = []
+
+    def add_message(self, channel_id: str, message: Message, token_count: int = 0) -> None:
+        self._rows.append((channel_id, message, token_count))
+
+    async def __aenter__(self) -> MessageBatch:
+        return self
+
+    async def __aexit__(self, *exc) -> None:
+        rows, self._rows = self._rows, []
+        await self._store._write_batch(rows)
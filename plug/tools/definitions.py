@@ -5,6 +5,8 @@ Tool Definitions — OpenAI function-calling format
 OpenAI function-calling tool schemas for PLUG.
 """
 
+import json
+
 TOOL_DEFINITIONS: list[dict] = [
     {
         "type": "function",
@@ -295,3 +297,7 @@ TOOL_DEFINITIONS: list[dict] = [
         },
     },
 ]
+
+# The schema is fixed, so it is encoded once here and spliced verbatim
+# into request bodies (see ChatProvider.chat's ``tools_json``)
+TOOL_DEFINITIONS_JSON: str = json.dumps(TOOL_DEFINITIONS, separators=(",", ":"))
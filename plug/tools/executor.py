@@ -29,13 +29,38 @@ DEFAULT_WORKSPACE = str(Path.home() / "workspace")
 MEMORY_VENV = ".hektor-env/bin/activate"
 MEMORY_SCRIPT = ".ava-memory/ava_memory_fast.py"
 
+# Heavy tools — subprocesses (exec, memory_search) and blocking COMB I/O.
+# Calls from one round may run concurrently, so these are bounded;
+# everything else is light async I/O and runs freely.
+HEAVY_TOOLS = frozenset({"exec", "memory_search", "comb_stage", "comb_recall"})
+MAX_CONCURRENT_HEAVY = 4
+MAX_PARALLEL_TOOLS = 8  # overall cap on in-flight tool calls
+
+# Read-only tools. A round made up only of these runs concurrently; any
+# other tool (writes, exec, COMB staging, Discord sends — where side
+# effects and order matter) makes the whole round run one call at a time,
+# in the order the model gave
+READ_ONLY_TOOLS = frozenset({"read_file", "list_dir", "web_fetch", "memory_search", "comb_recall"})
+
+
+def parallel_safe(name: str) -> bool:
+    """Whether a tool may run concurrently with the others in its round."""
+    return name in READ_ONLY_TOOLS
+
 
 class ToolExecutor:
     """Executes tool calls and returns string results."""
 
-    def __init__(self, workspace: str = DEFAULT_WORKSPACE):
+    def __init__(
+        self,
+        workspace: str = DEFAULT_WORKSPACE,
+        max_heavy: int = MAX_CONCURRENT_HEAVY,
+        max_parallel: int = MAX_PARALLEL_TOOLS,
+    ):
         self.workspace = Path(workspace)
         self._http = httpx.AsyncClient(timeout=30.0, follow_redirects=True)
+        self._heavy_slots = asyncio.Semaphore(max_heavy)
+        self._slots = asyncio.Semaphore(max_parallel)
 
     async def close(self) -> None:
         await self._http.aclose()
@@ -68,8 +93,11 @@ class ToolExecutor:
             return json.dumps({"error": f"Unknown tool: {name}"})
 
         try:
-            result = await handler(**arguments)
-            return result
+            async with self._slots:
+                if name in HEAVY_TOOLS:
+                    async with self._heavy_slots:
+                        return await handler(**arguments)
+                return await handler(**arguments)
         except Exception as e:
             logger.error("Tool %s failed: %s", name, e, exc_info=True)
             return json.dumps({"error": str(e)})
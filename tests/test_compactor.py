@@ -0,0 +1,35 @@
+"""The tool-result estimate must not undercount what the compactor later weighs."""
+
+import base64
+import os
+
+import pytest
+
+from plug.models.base import Message
+from plug.sessions import compactor
+from plug.sessions.compactor import count_message_tokens, count_message_tokens_approx
+
+_TOOL_OUTPUTS = {
+    "cjk": "日本語のウェブページの本文です。検索結果と記事の要約。" * 200,
+    "hex": os.urandom(3000).hex(),
+    "base64": base64.b64encode(os.urandom(3000)).decode(),
+    "json": '{"id":1,"tags":["a","b"],"ok":true}' * 200,
+}
+
+
+def _tool_message(content: str) -> Message:
+    return Message(role="tool", content=content, name="web_fetch", tool_call_id="call_1")
+
+
+@pytest.mark.parametrize("kind", sorted(_TOOL_OUTPUTS))
+def test_approx_is_upper_bound(kind):
+    if compactor._encoder is None:
+        pytest.skip("tiktoken encoding not available offline")
+    content = _TOOL_OUTPUTS[kind]
+    assert count_message_tokens_approx(_tool_message(content)) >= count_message_tokens(_tool_message(content))
+
+
+def test_approx_covers_cjk_without_tokenizer():
+    # CJK text is about one token per character, whatever the encoder
+    content = _TOOL_OUTPUTS["cjk"]
+    assert count_message_tokens_approx(_tool_message(content)) >= len(content)
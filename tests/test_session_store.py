@@ -0,0 +1,64 @@
+"""SessionStore's in-memory mirror must follow writes made by other connections."""
+
+import asyncio
+import sqlite3
+
+from plug.models.base import Message
+from plug.sessions.store import SessionStore
+
+
+def _clear_externally(db_path, channel_id: str) -> None:
+    """What `plug sessions clear` does: its own connection, straight to SQLite."""
+    conn = sqlite3.connect(str(db_path), isolation_level=None)
+    try:
+        conn.execute("BEGIN IMMEDIATE")
+        conn.execute("DELETE FROM sessions WHERE channel_id = ?", (channel_id,))
+        conn.execute("DELETE FROM messages WHERE channel_id = ?", (channel_id,))
+        conn.execute("COMMIT")
+    finally:
+        conn.close()
+
+
+def test_external_clear_drops_mirror(tmp_path):
+    db_path = tmp_path / "plug.db"
+
+    async def run():
+        store = SessionStore(db_path, readers=1)
+        await store.open()
+        try:
+            await store.add_message("c1", Message(role="user", content="hello"), token_count=5)
+            await store.add_message("c1", Message(role="assistant", content="hi"), token_count=3)
+            # First read fills the mirror
+            assert [m.content for m in await store.get_messages("c1")] == ["hello", "hi"]
+            assert await store.get_token_count("c1") == 8
+
+            _clear_externally(db_path, "c1")
+
+            assert await store.get_messages("c1") == []
+            assert await store.get_token_count("c1") == 0
+
+            # New turns start from the cleared history, not the stale list
+            await store.add_message("c1", Message(role="user", content="again"), token_count=2)
+            assert [m.content for m in await store.get_messages("c1")] == ["again"]
+            assert await store.get_token_count("c1") == 2
+        finally:
+            await store.close()
+
+    asyncio.run(run())
+
+
+def test_own_writes_keep_mirror(tmp_path):
+    async def run():
+        store = SessionStore(tmp_path / "plug.db", readers=1)
+        await store.open()
+        try:
+            await store.add_message("c1", Message(role="user", content="one"), token_count=1)
+            first = await store.get_messages("c1")
+            await store.add_message("c1", Message(role="user", content="two"), token_count=1)
+            # Writes through the store don't bump data_version: still mirrored
+            assert "c1" in store._active
+            assert [m.content for m in await store.get_messages("c1")] == [m.content for m in first] + ["two"]
+        finally:
+            await store.close()
+
+    asyncio.run(run())